@@ -0,0 +1,236 @@
+"""
+A persistent, size-bounded cache of data object contents on the local filesystem.
+
+Data is cached in fixed-size blocks, keyed by zone, logical path and the identifying attributes
+of the replica read (its modify time, checksum, size, version and status), so that a data object
+which has been modified in the catalog is never served from stale blocks.  The catalog records
+modify times only to the second, so a replica without a checksum is not cached until
+RECENT_MODIFICATION_SECONDS after it was last modified.  Blocks are written atomically
+(by renaming a completed temporary file into place), so a cache directory may be shared by
+several processes at once; the least recently used blocks are evicted when the cache grows
+beyond its size limit.
+
+A cache is put into use by opening a data object with it:
+
+    >>> from irods.block_cache import BlockCache
+    >>> cache = BlockCache('/nvme/irods_cache', max_bytes=100 * 1024**3)
+    >>> with session.data_objects.open(path, 'r', block_cache=cache) as f:
+    ...     data = f.read()
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 4 * (1024**2)
+DEFAULT_MAXIMUM_BYTES = 10 * (1024**3)
+
+_TEMP_PREFIX = ".tmp-"
+
+# Replicas without a checksum are not cached while modified this recently (in seconds, by the local clock): a
+# rewrite within the same second as the modify time would leave every attribute in the key unchanged.
+RECENT_MODIFICATION_SECONDS = 2
+
+
+class BlockCache:
+    """A directory of cached data object blocks, evicted in least-recently-used order.
+
+    The modification time of each block file records its last use.  The size of the cache is tracked
+    by a running estimate (of the blocks found when it was last measured, plus those this process has
+    since added), and the directory is walked only when that estimate exceeds the limit.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAXIMUM_BYTES, block_size=DEFAULT_BLOCK_SIZE):
+        """Use (creating if necessary) the given directory for up to max_bytes of cached blocks."""
+        if max_bytes <= 0 or block_size <= 0:
+            raise ValueError("max_bytes and block_size must be positive.")
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.block_size = block_size
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Measured, and the cache brought within its limit, upon the first put().
+        self._estimated_bytes = None
+
+    @staticmethod
+    def key(zone, path, modify_time, checksum, size, version="", replica_status=""):
+        """Compute the cache key identifying the content of a replica."""
+        if hasattr(modify_time, "timestamp"):
+            modify_time = int(modify_time.timestamp())
+        identity = "\0".join(
+            str(_) for _ in (zone, path, modify_time, checksum or "", size, version or "", replica_status or "")
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _block_path(self, key, index):
+        # The block size is part of the file name so that caches used with different block sizes do not collide.
+        return os.path.join(self.directory, key[:2], key, "{}-{}".format(self.block_size, index))
+
+    def get(self, key, index):
+        """Return the cached block, or None if it is not cached."""
+        path = self._block_path(key, index)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # Never cached, or evicted (possibly by another process) in the meantime.
+            return None
+        return data
+
+    def put(self, key, index, data):
+        """Store a block in the cache."""
+        path = self._block_path(key, index)
+        parent = os.path.dirname(path)
+        try:
+            os.makedirs(parent, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            # A cache which cannot be written is no reason to fail the read.
+            logger.warning("Could not write block to cache at %r: %r", path, e)
+            return
+        with self._lock:
+            if self._estimated_bytes is not None:
+                self._estimated_bytes += len(data)
+            evict_now = self._estimated_bytes is None or self._estimated_bytes > self.max_bytes
+        if evict_now:
+            self.evict()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st
+
+    @property
+    def bytes_used(self):
+        return sum(st.st_size for _, st in self._entries())
+
+    def evict(self, max_bytes=None):
+        """Remove the least recently used blocks until the cache holds no more than max_bytes
+        (by default, the limit given at construction)."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = list(self._entries())
+        total = sum(st.st_size for _, st in entries)
+        if total > limit:
+            for path, st in sorted(entries, key=lambda entry: entry[1].st_mtime):
+                if total <= limit:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass  # - removed by another process
+                total -= st.st_size
+        with self._lock:
+            self._estimated_bytes = total
+
+    def clear(self):
+        self.evict(max_bytes=0)
+
+
+class iRODSDataObjectCachedRaw(io.RawIOBase):
+    """A read-only raw stream that wraps an iRODSDataObjectFileRaw, serving reads through a BlockCache.
+
+    The size of the replica is known from the catalog, so seeks never need a server round trip,
+    and only blocks missing from the cache are read from the server.
+    """
+
+    def __init__(self, raw, cache, key, size):
+        """Wrap raw, whose content is identified in the cache by key, and which holds size bytes."""
+        super(iRODSDataObjectCachedRaw, self).__init__()
+        self.raw = raw
+        self.cache = cache
+        self.cache_key = key
+        self.size = size
+        self._pos = 0
+        self._raw_pos = 0
+        self._block = (None, b"")
+
+    def __getattr__(self, name):
+        # Expose the wrapped object's attributes, e.g. `options', `session' and `replica_access_info'.
+        if name == "raw":
+            raise AttributeError(name)
+        return getattr(self.raw, name)
+
+    def _fetch_block(self, index):
+        offset = index * self.cache.block_size
+        length = min(self.cache.block_size, self.size - offset)
+        if self._raw_pos != offset:
+            self.raw.seek(offset, io.SEEK_SET)
+        data = bytearray(length)
+        view = memoryview(data)
+        total = 0
+        while total < length:
+            count = self.raw.readinto(view[total:])
+            if not count:
+                break
+            total += count
+        self._raw_pos = offset + total
+        data = bytes(data[:total])
+        # Only complete blocks are cached: a short read means the catalog and replica disagree.
+        if total == length:
+            self.cache.put(self.cache_key, index, data)
+        return data
+
+    def _block_at(self, index):
+        if self._block[0] != index:
+            data = self.cache.get(self.cache_key, index)
+            if data is None:
+                data = self._fetch_block(index)
+            self._block = (index, data)
+        return self._block[1]
+
+    def readinto(self, b):
+        if self._pos >= self.size:
+            return 0
+        index, start = divmod(self._pos, self.cache.block_size)
+        data = self._block_at(index)
+        count = min(len(b), len(data) - start)
+        if count <= 0:
+            return 0
+        b[:count] = data[start : start + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self.size}[whence]
+        self._pos = base + offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            try:
+                self.raw.close()
+            finally:
+                super(iRODSDataObjectCachedRaw, self).close()
+
+    def write(self, _):
+        raise io.UnsupportedOperation("Data objects opened with a block cache are read-only.")
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def seekable(self):
+        return True
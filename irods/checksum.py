@@ -0,0 +1,271 @@
+"""
+On-the-fly computation of iRODS-format checksums for data transfers.
+
+The bytes of a PUT or GET are hashed as they pass through the client, so that a
+transfer can be verified against (or registered in) the catalog without a second
+pass over the data.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import threading
+
+import irods.exception as ex
+import irods.keywords as kw
+
+logger = logging.getLogger(__name__)
+
+# Maps each algorithm name used by the client onto a (hashlib name, iRODS checksum prefix) pair.
+_ALGORITHMS = {
+    "sha2": ("sha256", "sha2:"),
+    "sha1": ("sha1", "sha1:"),
+    "sha512": ("sha512", "sha512:"),
+    "md5": ("md5", ""),
+}
+
+_ALIASES = {"sha256": "sha2"}
+
+DEFAULT_ALGORITHM = "sha2"
+
+# Used when a transfer is to be verified against whatever kind of checksum the catalog holds.
+VERIFICATION_ALGORITHMS = ("sha2", "md5")
+
+# Upper bound on the number of bytes held back while waiting for earlier parts of a
+# parallel transfer to be hashed.  A thread with a part that would exceed it waits for
+# the hashing position to advance.
+MAXIMUM_PENDING_BYTES = 64 * (1024**2)
+
+# How long, in seconds, such a thread waits without the hashing position advancing (as when
+# the thread transferring the next part has failed, or has yet to be started by a busy pool)
+# before it gives up; the part is then re-read from the local file when the checksum is finalized.
+STALL_TIMEOUT = 5.0
+
+_READ_SIZE = 4 * (1024**2)
+
+
+class UnknownChecksumAlgorithm(ValueError):
+    pass
+
+
+def _canonical_name(algorithm):
+    name = _ALIASES.get(algorithm.lower(), algorithm.lower())
+    if name not in _ALGORITHMS:
+        raise UnknownChecksumAlgorithm("{!r} is not a recognized checksum algorithm".format(algorithm))
+    return name
+
+
+def algorithm_of(checksum_string):
+    """Return the algorithm name implied by a checksum string from the catalog, or None if empty."""
+    if not checksum_string:
+        return None
+    prefix, sep, _ = checksum_string.partition(":")
+    if not sep:
+        return "md5"
+    return _ALIASES.get(prefix.lower(), prefix.lower())
+
+
+def irods_checksum_string(algorithm, digest):
+    """Format a raw digest in the manner of the iRODS catalog, e.g. 'sha2:<base64>' or a bare md5 hex string."""
+    prefix = _ALGORITHMS[algorithm][1]
+    if not prefix:
+        return digest.hex()
+    return prefix + base64.b64encode(digest).decode("ascii")
+
+
+def resolve_algorithms(checksum, for_verification=False):
+    """Normalize the 'checksum' parameter of the transfer methods into a tuple of algorithm names.
+
+    True selects the default algorithm for uploads, and both sha2 and md5 for downloads (so that the result
+    can be compared with the catalog whichever scheme the server is configured for).  A string names one
+    algorithm explicitly.  False or None disables checksumming, yielding an empty tuple.
+    """
+    if not checksum:
+        return ()
+    if checksum is True:
+        return VERIFICATION_ALGORITHMS if for_verification else (DEFAULT_ALGORITHM,)
+    return (_canonical_name(checksum),)
+
+
+class ChecksumCalculator:
+    """Accumulate iRODS-format checksums over data that may arrive out of order.
+
+    Cryptographic hashes cannot be combined from independently hashed byte ranges, so parts of a
+    parallel transfer that arrive ahead of the hashing position are held in memory (up to
+    max_pending bytes) until the preceding bytes have been hashed.  When that much is held, the
+    thread adding a further part waits until the position advances, so that the transfer is paced
+    by the hashing rather than having parts dropped.  Only if the position stalls (for stall_timeout
+    seconds) is a part dropped, to be read back from local_file, if one is given, when the checksum
+    is finalized.  (local_file may be a filename, a seekable file-like object, or a buffer such as
+    a bytearray.)  For a serial transfer no data is ever held back or re-read.
+    """
+
+    def __init__(
+        self,
+        algorithms=(DEFAULT_ALGORITHM,),
+        local_file=None,
+        max_pending=MAXIMUM_PENDING_BYTES,
+        stall_timeout=STALL_TIMEOUT,
+    ):
+        """Initialize hashers for the named algorithms."""
+        if isinstance(algorithms, str):
+            algorithms = (algorithms,)
+        self.algorithms = tuple(_canonical_name(a) for a in algorithms)
+        self._hashers = {a: hashlib.new(_ALGORITHMS[a][0]) for a in self.algorithms}
+        self.local_file = local_file
+        self.max_pending = max_pending
+        self.stall_timeout = stall_timeout
+        self._lock = threading.Condition()
+        self.dropped_bytes = 0
+        self._stalled_at = None
+        self._position = 0
+        self._pending = {}
+        self._pending_bytes = 0
+        self._results = None
+
+    @property
+    def position(self):
+        return self._position
+
+    def _feed(self, data):
+        for hasher in self._hashers.values():
+            hasher.update(data)
+        self._position += len(data)
+
+    def _drain(self):
+        while self._position in self._pending:
+            data = self._pending.pop(self._position)
+            self._pending_bytes -= len(data)
+            self._feed(data)
+        self._lock.notify_all()
+
+    def _wait_for_room(self, offset, size):
+        """Wait, with the lock held, until a part at offset can be hashed or held, or the position stalls."""
+
+        def ready():
+            return (
+                self._results is not None or offset <= self._position or self._pending_bytes + size <= self.max_pending
+            )
+
+        # Once the position has stalled, parts are not waited for again until it advances.
+        while not ready() and self._stalled_at != self._position:
+            position = self._position
+            self._lock.wait(self.stall_timeout)
+            if not ready() and self._position == position:
+                self._stalled_at = position
+
+    def update(self, data, offset=None):
+        """Add data located at the given offset (by default, directly following the last data added)."""
+        if not data:
+            return
+        with self._lock:
+            if offset is not None and offset > self._position:
+                self._wait_for_room(offset, len(data))
+            if self._results is not None:
+                return
+            if offset is None or offset == self._position:
+                self._feed(data)
+                self._drain()
+            elif offset > self._position:
+                if self._pending_bytes + len(data) <= self.max_pending:
+                    self._pending[offset] = bytes(data)
+                    self._pending_bytes += len(data)
+                else:
+                    self.dropped_bytes += len(data)
+                    logger.debug("Hashing stalled; %d bytes at offset %d will be read back.", len(data), offset)
+
+    def _read_local(self, offset, length):
+        if self.local_file is None:
+            raise RuntimeError("Cannot complete checksum: data at offset {} was not retained.".format(offset))
+        if isinstance(self.local_file, (str, os.PathLike)):
+            with open(self.local_file, "rb") as f:
+                yield from self._read_file(f, offset, length)
+        elif hasattr(self.local_file, "seek"):
+            yield from self._read_file(self.local_file, offset, length)
+        else:
+            view = memoryview(self.local_file).cast("B")
+            yield view[offset : offset + length]
+
+    @staticmethod
+    def _read_file(f, offset, length):
+        f.seek(offset)
+        while length > 0:
+            data = f.read(min(length, _READ_SIZE))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+    def finish(self, total_size=None):
+        """Finalize, returning a dict mapping each algorithm name to an iRODS-format checksum string.
+
+        If total_size is given, any bytes short of that size that were not retained are read back from
+        the local file before the digests are taken.
+        """
+        with self._lock:
+            if self._results is None:
+                while total_size is not None and self._position < total_size:
+                    start = self._position
+                    gap_end = min([o for o in self._pending if o > start] + [total_size])
+                    for data in self._read_local(start, gap_end - start):
+                        self._feed(data)
+                    self._drain()
+                    if self._position == start:
+                        break
+                self._pending.clear()
+                self._pending_bytes = 0
+                self._results = {a: irods_checksum_string(a, h.digest()) for a, h in self._hashers.items()}
+                # Release any threads still waiting to add parts.
+                self._lock.notify_all()
+            return dict(self._results)
+
+    def close_options(self, keywords, total_size=None):
+        """Return keywords for the finalizing close of an uploaded replica, so that the server can register
+        (or, if VERIFY_CHKSUM_KW is among the given keywords, verify) the checksum computed in flight.
+        """
+        value = self.finish(total_size)[self.algorithms[0]]
+        key = kw.VERIFY_CHKSUM_KW if kw.VERIFY_CHKSUM_KW in keywords else kw.REG_CHKSUM_KW
+        return {key: value, kw.CHKSUM_KW: value}
+
+
+def transferred_replicas(replicas, resc_hier=None, options=None, written=False):
+    """Select, from the replicas of a data object, those that a transfer may have read or written.
+
+    The replica is identified by its resource hierarchy if that is known (as from the descriptor of the
+    transfer), and otherwise by the replica number or resource named in the transfer's options.  Failing
+    those, the replica written by a put is taken to be the most recently modified, and a get is taken to
+    have read one of the good replicas.
+    """
+    replicas = list(replicas)
+    options = options or {}
+    if resc_hier:
+        return [r for r in replicas if r.resc_hier == resc_hier]
+    if kw.REPL_NUM_KW in options:
+        return [r for r in replicas if str(r.number) == str(options[kw.REPL_NUM_KW])]
+    resource = options.get(kw.RESC_NAME_KW) or options.get(kw.DEST_RESC_NAME_KW)
+    if resource:
+        return [r for r in replicas if resource in (r.resource_name, r.resc_hier.split(";")[0])]
+    if written:
+        return sorted(replicas, key=lambda r: (r.modify_time, int(r.status) == 1, r.number))[-1:]
+    return [r for r in replicas if str(r.status) == "1"] or replicas
+
+
+def verify_against_replicas(computed, replicas, path=""):
+    """Compare computed checksums (as returned from ChecksumCalculator.finish) with the catalog.
+
+    replicas should be those that were transferred (see transferred_replicas).  Raises USER_CHKSUM_MISMATCH
+    if any of them carries a checksum, of a computed algorithm, that does not match.  Returns False, without
+    raising, if none carries a checksum that could be compared.
+    """
+    comparable = [r.checksum for r in replicas if algorithm_of(getattr(r, "checksum", None)) in computed]
+    if not comparable:
+        logger.info("No catalog checksum available to verify the transfer of %r", path)
+        return False
+    if all(computed[algorithm_of(c)] == c for c in comparable):
+        return True
+    raise ex.USER_CHKSUM_MISMATCH(
+        "Checksum computed during transfer of {!r} ({}) does not match the catalog ({}).".format(
+            path, ", ".join(sorted(computed.values())), ", ".join(comparable)
+        )
+    )
@@ -105,6 +105,7 @@ class DataObjects(iRODSConfiguration):
         "allow_redirect",
         "force_create_by_default",
         "force_put_by_default",
+        "parallel_transfers_use_mmap",
     )
 
     def __init__(self):
@@ -124,6 +125,10 @@ class DataObjects(iRODSConfiguration):
         self.force_create_by_default = True
         self.force_put_by_default = True
 
+        # Memory-map the local file during parallel puts and gets, so that data
+        # moves between the map and the network without intermediate buffers.
+        self.parallel_transfers_use_mmap = False
+
 
 # #############################################################################
 #
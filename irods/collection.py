@@ -1,6 +1,7 @@
 import itertools
 import operator
 
+from irods.column import Like
 from irods.models import Collection, DataObject
 from irods.data_object import iRODSDataObject, irods_basename
 from irods.meta import iRODSMetaCollection
@@ -36,6 +37,8 @@ class iRODSCollection:
             self.owner_name = result[Collection.owner_name]
             self.owner_zone = result[Collection.owner_zone]
         self._meta = None
+        # Relations loaded by prefetch().
+        self._subcollections = self._data_objects = self._acls = None
 
     @property
     def inheritance(self):
@@ -43,22 +46,42 @@ class iRODSCollection:
 
     @property
     def metadata(self):
-        if not self._meta:
+        # An empty set of AVUs is fetched anew on each access, unless it was prefetched.
+        if not self._meta and not getattr(self._meta, "_prefetched", False):
             self._meta = iRODSMetaCollection(self.manager.sess.metadata, Collection, self.path)
         return self._meta
 
     @property
     def subcollections(self):
+        if self._subcollections is not None:
+            return list(self._subcollections)
         query = self.manager.sess.query(Collection).filter(Collection.parent_name == self.path)
         return [iRODSCollection(self.manager, row) for row in query if row[Collection.name] != "/"]
 
     @property
     def data_objects(self):
+        if self._data_objects is not None:
+            return list(self._data_objects)
         query = self.manager.sess.query(DataObject).filter(Collection.name == self.path)
         results = query.get_results()
         grouped = itertools.groupby(results, operator.itemgetter(DataObject.id))
         return [iRODSDataObject(self.manager.sess.data_objects, self, list(replicas)) for _, replicas in grouped]
 
+    def prefetch(self, *relations):
+        """Load the given relations of the collection at once, so that later access to them is answered without
+        a query.  The relations may be any of "data_objects", "subcollections", "metadata" and "acls" (the last
+        as returned by session.acls.get).  The metadata and ACLs are loaded for the subcollections and data
+        objects too, if those are loaded.
+
+        What is loaded is a snapshot, kept until prefetch is called again, except that changes to the metadata made
+        through the object's `metadata' attribute reload it, and any change to ACLs made through the session's
+        `acls' manager has the ACLs queried anew.  Returns the collection.
+        """
+        from irods.manager._internal import _prefetch
+
+        _prefetch.prefetch_collections(self.manager.sess, [self], relations)
+        return self
+
     def remove(self, recurse=True, force=False, **options):
         self.manager.remove(self.path, recurse, force, **options)
 
@@ -68,22 +91,99 @@ class iRODSCollection:
     def move(self, path):
         self.manager.move(self.path, path)
 
-    def walk(self, topdown=True):
+    def walk(self, topdown=True, streaming=False):
         """
         Collection tree generator.
 
         For each subcollection in the directory tree, starting at the
-        collection, yield a 3-tuple
+        collection, yield a 3-tuple (collection, subcollections, data_objects).
+
+        The whole tree is listed with three queries (each paged as needed): one for all collections
+        below this one, and two for the data objects in this collection and in all of those below it.
+        As with os.walk, when topdown is True the subcollections list may be modified in place to
+        prune the walk.
+
+        With streaming=True, only the collections are held in memory: the data objects are fetched in
+        order of their collection, and the 3-tuple for each collection is yielded as soon as its data
+        objects have arrived.  The tuples then follow no particular order, topdown being ignored, and
+        collections without data objects come last.
         """
+        children = self._subcollections_by_parent()
+        if streaming:
+            yield from self._walk_streaming(children)
+            return
+
+        rows_by_collection = {}
+        for row in self._data_object_rows():
+            replicas = rows_by_collection.setdefault(row[Collection.name], {})
+            replicas.setdefault(row[DataObject.id], []).append(row)
+
+        def entry(coll):
+            replicas = rows_by_collection.pop(coll.path, {})
+            return (coll, children.get(coll.path, []), self._data_objects_in(coll, replicas.values()))
 
+        # The tree is walked with an explicit stack, so that its depth is not limited by that of recursion.
         if topdown:
-            yield (self, self.subcollections, self.data_objects)
-        for subcollection in self.subcollections:
-            new_root = subcollection
-            for x in new_root.walk(topdown):
-                yield x
-        if not topdown:
-            yield (self, self.subcollections, self.data_objects)
+            stack = [self]
+            while stack:
+                coll, subcollections, data_objects = entry(stack.pop())
+                yield (coll, subcollections, data_objects)
+                stack.extend(reversed(subcollections))
+        else:
+            stack = [(self, False)]
+            while stack:
+                coll, visited = stack.pop()
+                if visited:
+                    yield entry(coll)
+                else:
+                    stack.append((coll, True))
+                    stack.extend((subcollection, False) for subcollection in reversed(children.get(coll.path, [])))
+
+    def _subcollections_by_parent(self):
+        """Map the path of each collection in the tree below this one onto a list of its subcollections."""
+        prefix = self.path.rstrip("/") + "/"
+        children = {}
+        for row in self.manager.sess.query(Collection).filter(Like(Collection.name, prefix + "%")):
+            name = row[Collection.name]
+            # LIKE matches '_' and '%' in the names themselves as wildcards, so filter precisely here.
+            if name != self.path and name.startswith(prefix):
+                children.setdefault(row[Collection.parent_name], []).append(iRODSCollection(self.manager, row))
+        return children
+
+    def _data_object_rows(self, ordered=False):
+        """Yield the replicas of all data objects in this collection, then in the collections below it (in order of
+        collection name, if ordered is True)."""
+        prefix = self.path.rstrip("/") + "/"
+        query = self.manager.sess.query(DataObject, Collection.name)
+        yield from query.filter(Collection.name == self.path)
+        below = query.filter(Like(Collection.name, prefix + "%"))
+        for row in below.order_by(Collection.name) if ordered else below:
+            name = row[Collection.name]
+            # As in _subcollections_by_parent; the root collection also matches its own prefix.
+            if name != self.path and name.startswith(prefix):
+                yield row
+
+    def _data_objects_in(self, coll, replica_lists):
+        return [iRODSDataObject(self.manager.sess.data_objects, coll, replicas) for replicas in replica_lists]
+
+    def _walk_streaming(self, children):
+        collections = {self.path: self}
+        for subcollections in children.values():
+            collections.update((subcollection.path, subcollection) for subcollection in subcollections)
+
+        rows = self._data_object_rows(ordered=True)
+        for name, group in itertools.groupby(rows, operator.itemgetter(Collection.name)):
+            coll = collections.pop(name, None)
+            # Skip collections created since the tree was listed.
+            if coll is None:
+                continue
+            replicas = {}
+            for row in group:
+                replicas.setdefault(row[DataObject.id], []).append(row)
+            yield (coll, children.get(name, []), self._data_objects_in(coll, replicas.values()))
+
+        for coll in collections.values():
+            yield (coll, children.get(coll.path, []), [])
 
     @staticmethod
     def normalize_path(*paths, **kw_):
@@ -0,0 +1,156 @@
+"""
+Export of general query results into typed, columnar arrays, for analysis with NumPy, pandas or Arrow.
+
+The results are paged through with Query.get_batches(), and the values of each column in each batch are
+decoded from the strings received straight into an array: int64 for Integer columns, timestamps (in
+seconds, UTC) for DateTime columns, and strings otherwise.  The arrays for the batches are then
+concatenated, without building a Python object for each row.
+
+    >>> from irods.models import DataObject, Resource
+    >>> table = session.query(Resource.name, DataObject.size, DataObject.modify_time).to_arrow()
+    >>> df = session.query(Resource.name, DataObject.size).to_pandas()
+    >>> df.groupby("RESC_NAME")["DATA_SIZE"].sum()
+
+NumPy is needed for to_numpy, NumPy and pandas for to_pandas, and pyarrow for to_arrow.  Values missing from
+an Integer column (as in the case of an outer join) are masked, null, or <NA> respectively; those missing from
+a DateTime column are NaT or null.
+"""
+
+from irods.column import DateTime, Integer
+
+# A string column is dictionary-encoded (as an Arrow dictionary array, or a pandas Categorical) if, when
+# dictionary_encode is left as None, it has at most this many distinct values per row.
+DICTIONARY_ENCODING_MAX_FRACTION = 0.1
+
+
+def _column_name(key):
+    return getattr(key, "icat_key", str(key))
+
+
+def _is_a(column_type, *types):
+    return isinstance(column_type, type) and issubclass(column_type, types)
+
+
+def _column_type(key):
+    return getattr(key, "column_type", None)
+
+
+def _collect(batches, decode):
+    """Decode the columns of each batch, returning the keys of the columns and, for each, a list of chunks."""
+    keys = None
+    chunks = None
+    for batch in batches:
+        if keys is None:
+            keys = batch.columns
+            chunks = [[] for _ in keys]
+        for index, key in enumerate(keys):
+            chunks[index].append(decode(_column_type(key), batch.column(index, raw=True)))
+    return (keys or [], chunks or [])
+
+
+def _should_encode(dictionary_encode, distinct, length):
+    if dictionary_encode is None:
+        return length > 0 and distinct <= length * DICTIONARY_ENCODING_MAX_FRACTION
+    return bool(dictionary_encode)
+
+
+def _numpy_chunk(column_type, values):
+    import numpy
+
+    if _is_a(column_type, Integer, DateTime):
+        # A missing value arrives as None (an empty element in the response) or, conceivably, as "".
+        missing = numpy.array([v is None or v == "" for v in values], dtype=bool)
+        if missing.any():
+            values = ["0" if m else v for v, m in zip(values, missing)]
+        strings = numpy.array(values, dtype=str) if len(values) else numpy.empty(0, dtype=str)
+        integers = strings.astype(numpy.int64)
+        if _is_a(column_type, DateTime):
+            timestamps = integers.astype("datetime64[s]")
+            timestamps[missing] = numpy.datetime64("NaT")
+            return timestamps
+        return numpy.ma.masked_array(integers, missing) if missing.any() else integers
+    return numpy.array(values, dtype=object)
+
+
+def to_numpy(batches):
+    """Return a dict mapping the query's columns onto NumPy arrays of their values in all rows.
+
+    Integer columns become int64 arrays (masked arrays if any values are missing), DateTime columns become
+    datetime64[s] arrays, and other columns become arrays of str objects.
+    """
+    import numpy
+
+    (keys, chunks) = _collect(batches, _numpy_chunk)
+    arrays = {}
+    for key, parts in zip(keys, chunks):
+        if any(isinstance(part, numpy.ma.MaskedArray) for part in parts):
+            arrays[key] = numpy.ma.concatenate(parts)
+        else:
+            arrays[key] = numpy.concatenate(parts)
+    return arrays
+
+
+def to_pandas(batches, dictionary_encode=None):
+    """Return a pandas DataFrame with a column, named by its iCAT key (e.g. "DATA_SIZE"), for each query column.
+
+    Integer columns have the dtype int64 (or the nullable Int64 if any values are missing), DateTime columns
+    datetime64 in UTC, and string columns object or, if dictionary-encoded, category.  dictionary_encode may
+    be True or False to force or prevent the encoding of all string columns; if None, those with few distinct
+    values (see DICTIONARY_ENCODING_MAX_FRACTION) are encoded.
+    """
+    import numpy
+    import pandas
+
+    columns = {}
+    for key, array in to_numpy(batches).items():
+        column_type = _column_type(key)
+        if isinstance(array, numpy.ma.MaskedArray):
+            series = pandas.Series(pandas.arrays.IntegerArray(array.data, numpy.ma.getmaskarray(array)))
+        elif _is_a(column_type, DateTime):
+            series = pandas.Series(array).dt.tz_localize("UTC")
+        else:
+            series = pandas.Series(array)
+            if array.dtype == object and _should_encode(dictionary_encode, series.nunique(), len(series)):
+                series = series.astype("category")
+        columns[_column_name(key)] = series
+    return pandas.DataFrame(columns)
+
+
+def _arrow_chunk(column_type, values):
+    import pyarrow
+    import pyarrow.compute
+
+    strings = pyarrow.array(values, pyarrow.string())
+    if not _is_a(column_type, Integer, DateTime):
+        return strings
+    strings = pyarrow.compute.if_else(
+        pyarrow.compute.equal(strings, ""), pyarrow.scalar(None, pyarrow.string()), strings
+    )
+    integers = strings.cast(pyarrow.int64())
+    if _is_a(column_type, DateTime):
+        return integers.cast(pyarrow.timestamp("s", tz="UTC"))
+    return integers
+
+
+def to_arrow(batches, dictionary_encode=None):
+    """Return a pyarrow Table with a column, named by its iCAT key (e.g. "DATA_SIZE"), for each query column.
+
+    Integer columns have the type int64, DateTime columns timestamp[s, tz=UTC], and string columns string or,
+    if dictionary-encoded, dictionary<int32, string>.  dictionary_encode is as for to_pandas.  Each column is
+    a ChunkedArray with one chunk per batch of results.
+    """
+    import pyarrow
+    import pyarrow.compute
+
+    (keys, chunks) = _collect(batches, _arrow_chunk)
+    names = []
+    arrays = []
+    for key, parts in zip(keys, chunks):
+        array = pyarrow.chunked_array(parts, type=parts[0].type if parts else pyarrow.string())
+        if pyarrow.types.is_string(array.type):
+            distinct = pyarrow.compute.count_distinct(array).as_py()
+            if _should_encode(dictionary_encode, distinct, len(array)):
+                array = array.dictionary_encode()
+        names.append(_column_name(key))
+        arrays.append(array)
+    return pyarrow.Table.from_arrays(arrays, names=names)
@@ -5,6 +5,7 @@ import hashlib
 import os
 import ssl
 import datetime
+import time
 import errno
 import irods.password_obfuscation as obf
 from irods import LONG_NAME_LEN, MAX_NAME_LEN
@@ -72,6 +73,9 @@ class PlainTextPAMPasswordError(Exception):
 class Connection:
     DISALLOWING_PAM_PLAINTEXT = True
 
+    # If set (e.g. to an irods.transfer_report.StreamStats), informed of the time taken by each send and recv.
+    transfer_stats = None
+
     def __init__(self, pool, account):
 
         self.pool = pool
@@ -145,11 +149,21 @@ class Connection:
         logger.debug(DESTRUCTOR_MSG)
 
     def send(self, message):
-        string = message.pack()
+        if isinstance(message.bs, memoryview):
+            string, bs = message.pack_parts()
+        else:
+            string, bs = message.pack(), b""
 
         logger.debug(string)
+        stats = self.transfer_stats
+        if stats is not None:
+            t0 = time.perf_counter()
         try:
             self.socket.sendall(string)
+            if bs:
+                self.socket.sendall(bs)
+            if stats is not None:
+                stats.add_send(time.perf_counter() - t0)
         except:
             logger.error(
                 "Unable to send message. "
@@ -161,11 +175,16 @@ class Connection:
 
     def recv(self, into_buffer=None, return_message=(), acceptable_errors=()):
         acceptable_codes = set(nominal_code(e) for e in acceptable_errors)
+        stats = self.transfer_stats
+        if stats is not None:
+            t0 = time.perf_counter()
         try:
             if into_buffer is None:
                 msg = iRODSMessage.recv(self.socket)
             else:
                 msg = iRODSMessage.recv_into(self.socket, into_buffer)
+            if stats is not None:
+                stats.add_reply(time.perf_counter() - t0)
         except (socket.error, socket.timeout) as e:
             # If _recv_message_in_len() fails in recv() or recv_into(),
             # it will throw a socket.error exception. The exception is
@@ -7,11 +7,13 @@ were local files.
 """
 
 import ast
+import collections
 import enum
 import io
 import logging
 import os
 import sys
+import threading
 from datetime import datetime, timezone
 
 import irods.keywords as kw
@@ -141,6 +143,7 @@ class iRODSDataObject:
             self.replicas = [iRODSReplica(*a, **k) for a, k in replica_args]
 
         self._meta = None
+        self._acls = None  # as loaded by prefetch(), with the ACL change count of the session then
 
     # ruff: noqa: D107 off
 
@@ -149,10 +152,20 @@ class iRODSDataObject:
 
     @property
     def metadata(self):
-        if not self._meta:
+        # An empty set of AVUs is fetched anew on each access, unless it was prefetched.
+        if not self._meta and not getattr(self._meta, "_prefetched", False):
             self._meta = iRODSMetaCollection(self.manager.sess.metadata, DataObject, self.path)
         return self._meta
 
+    def prefetch(self, *relations):
+        """Load the given relations of the data object, "metadata" and/or "acls", so that later access to them is
+        answered without a query.  See iRODSCollection.prefetch.  Returns the data object.
+        """
+        from irods.manager._internal import _prefetch
+
+        _prefetch.prefetch_data_objects(self.manager.sess, [self], relations)
+        return self
+
     def open(self, mode="r", finalize_on_close=True, **options):
         return self.manager.open(self.path, mode, finalize_on_close=finalize_on_close, **options)
 
@@ -192,6 +205,9 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
 
     session = None  # codacy
 
+    # Called once the replica is closed, e.g. to drop query results made stale by writes through this object.
+    on_close = None
+
     def __init__(self, conn, descriptor, finalize_on_close=True, **options):
         """
         Constructor needs a connection and an iRODS data object descriptor. If the
@@ -257,8 +273,13 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
         return True
 
     def close(self):
-        if self.finalize_on_close or not self._close_replica():
-            self.conn.close_file(self.desc, **self.options)
+        try:
+            if self.finalize_on_close or not self._close_replica():
+                self.conn.close_file(self.desc, **self.options)
+        finally:
+            # Size, checksum and replica status are updated in the catalog only now.
+            if self.on_close is not None:
+                self.on_close()
         self.conn.release()
         super(iRODSDataObjectFileRaw, self).close()
         return None
@@ -275,7 +296,8 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
 
     def write(self, b):
         if isinstance(b, memoryview):
-            return self.conn.write_file(self.desc, b.tobytes())
+            # Contiguous byte views (e.g. slices of a memory-mapped file) are sent without copying.
+            return self.conn.write_file(self.desc, b if (b.contiguous and b.format == "B") else b.tobytes())
 
         return self.conn.write_file(self.desc, b)
 
@@ -287,3 +309,321 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
 
     def seekable(self):
         return True
+
+
+# Defaults for read-ahead streams, i.e. those opened with DataObjectManager.open(..., read_ahead = N).
+READ_AHEAD_BLOCK_SIZE = 4 * (1024**2)
+READ_AHEAD_DEFAULT_BLOCKS = 4
+
+# Defaults for write-behind streams, i.e. those opened with DataObjectManager.open(..., write_behind = N).
+WRITE_BEHIND_BLOCK_SIZE = 4 * (1024**2)
+WRITE_BEHIND_DEFAULT_BLOCKS = 4
+
+# Number of non-sequential seeks (each following a read) after which a read-ahead stream stops
+# prefetching, until sequential access (of at least one block) is seen again.
+READ_AHEAD_RANDOM_SEEK_LIMIT = 2
+
+
+class iRODSDataObjectReadAheadRaw(io.RawIOBase):
+    """A raw stream that wraps an iRODSDataObjectFileRaw, reading ahead of the caller in a background thread.
+
+    Blocks of block_size bytes are read sequentially from the data object, keeping up to `blocks' of
+    them queued, so that a sequential reader seldom waits on a server round trip.  Seeks within the
+    queued blocks are served from memory.  Other seeks discard the queue, and if they happen repeatedly
+    (i.e. the access pattern is random) prefetching is suspended in favor of plain synchronous reads.
+
+    Only one thread at a time uses the wrapped object's connection: the prefetching thread is always
+    stopped before the wrapped object is accessed directly.
+    """
+
+    def __init__(self, raw, blocks=READ_AHEAD_DEFAULT_BLOCKS, block_size=READ_AHEAD_BLOCK_SIZE):
+        """Wrap raw, reading ahead by the given number of blocks of block_size bytes."""
+        super(iRODSDataObjectReadAheadRaw, self).__init__()
+        if blocks < 1 or block_size < 1:
+            raise ValueError("Read-ahead needs a positive number of blocks and a positive block size.")
+        self.raw = raw
+        self.blocks = blocks
+        self.block_size = block_size
+        self._cond = threading.Condition()
+        self._queue = collections.deque()  # - of (offset, bytes) pairs, in order of offset
+        self._pos = 0  # - the logical position of this stream
+        self._fetch_pos = 0  # - the position of the wrapped object, i.e. where the next block will be read
+        self._eof = False
+        self._error = None
+        self._stopping = False
+        self._thread = None
+        self._random_seeks = 0
+        self._sequential_bytes = 0
+
+    def __getattr__(self, name):
+        # Expose the wrapped object's attributes, e.g. `options', `session' and `replica_access_info'.
+        if name == "raw":
+            raise AttributeError(name)
+        return getattr(self.raw, name)
+
+    @property
+    def prefetching(self):
+        return self._random_seeks < READ_AHEAD_RANDOM_SEEK_LIMIT
+
+    def _prefetch(self):
+        while True:
+            with self._cond:
+                while len(self._queue) >= self.blocks and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                offset = self._fetch_pos
+            try:
+                data = self.raw.read(self.block_size)
+            except BaseException as e:
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                if data:
+                    self._queue.append((offset, data))
+                    self._fetch_pos = offset + len(data)
+                if len(data) < self.block_size:
+                    self._eof = True
+                self._cond.notify_all()
+                if self._eof:
+                    return
+
+    def _start(self):
+        if self._thread is None and not self._eof:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._prefetch, daemon=True)
+            self._thread.start()
+
+    def _stop(self):
+        if self._thread is not None:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+            self._thread.join()
+            self._thread = None
+
+    def _discard_queue(self):
+        self._stop()
+        self._queue.clear()
+        self._eof = False
+        if self._fetch_pos != self._pos:
+            self.raw.seek(self._pos, io.SEEK_SET)
+            self._fetch_pos = self._pos
+
+    def readinto(self, b):
+        if not self.prefetching:
+            count = self.raw.readinto(b)
+            self._pos = self._fetch_pos = self._pos + count
+            self._note_sequential(count)
+            return count
+        self._start()
+        with self._cond:
+            while True:
+                while self._queue and self._queue[0][0] + len(self._queue[0][1]) <= self._pos:
+                    self._queue.popleft()
+                    self._cond.notify_all()
+                if self._queue or self._eof or self._error or self._thread is None:
+                    break
+                self._cond.wait()
+            if not self._queue:
+                if self._error:
+                    error, self._error = self._error, None
+                    raise error
+                return 0
+            offset, data = self._queue[0]
+            start = self._pos - offset
+            count = min(len(b), len(data) - start)
+            b[:count] = data[start : start + count]
+            self._pos += count
+        self._note_sequential(count)
+        return count
+
+    def _note_sequential(self, count):
+        self._sequential_bytes += count
+        if self._sequential_bytes >= self.block_size:
+            self._random_seeks = 0
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            target = self._pos + offset
+        elif whence == io.SEEK_END:
+            self._stop()
+            target = self.raw.seek(offset, io.SEEK_END)
+            self._fetch_pos = target
+            self._queue.clear()
+            self._eof = False
+        else:
+            target = offset
+        if target == self._pos and whence != io.SEEK_END:
+            return target
+        with self._cond:
+            queued = any(o <= target < o + len(d) for o, d in self._queue)
+        self._pos = target
+        if not queued:
+            # Seeks made without reading in between (e.g. to find the size) do not signal random access.
+            if self._sequential_bytes:
+                self._random_seeks += 1
+            self._sequential_bytes = 0
+            self._discard_queue()
+        return target
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._stop()
+                self.raw.close()
+            finally:
+                super(iRODSDataObjectReadAheadRaw, self).close()
+
+    def write(self, b):
+        # Anything read ahead may be made stale by the write, so discard it.
+        self._discard_queue()
+        count = self.raw.write(b)
+        self._pos = self._fetch_pos = self._pos + count
+        return count
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return self.raw.writable()
+
+    def seekable(self):
+        return True
+
+
+class iRODSDataObjectWriteBehindRaw(io.RawIOBase):
+    """A raw stream that wraps an iRODSDataObjectFileRaw, sending writes to the server from a background thread.
+
+    Each write is queued and returns at once, unless `blocks' times block_size bytes are already
+    queued, in which case it waits for room.  (Small writes are expected to have been coalesced into
+    blocks by a buffered stream on top of this one; see DataObjectManager.open.)  The queue is drained
+    before any other operation on the wrapped object, including seeks, reads and close.
+
+    An error in sending queued data is raised at the next write, flush, seek, read or close, and at every one
+    after that: the data queued behind the failed write is lost, so nothing more may be written.  Closing the
+    stream after such an error closes the replica without finalizing it, so that it is not marked good.
+    """
+
+    def __init__(self, raw, blocks=WRITE_BEHIND_DEFAULT_BLOCKS, block_size=WRITE_BEHIND_BLOCK_SIZE):
+        """Wrap raw, queueing up to the given number of blocks of block_size bytes for writing."""
+        super(iRODSDataObjectWriteBehindRaw, self).__init__()
+        if blocks < 1 or block_size < 1:
+            raise ValueError("Write-behind needs a positive number of blocks and a positive block size.")
+        self.raw = raw
+        self.max_queued_bytes = blocks * block_size
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._queued_bytes = 0  # - includes the data in flight, i.e. being sent by the background thread
+        self._pos = 0  # - the logical position of this stream, i.e. after all queued writes
+        self._error = None
+        self._stopping = False
+        self._thread = None
+
+    def __getattr__(self, name):
+        # Expose the wrapped object's attributes, e.g. `options', `session' and `replica_access_info'.
+        if name == "raw":
+            raise AttributeError(name)
+        return getattr(self.raw, name)
+
+    def _send(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                data = self._queue[0]
+            try:
+                self.raw.write(data)
+            except BaseException as e:
+                with self._cond:
+                    self._error = e
+                    self._queue.clear()
+                    self._queued_bytes = 0
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._queue.popleft()
+                self._queued_bytes -= len(data)
+                self._cond.notify_all()
+
+    def _raise_pending_error(self):
+        # Call with self._cond held.  The error is kept, and the sending thread (which exits on error) is not
+        # restarted, since the server's position in the replica no longer matches that of this stream.
+        if self._error is not None:
+            raise self._error
+
+    def _drain(self):
+        with self._cond:
+            while self._queue and self._error is None:
+                self._cond.wait()
+            self._raise_pending_error()
+
+    def write(self, b):
+        data = bytes(b)
+        with self._cond:
+            self._raise_pending_error()
+            while self._queued_bytes and self._queued_bytes + len(data) > self.max_queued_bytes:
+                self._cond.wait()
+                self._raise_pending_error()
+            self._queue.append(data)
+            self._queued_bytes += len(data)
+            self._pos += len(data)
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._send, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return len(data)
+
+    def flush(self):
+        self._drain()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR and offset == 0:
+            return self._pos
+        self._drain()
+        self._pos = self.raw.seek(offset, whence)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, b):
+        self._drain()
+        count = self.raw.readinto(b)
+        self._pos += count
+        return count
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._drain()
+            finally:
+                thread = self._thread
+                if thread is not None:
+                    with self._cond:
+                        self._stopping = True
+                        self._cond.notify_all()
+                    thread.join()
+                    self._thread = None
+                if self._error is not None:
+                    # Leave the size and status of the partly written replica unchanged in the catalog.
+                    self.raw.finalize_on_close = False
+                self.raw.close()
+                super(iRODSDataObjectWriteBehindRaw, self).close()
+
+    def readable(self):
+        return self.raw.readable()
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return True
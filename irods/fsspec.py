@@ -0,0 +1,405 @@
+"""
+An fsspec (https://filesystem-spec.readthedocs.io) filesystem backed by an iRODSSession.
+
+With the optional "fsspec" dependency installed, URLs of the form irods://zone/home/user/file
+may be opened directly by pandas, dask, xarray and other fsspec-aware libraries:
+
+    >>> import pandas
+    >>> df = pandas.read_csv("irods://tempZone/home/alice/table.csv")
+
+Listings are made with one GenQuery per collection (or per tree, for find), and reads are
+served through fsspec's block caches from ranges fetched in parallel by
+session.data_objects.read_ranges.
+"""
+
+import collections
+import concurrent.futures
+import os
+import threading
+
+from fsspec.callbacks import DEFAULT_CALLBACK
+from fsspec.spec import AbstractBufferedFile, AbstractFileSystem
+
+import irods.keywords as kw
+from irods.column import Like
+from irods.manager.data_object_manager import DEFAULT_NUMBER_OF_THREADS
+from irods.models import Collection, DataObject
+
+DEFAULT_BLOCK_SIZE = 4 * (1024**2)
+DEFAULT_CACHE_TYPE = "blockcache"
+
+# A range larger than this is fetched in parts of this size, over several connections in parallel.
+PARALLEL_PART_SIZE = 4 * (1024**2)
+
+_GOOD_REPLICA = "1"
+
+_DATA_OBJECT_COLUMNS = (
+    Collection.name,
+    DataObject.name,
+    DataObject.size,
+    DataObject.create_time,
+    DataObject.modify_time,
+    DataObject.checksum,
+    DataObject.replica_status,
+)
+
+
+def _irods_dirname(path):
+    return path.rsplit("/", 1)[0] or "/"
+
+
+def _data_object_entries(rows):
+    """Build fsspec info dicts from data object query rows, describing one replica (preferably a
+    good one, and the most recently modified) of each data object."""
+    entries = {}
+    chosen = {}
+    for row in rows:
+        name = row[Collection.name].rstrip("/") + "/" + row[DataObject.name]
+        key = (row[DataObject.replica_status] == _GOOD_REPLICA, row[DataObject.modify_time])
+        if name in chosen and chosen[name] >= key:
+            continue
+        chosen[name] = key
+        entries[name] = {
+            "name": name,
+            "size": row[DataObject.size],
+            "type": "file",
+            "created": row[DataObject.create_time],
+            "mtime": row[DataObject.modify_time],
+            "checksum": row[DataObject.checksum],
+        }
+    return entries
+
+
+def _progress(callback):
+    """Adapt an fsspec callback to the updatables of a transfer, which may be called from several threads."""
+    lock = threading.Lock()
+
+    def update(n):
+        with lock:
+            callback.relative_update(n)
+
+    return update
+
+
+def _collection_entry(row):
+    return {
+        "name": row[Collection.name],
+        "size": 0,
+        "type": "directory",
+        "created": row[Collection.create_time],
+        "mtime": row[Collection.modify_time],
+    }
+
+
+class iRODSFileSystem(AbstractFileSystem):
+    """An fsspec filesystem for the iRODS namespace of a zone.
+
+    Paths are logical paths (e.g. /tempZone/home/alice/file), optionally prefixed by "irods:/".
+    """
+
+    protocol = "irods"
+    root_marker = "/"
+
+    def __init__(self, session=None, num_threads=DEFAULT_NUMBER_OF_THREADS, **kwargs):
+        """Wrap an iRODSSession.
+
+        If no session is given, one is made with irods.helpers.make_session, to which any keyword
+        arguments not recognized by fsspec are passed.  num_threads bounds the number of connections
+        used in parallel by a single read.
+        """
+        fs_kwargs = {
+            k: kwargs.pop(k)
+            for k in ("use_listings_cache", "listings_expiry_time", "max_paths", "skip_instance_cache")
+            if k in kwargs
+        }
+        super().__init__(**fs_kwargs)
+        if session is None:
+            from irods.helpers import make_session
+
+            session = make_session(**kwargs)
+        self.session = session
+        self.num_threads = num_threads
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        if isinstance(path, list):
+            return [cls._strip_protocol(p) for p in path]
+        path = str(path)
+        if path.startswith(cls.protocol + "://"):
+            path = path[len(cls.protocol) + 3 :]
+        elif path.startswith(cls.protocol + ":"):
+            path = path[len(cls.protocol) + 1 :]
+        return "/" + path.strip("/")
+
+    # Listing
+
+    def ls(self, path, detail=True, **_kwargs):
+        path = self._strip_protocol(path)
+        entries = [
+            _collection_entry(row)
+            for row in self.session.query(Collection.name, Collection.create_time, Collection.modify_time).filter(
+                Collection.parent_name == path
+            )
+            if row[Collection.name] != "/"
+        ]
+        entries += _data_object_entries(
+            self.session.query(*_DATA_OBJECT_COLUMNS).filter(Collection.name == path)
+        ).values()
+        if not entries:
+            info = self.info(path)  # - raises FileNotFoundError if there is nothing at the path
+            entries = [info] if info["type"] == "file" else []
+        entries.sort(key=lambda entry: entry["name"])
+        return entries if detail else [entry["name"] for entry in entries]
+
+    def info(self, path, **_kwargs):
+        path = self._strip_protocol(path)
+        if path != "/":
+            rows = self.session.query(*_DATA_OBJECT_COLUMNS).filter(
+                Collection.name == _irods_dirname(path), DataObject.name == path.rsplit("/", 1)[1]
+            )
+            entries = _data_object_entries(rows)
+            if entries:
+                return entries[path]
+        for row in self.session.query(Collection.name, Collection.create_time, Collection.modify_time).filter(
+            Collection.name == path
+        ):
+            return _collection_entry(row)
+        raise FileNotFoundError(path)
+
+    def find(self, path, maxdepth=None, withdirs=False, detail=False, **kwargs):
+        if maxdepth is not None:
+            return super().find(path, maxdepth=maxdepth, withdirs=withdirs, detail=detail, **kwargs)
+        path = self._strip_protocol(path)
+        prefix = path.rstrip("/") + "/"
+        # LIKE treats '_' and '%' in the path as wildcards, so filter the results precisely as well.
+        within = lambda name: name == path or name.startswith(prefix)
+        entries = {}
+        if withdirs:
+            for row in self.session.query(Collection.name, Collection.create_time, Collection.modify_time).filter(
+                Like(Collection.name, prefix + "%")
+            ):
+                if within(row[Collection.name]):
+                    entries[row[Collection.name]] = _collection_entry(row)
+        rows = self.session.query(*_DATA_OBJECT_COLUMNS).filter(Like(Collection.name, path.rstrip("/") + "%"))
+        entries.update((name, e) for name, e in _data_object_entries(rows).items() if within(_irods_dirname(name)))
+        if not entries:
+            try:
+                info = self.info(path)
+            except FileNotFoundError:
+                info = None
+            if info and (info["type"] == "file" or withdirs):
+                entries[path] = info
+        names = sorted(entries)
+        return {name: entries[name] for name in names} if detail else names
+
+    # Reading
+
+    def _read_range(self, path, start, end):
+        """Read bytes [start, end) of a data object, in parallel parts if the range is large."""
+        length = max(0, end - start)
+        parts = [
+            (offset, min(PARALLEL_PART_SIZE, end - offset))
+            for offset in range(start, start + length, PARALLEL_PART_SIZE)
+        ]
+        if not parts:
+            return b""
+        # A negative coalesce_gap keeps even adjacent parts from being recombined into a single read.
+        return b"".join(
+            self.session.data_objects.read_ranges(path, parts, num_threads=self.num_threads, coalesce_gap=-1)
+        )
+
+    def _resolve_range(self, path, start, end):
+        size = None
+        if start is None:
+            start = 0
+        if end is None or start < 0 or end < 0:
+            size = self.size(path)
+        if start < 0:
+            start = max(0, size + start)
+        if end is None:
+            end = size
+        elif end < 0:
+            end = size + end
+        return start, end
+
+    def cat_file(self, path, start=None, end=None, **_kwargs):
+        path = self._strip_protocol(path)
+        start, end = self._resolve_range(path, start, end)
+        return self._read_range(path, start, end)
+
+    def cat_ranges(self, paths, starts, ends, max_gap=None, on_error="return", **_kwargs):
+        """Read a byte range from each of the given paths, fetching the ranges of each data object
+        with one concurrent call to read_ranges, and the different data objects concurrently."""
+        if not (len(paths) == len(starts) == len(ends)):
+            raise ValueError("paths, starts and ends must be of equal length")
+        results = [None] * len(paths)
+        by_path = collections.defaultdict(list)
+        for index, path in enumerate(paths):
+            by_path[self._strip_protocol(path)].append(index)
+
+        def read_for_path(path, indices):
+            try:
+                ranges = [self._resolve_range(path, starts[i], ends[i]) for i in indices]
+                options = {} if max_gap is None else {"coalesce_gap": max_gap}
+                data = self.session.data_objects.read_ranges(
+                    path, [(s, max(0, e - s)) for s, e in ranges], num_threads=self.num_threads, **options
+                )
+            except Exception as e:
+                if on_error != "return":
+                    raise
+                data = [e] * len(indices)
+            for i, d in zip(indices, data):
+                results[i] = d
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(len(by_path), 8))) as executor:
+            for future in [executor.submit(read_for_path, p, i) for p, i in by_path.items()]:
+                future.result()
+        return results
+
+    def _open(
+        self,
+        path,
+        mode="rb",
+        block_size=None,
+        autocommit=True,
+        cache_options=None,
+        cache_type=DEFAULT_CACHE_TYPE,
+        **kwargs,
+    ):
+        return iRODSFile(
+            self,
+            self._strip_protocol(path),
+            mode=mode,
+            block_size=block_size or DEFAULT_BLOCK_SIZE,
+            autocommit=autocommit,
+            cache_type=cache_type,
+            cache_options=cache_options,
+            **kwargs,
+        )
+
+    # Modifying the namespace
+
+    def mkdir(self, path, create_parents=True, **kwargs):
+        self.session.collections.create(self._strip_protocol(path), recurse=create_parents, **kwargs)
+
+    def makedirs(self, path, exist_ok=False):
+        path = self._strip_protocol(path)
+        if self.session.collections.exists(path):
+            if not exist_ok:
+                raise FileExistsError(path)
+            return
+        self.session.collections.create(path, recurse=True)
+
+    def rmdir(self, path):
+        self.session.collections.remove(self._strip_protocol(path), recurse=False)
+        self.invalidate_cache(path)
+
+    def _rm(self, path):
+        path = self._strip_protocol(path)
+        if self.session.data_objects.exists(path):
+            self.session.data_objects.unlink(path, force=True)
+        else:
+            self.session.collections.remove(path, recurse=False, force=True)
+        self.invalidate_cache(path)
+
+    def cp_file(self, path1, path2, **kwargs):
+        self.session.data_objects.copy(self._strip_protocol(path1), self._strip_protocol(path2), **kwargs)
+
+    def mv(self, path1, path2, recursive=False, maxdepth=None, **kwargs):
+        if isinstance(path1, str) and isinstance(path2, str):
+            path1, path2 = self._strip_protocol(path1), self._strip_protocol(path2)
+            if self.isfile(path1):
+                return self.session.data_objects.move(path1, path2)
+            if recursive:
+                return self.session.collections.move(path1, path2)
+        return super().mv(path1, path2, recursive=recursive, maxdepth=maxdepth, **kwargs)
+
+    # Transfers to and from local files, through the parallel transfer engine.  Further keyword arguments are
+    # passed on to the transfer as options (e.g. irods.keywords.DEST_RESC_NAME_KW).
+
+    def get_file(self, rpath, lpath, callback=DEFAULT_CALLBACK, outfile=None, **kwargs):
+        rpath = self._strip_protocol(rpath)
+        info = self.info(rpath)
+        if info["type"] == "directory":
+            if outfile is None:
+                os.makedirs(lpath, exist_ok=True)
+            return
+        callback.set_size(info["size"])
+        if outfile is not None:
+            # An open file to be written in place of lpath.
+            with self.session.data_objects.open(rpath, "r", **kwargs) as f:
+                while True:
+                    data = f.read(DEFAULT_BLOCK_SIZE)
+                    if not data:
+                        break
+                    outfile.write(data)
+                    callback.relative_update(len(data))
+            return
+        self.session.data_objects.get(
+            rpath,
+            lpath,
+            num_threads=self.num_threads,
+            updatables=(_progress(callback),),
+            **dict(kwargs, **{kw.FORCE_FLAG_KW: ""}),
+        )
+
+    def put_file(self, lpath, rpath, callback=DEFAULT_CALLBACK, mode="overwrite", **kwargs):
+        rpath = self._strip_protocol(rpath)
+        if os.path.isdir(lpath):
+            self.makedirs(rpath, exist_ok=True)
+            return
+        if mode == "create" and self.exists(rpath):
+            raise FileExistsError(rpath)
+        callback.set_size(os.path.getsize(lpath))
+        self.session.data_objects.put(
+            lpath,
+            rpath,
+            num_threads=self.num_threads,
+            updatables=(_progress(callback),),
+            **dict(kwargs, **{kw.FORCE_FLAG_KW: ""}),
+        )
+        self.invalidate_cache(_irods_dirname(rpath))
+
+
+class iRODSFile(AbstractBufferedFile):
+    """A file-like object for a data object, as returned by iRODSFileSystem.open.
+
+    Reads are cached (by default in an fsspec "blockcache") and satisfied with parallel range
+    reads; writes are buffered in blocks and streamed to a single open data object handle.
+    """
+
+    def _fetch_range(self, start, end):
+        return self.fs._read_range(self.path, start, end)
+
+    def _initiate_upload(self):
+        self._handle = self.fs.session.data_objects.open(self.path, "a" if "a" in self.mode else "w")
+
+    def _upload_chunk(self, final=False):
+        try:
+            self._handle.write(self.buffer.getvalue())
+        except BaseException:
+            self._abandon_upload()
+            raise
+        if final:
+            self._handle.close()
+            self.fs.invalidate_cache(_irods_dirname(self.path))
+        return True
+
+    def _abandon_upload(self):
+        # Close the data object handle, leaving the replica it was writing unfinalized.  As fsspec does when an
+        # upload cannot be initiated, the file is marked closed, so that nothing more is written even by close().
+        self.closed = True
+        handle = getattr(self, "_handle", None)
+        if handle is None or handle.closed:
+            return
+        handle.raw.finalize_on_close = False
+        try:
+            handle.close()
+        except Exception:
+            # The buffered stream's final flush may fail as the write did, but the replica is closed regardless.
+            pass
+
+    def discard(self):
+        if not self.readable():
+            self._abandon_upload()
+        super().discard()
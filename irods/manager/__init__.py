@@ -1,3 +1,24 @@
+import functools
+
+
+def invalidates_queries(*models):
+    """Decorate a manager method that changes the catalog, so that when it returns (or raises) the cached results of
+    queries involving the given models are dropped from the session's query cache; or all results, if no models
+    are given."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._invalidate_queries(*models)
+
+        return wrapper
+
+    return decorator
+
+
 class Manager:
     __server_version = ()
 
@@ -17,3 +38,9 @@ class Manager:
 
     def _set_manager_session(self, sess):
         self.sess = sess
+
+    def _invalidate_queries(self, *models):
+        """Drop any cached results of queries involving the given models from the session's query cache."""
+        cache = getattr(self.sess, "query_cache", None)
+        if cache is not None:
+            cache.invalidate(*models)
@@ -0,0 +1,50 @@
+from irods.column import In
+
+# The greatest length, in characters, of the value list of an In condition in a batched lookup.  Longer
+# lists of values are split among several queries.
+IN_CONDITION_MAX_LENGTH = 2000
+
+
+def _condition(column, values):
+    """A condition that the column take one of the given values."""
+    values = list(values)
+    return In(column, values) if len(values) > 1 else (column == values[0])
+
+
+def _quotable(value):
+    return "'" not in str(value)
+
+
+def _value_length(value):
+    return len(str(value)) + 3  # quotes and separating comma
+
+
+def _chunks(keys, max_length=None):
+    """Split a sequence of equal-length tuples into lists of them, such that in each list the distinct values in
+    every position of the tuples would fit in an In condition.
+
+    An In condition has no escape for quotes, so a tuple containing a value with a quote is put in a list of its
+    own, to be looked up with equality conditions.
+    """
+    if max_length is None:
+        max_length = IN_CONDITION_MAX_LENGTH
+    keys = list(keys)
+    for key in keys:
+        if not all(map(_quotable, key)):
+            yield [key]
+    keys = [key for key in keys if all(map(_quotable, key))]
+    chunk, seen, lengths = [], [], []
+    for key in keys:
+        if not chunk:
+            seen, lengths = [set() for _ in key], [0] * len(key)
+        more = [0 if value in seen[i] else _value_length(value) for i, value in enumerate(key)]
+        if chunk and any(length + extra > max_length for length, extra in zip(lengths, more)):
+            yield chunk
+            chunk, seen, lengths = [], [set() for _ in key], [0] * len(key)
+            more = [_value_length(value) for value in key]
+        chunk.append(key)
+        for i, value in enumerate(key):
+            seen[i].add(value)
+            lengths[i] += more[i]
+    if chunk:
+        yield chunk
@@ -0,0 +1,170 @@
+"""
+Eager loading of the relations of collections and data objects (see iRODSCollection.prefetch and
+iRODSDataObject.prefetch).
+
+Each relation is loaded for all of the given objects at once, with paged queries over many objects apiece, and
+attached to the objects, so that later access to it is answered without a round trip to the server.
+"""
+
+from irods.data_object import irods_basename, irods_dirname
+from irods.manager._internal import _batch
+from irods.meta import iRODSMetaCollection
+from irods.models import Collection, CollectionAccess, CollectionMeta, DataAccess, DataObject, DataObjectMeta
+
+COLLECTION_RELATIONS = ("data_objects", "subcollections", "metadata", "acls")
+DATA_OBJECT_RELATIONS = ("metadata", "acls")
+
+
+def _relations(relations, allowed):
+    if isinstance(relations, str):
+        relations = (relations,)
+    relations = set(relations)
+    unknown = relations.difference(allowed)
+    if unknown:
+        raise ValueError(
+            "Cannot prefetch {}; the choices are: {}".format(", ".join(sorted(unknown)), ", ".join(allowed))
+        )
+    return relations
+
+
+def _rows(session, columns, condition_columns, keys):
+    """Yield the rows of queries for the given columns, with conditions that the condition_columns take the
+    values in the tuples of keys, split among as many queries as needed."""
+    for chunk in _batch._chunks(sorted(keys)):
+        conditions = [
+            _batch._condition(column, {key[i] for key in chunk}) for i, column in enumerate(condition_columns)
+        ]
+        yield from session.query(*columns).filter(*conditions)
+
+
+class _Targets:
+    """Collections or data objects of which the metadata and ACLs are to be loaded.
+
+    The objects are either looked up by path, or, if parents is given (a dict mapping the path of each object
+    onto that of its collection), by the paths of their collections, which makes for fewer and shorter
+    conditions when they are the contents of a few collections.
+    """
+
+    def __init__(self, model_cls, objects, parents=None):
+        self.model_cls = model_cls
+        self.objects = {}
+        for obj in objects:
+            self.objects.setdefault(obj.path, []).append(obj)
+        if model_cls is DataObject:
+            self.name_columns = (Collection.name, DataObject.name)
+            self.parent_column = Collection.name
+        else:
+            self.name_columns = (Collection.name,)
+            self.parent_column = Collection.parent_name
+        self.parents = parents
+
+    def rows(self, session, *columns):
+        """Yield pairs of the path of one of the objects and a row of a query for the given columns about it."""
+        if not self.objects:
+            return
+        if self.parents is not None:
+            condition_columns, keys = (self.parent_column,), {(self.parents[path],) for path in self.objects}
+        elif self.model_cls is DataObject:
+            condition_columns, keys = self.name_columns, {(irods_dirname(p), irods_basename(p)) for p in self.objects}
+        else:
+            condition_columns, keys = self.name_columns, {(path,) for path in self.objects}
+        for row in _rows(session, self.name_columns + columns, condition_columns, keys):
+            path = row[Collection.name]
+            if self.model_cls is DataObject:
+                path += "/" + row[DataObject.name]  # As in iRODSDataObject.path
+            # Rows for other pairings of the names, or for other contents of the collections, are not wanted.
+            if path in self.objects:
+                yield path, row
+
+
+def _load_metadata(session, targets):
+    manager = session.metadata
+    meta_model = DataObjectMeta if targets.model_cls is DataObject else CollectionMeta
+    avus = {path: [] for path in targets.objects}
+    for path, row in targets.rows(session, *manager._meta_columns(meta_model)):
+        avus[path].append(manager._meta_from_row(meta_model, row))
+    for path, objects in targets.objects.items():
+        for obj in objects:
+            obj._meta = iRODSMetaCollection(manager, targets.model_cls, path, avus=avus[path])
+
+
+def _load_acls(session, all_targets):
+    from irods.manager.access_manager import users_by_ids
+
+    manager = session.acls
+    changes = manager._acl_changes
+    extant_ids = manager._extant_user_ids()
+    loaded = []
+    for targets in all_targets:
+        access_column = DataAccess if targets.model_cls is DataObject else CollectionAccess
+        rows = {path: [] for path in targets.objects}
+        for path, row in targets.rows(session, access_column.name, access_column.user_id):
+            if row[access_column.user_id] in extant_ids:
+                rows[path].append(row)
+        loaded.append((targets, access_column, rows))
+
+    user_ids = {row[access_column.user_id] for (_, access_column, rows) in loaded for r in rows.values() for row in r}
+    user_lookup = {user.id: user for user in users_by_ids(session, user_ids)} if user_ids else {}
+    for targets, access_column, rows in loaded:
+        for path, objects in targets.objects.items():
+            acls = manager._acls_from_rows(path, rows[path], access_column, user_lookup)
+            for obj in objects:
+                obj._acls = (changes, acls)
+
+
+def _load_annotations(session, all_targets, relations):
+    all_targets = [targets for targets in all_targets if targets.objects]
+    if "metadata" in relations:
+        for targets in all_targets:
+            _load_metadata(session, targets)
+    if "acls" in relations and all_targets:
+        _load_acls(session, all_targets)
+
+
+def prefetch_collections(session, collections, relations):
+    """Load the given relations (see COLLECTION_RELATIONS) of the given iRODSCollection objects.  The metadata and
+    ACLs are loaded for the subcollections and data objects too, if those are loaded."""
+    from irods.collection import iRODSCollection
+    from irods.data_object import iRODSDataObject
+
+    relations = _relations(relations, COLLECTION_RELATIONS)
+    collections = list(collections)
+    by_path = {}
+    for coll in collections:
+        by_path.setdefault(coll.path, []).append(coll)
+    keys = {(path,) for path in by_path}
+    all_targets = [_Targets(Collection, collections)]
+
+    if "subcollections" in relations:
+        found = {path: [] for path in by_path}
+        for row in _rows(session, (Collection,), (Collection.parent_name,), keys):
+            # The root collection is its own parent.
+            if row[Collection.name] != "/" and row[Collection.parent_name] in found:
+                found[row[Collection.parent_name]].append(iRODSCollection(session.collections, row))
+        for path, subcollections in found.items():
+            for coll in by_path[path]:
+                coll._subcollections = subcollections
+        parents = {child.path: path for path, subcollections in found.items() for child in subcollections}
+        all_targets.append(_Targets(Collection, [child for sub in found.values() for child in sub], parents))
+
+    if "data_objects" in relations:
+        replicas = {path: {} for path in by_path}
+        for row in _rows(session, (DataObject, Collection.name), (Collection.name,), keys):
+            if row[Collection.name] in replicas:
+                replicas[row[Collection.name]].setdefault(row[DataObject.id], []).append(row)
+        children = []
+        for path, replica_lists in replicas.items():
+            parent = by_path[path][0]
+            data_objects = [iRODSDataObject(session.data_objects, parent, rows) for rows in replica_lists.values()]
+            for coll in by_path[path]:
+                coll._data_objects = data_objects
+            children += data_objects
+        all_targets.append(_Targets(DataObject, children, {child.path: child.collection.path for child in children}))
+
+    _load_annotations(session, all_targets, relations)
+
+
+def prefetch_data_objects(session, data_objects, relations):
+    """Load the given relations (see DATA_OBJECT_RELATIONS) of the given iRODSDataObject objects."""
+    relations = _relations(relations, DATA_OBJECT_RELATIONS)
+    _load_annotations(session, [_Targets(DataObject, data_objects)], relations)
@@ -1,5 +1,6 @@
 """The access manager is a collection of methods useful for managing iRODS ACLs."""
 
+import functools
 import logging
 from os.path import basename, dirname
 
@@ -8,7 +9,7 @@ from irods.api_number import api_number
 from irods.collection import iRODSCollection
 from irods.column import In
 from irods.data_object import irods_basename, irods_dirname, iRODSDataObject
-from irods.manager import Manager
+from irods.manager import Manager, invalidates_queries
 from irods.message import JSON_Message, ModAclRequest, iRODSMessage
 from irods.models import (
     Collection,
@@ -35,7 +36,24 @@ def users_by_ids(session, ids=()):
     return [iRODSUser(session.users, i) for i in session.query(User.id, User.name, User.type, User.zone).filter(*cond)]
 
 
+def _changes_acls(method):
+    """Decorate an AccessManager method that changes ACLs, so that ACLs prefetched before it was called are no longer
+    used to answer get()."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._acl_changes += 1
+
+    return wrapper
+
+
 class AccessManager(Manager):
+    # The number of changes made to ACLs through this manager, with which prefetched ACLs are stamped.
+    _acl_changes = 0
+
     @staticmethod
     def _to_acl_operation_json(op_input: iRODSAccess):
         return {
@@ -44,6 +62,8 @@ class AccessManager(Manager):
             **({} if not (z := op_input.user_zone) else {"zone": z}),
         }
 
+    @_changes_acls
+    @invalidates_queries(Collection, CollectionAccess, DataAccess)
     def apply_atomic_operations(self, logical_path: str, *operations, admin=False):
         """
         Apply the requested operations atomically to the object at logical_path.
@@ -72,6 +92,14 @@ class AccessManager(Manager):
 
     def get(self, target, report_raw_acls=True, **kw):
 
+        # ACLs loaded along with the target (see iRODSCollection.prefetch) answer the default form of the call,
+        # unless ACLs have been changed through this session since.
+        prefetched = getattr(target, "_acls", None)
+        if report_raw_acls and not kw and prefetched is not None:
+            changes, acls = prefetched
+            if changes == self._acl_changes:
+                return list(acls)
+
         if report_raw_acls:
             return self.__get_raw(target, **kw)  # prefer a behavior consistent  with 'ils -A`
 
@@ -138,11 +166,7 @@ class AccessManager(Manager):
         else:
             raise TypeError
 
-        # TODO: remove the filtering through extant_ids on resolution of irods/irods#6921.
-        #   (depending on the nature of the fix we may make it conditional, based on the server --
-        #   if for example in upcoming iRODS 4.2.12 and >=4.3.1 outdated userIDs in R_OBJT_ACCESS
-        #   are guaranteed to be systematically and atomically purged.
-        extant_ids = set(u[User.id] for u in self.sess.query(User))
+        extant_ids = self._extant_user_ids()
         rows = [r for r in query_func(target.path) if r[access_column.user_id] in extant_ids]
         userids = set(r[access_column.user_id] for r in rows)
 
@@ -159,21 +183,33 @@ class AccessManager(Manager):
         else:
             raise TypeError
 
+        return self._acls_from_rows(target.path, rows, access_column, user_lookup)
+
+    def _extant_user_ids(self):
+        # TODO: remove the filtering through extant_ids on resolution of irods/irods#6921.
+        #   (depending on the nature of the fix we may make it conditional, based on the server --
+        #   if for example in upcoming iRODS 4.2.12 and >=4.3.1 outdated userIDs in R_OBJT_ACCESS
+        #   are guaranteed to be systematically and atomically purged.
+        return set(u[User.id] for u in self.sess.query(User))
+
+    @staticmethod
+    def _acls_from_rows(path, rows, access_column, user_lookup):
         # Instantiate as set before converting to a list, in order to remove duplicate iRODSAccess
         # objects. [#557]
 
-        acls = list({
+        return list({
             iRODSAccess(
                 r[access_column.name],
-                target.path,
+                path,
                 user_lookup[r[access_column.user_id]].name,
                 user_lookup[r[access_column.user_id]].zone,
                 user_lookup[r[access_column.user_id]].type,
             )
             for r in rows
         })
-        return acls
 
+    @_changes_acls
+    @invalidates_queries(Collection, CollectionAccess, DataAccess)
     def set(self, acl, recursive=False, admin=False, **kw):
 
         prefix = "admin:" if admin else ""
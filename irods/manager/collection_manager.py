@@ -1,6 +1,6 @@
 from irods.models import Collection, DataObject
-from irods.manager import Manager
-from irods.manager._internal import _api_impl
+from irods.manager import Manager, invalidates_queries
+from irods.manager._internal import _api_impl, _batch, _prefetch
 from irods.message import (
     iRODSMessage,
     CollectionRequest,
@@ -16,7 +16,12 @@ import irods.keywords as kw
 
 
 class CollectionManager(Manager):
-    def get(self, path):
+    def get(self, path, prefetch=()):
+        """Return the collection at the given path as an iRODSCollection.
+
+        prefetch may name relations of the collection to be loaded along with it (see iRODSCollection.prefetch),
+        e.g. ("data_objects", "subcollections", "metadata", "acls") for a listing of its contents.
+        """
         path = iRODSCollection.normalize_path(path)
         filters = [Collection.name == path]
         # if a ticket is supplied for this session, try both without and with DataObject join
@@ -30,8 +35,12 @@ class CollectionManager(Manager):
                     filters += [DataObject.id != 0]
                     continue
                 raise CollectionDoesNotExist()
-            return iRODSCollection(self, result)
+            collection = iRODSCollection(self, result)
+            if prefetch:
+                _prefetch.prefetch_collections(self.sess, [collection], prefetch)
+            return collection
 
+    @invalidates_queries(Collection)
     def create(self, path, recurse=True, **options):
         path = iRODSCollection.normalize_path(path)
         if recurse:
@@ -44,6 +53,7 @@ class CollectionManager(Manager):
             response = conn.recv()
         return self.get(path)
 
+    @invalidates_queries()
     def remove(self, path, recurse=True, force=False, **options):
         if recurse:
             options[kw.RECURSIVE_OPR__KW] = ""
@@ -70,6 +80,7 @@ class CollectionManager(Manager):
                 conn.reply(SYS_CLI_TO_SVR_COLL_STAT_REPLY)
                 response = conn.recv()
 
+    @invalidates_queries()
     def unregister(self, path, **options):
         # https://github.com/irods/irods/blob/4.2.1/lib/api/include/dataObjInpOut.h#L190
         options[kw.OPR_TYPE_KW] = 26
@@ -83,6 +94,38 @@ class CollectionManager(Manager):
             return False
         return True
 
+    def get_many(self, paths, prefetch=()):
+        """Look up many collections at once.
+
+        Returns a dict mapping each of the given paths at which a collection exists onto an iRODSCollection.
+        The paths are looked up with a few queries, each for many of them, rather than one query apiece.
+        As in get(), prefetch may name relations to be loaded for all of the collections at once.
+        """
+        by_name = {}
+        for path in paths:
+            by_name.setdefault(str(iRODSCollection.normalize_path(path)), []).append(path)
+
+        found = {}
+        # As in get(), a collection accessible only through a ticket is found by joining with its data objects.
+        joins = ([], [DataObject.id != 0]) if self.sess.ticket__ else ([],)
+        for extra_filters in joins:
+            missing = [(name,) for name in sorted(by_name) if name not in found]
+            for chunk in _batch._chunks(missing):
+                condition = _batch._condition(Collection.name, (name for (name,) in chunk))
+                for row in self.sess.query(Collection).filter(condition, *extra_filters):
+                    found[row[Collection.name]] = iRODSCollection(self, row)
+
+        if prefetch:
+            _prefetch.prefetch_collections(self.sess, found.values(), prefetch)
+        return {path: found[name] for name, originals in by_name.items() if name in found for path in originals}
+
+    def exists_many(self, paths):
+        """Return a dict mapping each of the given paths onto True if a collection exists there, else False."""
+        paths = list(paths)
+        found = self.get_many(paths)
+        return {path: path in found for path in paths}
+
+    @invalidates_queries(Collection, DataObject)
     def move(self, src_path, dest_path):
         # check if dest is an existing collection
         # if so append collection name to it
@@ -119,6 +162,7 @@ class CollectionManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(Collection, DataObject)
     def register(self, dir_path, coll_path, **options):
         options[kw.FILE_PATH_KW] = dir_path
         options[kw.COLLECTION_KW] = ""
@@ -139,6 +183,7 @@ class CollectionManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(Collection)
     def touch(self, path, **options):
         """Change the mtime of an existing collection.
 
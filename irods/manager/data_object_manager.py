@@ -1,9 +1,16 @@
 import ast
 import collections
+import concurrent.futures
+import functools
+import inspect
 import io
+import itertools
 import json
 import logging
 import os
+import queue
+import threading
+import time
 import weakref
 from typing import Any, List, Type
 
@@ -12,17 +19,26 @@ import irods.exception as ex
 import irods.keywords as kw
 from irods import parallel
 from irods.api_number import api_number
+from irods.block_cache import RECENT_MODIFICATION_SECONDS, BlockCache, iRODSDataObjectCachedRaw
+from irods.checksum import ChecksumCalculator, resolve_algorithms, transferred_replicas, verify_against_replicas
 from irods.collection import iRODSCollection
 from irods.data_object import (
+    READ_AHEAD_BLOCK_SIZE,
+    READ_AHEAD_DEFAULT_BLOCKS,
+    WRITE_BEHIND_BLOCK_SIZE,
+    WRITE_BEHIND_DEFAULT_BLOCKS,
     chunks,
     irods_basename,
     irods_dirname,
     iRODSDataObject,
     iRODSDataObjectFileRaw,
+    iRODSDataObjectReadAheadRaw,
+    iRODSDataObjectWriteBehindRaw,
 )
-from irods.manager import Manager
-from irods.manager._internal import _api_impl, _logical_path
+from irods.manager import Manager, invalidates_queries
+from irods.manager._internal import _api_impl, _batch, _logical_path, _prefetch
 from irods.message import (
+    INT_PI,
     STR_PI,
     DataObjChksumRequest,
     DataObjChksumResponse,
@@ -33,7 +49,7 @@ from irods.message import (
     StringStringMap,
     iRODSMessage,
 )
-from irods.models import Collection, DataObject
+from irods.models import Collection, DataAccess, DataObject, DataObjectMeta
 from irods.parallel import deferred_call
 
 logger = logging.getLogger(__name__)
@@ -69,6 +85,26 @@ def register_update_type(type_, factory_):
     )
 
 
+def _coalesce_ranges(ranges, gap, maximum_size):
+    """Group (offset, length) ranges, given in any order, into spans to be fetched with one read each.
+
+    Returns a list of (span_offset, span_length, members) tuples, where members lists the
+    (index, offset, length) of each of the original ranges falling within the span.
+    """
+    spans = []
+    for index, (offset, length) in sorted(enumerate(ranges), key=lambda item: item[1]):
+        if offset < 0 or length < 0:
+            raise ValueError("Invalid range ({}, {}): offsets and lengths must be non-negative.".format(offset, length))
+        if spans:
+            span_offset, span_length, members = spans[-1]
+            end = max(span_offset + span_length, offset + length)
+            if offset <= span_offset + span_length + gap and end - span_offset <= max(maximum_size, span_length):
+                spans[-1] = (span_offset, end - span_offset, members + [(index, offset, length)])
+                continue
+        spans.append((offset, length, [(index, offset, length)]))
+    return spans
+
+
 def unregister_update_type(type_):
     """
     Remove type_ from the listof recognized updatable types maintained by the PRC.
@@ -118,12 +154,14 @@ def call___del__if_exists(super_):
         next_finalizer_in_MRO()
 
 
-class ManagedBufferedRandom(io.BufferedRandom):
+class ManagedBufferedIO:
+    """Mixin for the buffered streams that are closed automatically (see the auto_close option)."""
+
     def __init__(self, *a, **kwd):
         # Help ensure proper teardown sequence by storing a reference to the session,
         # if provided via keyword '_session'.
         self._iRODS_session = kwd.pop("_session", None)
-        super(ManagedBufferedRandom, self).__init__(*a, **kwd)
+        super(ManagedBufferedIO, self).__init__(*a, **kwd)
 
         self.do_close = True
 
@@ -136,7 +174,31 @@ class ManagedBufferedRandom(io.BufferedRandom):
     def __del__(self):
         if self.do_close and not self.closed:
             self.close()
-        call___del__if_exists(super(ManagedBufferedRandom, self))
+        call___del__if_exists(super(ManagedBufferedIO, self))
+
+
+class ManagedBufferedRandom(ManagedBufferedIO, io.BufferedRandom):
+    pass
+
+
+class ManagedBufferedReader(ManagedBufferedIO, io.BufferedReader):
+    pass
+
+
+class WriteBehindBufferedRandom(io.BufferedRandom):
+    """The buffered stream returned when a data object is opened with write-behind.
+
+    Unlike that of io.BufferedRandom, its flush() waits for all data to reach the server,
+    raising any error encountered in sending it.
+    """
+
+    def flush(self):
+        super(WriteBehindBufferedRandom, self).flush()
+        self.raw.flush()
+
+
+class ManagedWriteBehindBufferedRandom(ManagedBufferedRandom, WriteBehindBufferedRandom):
+    pass
 
 
 MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE = 32 * (1024**2)
@@ -146,6 +208,21 @@ DEFAULT_NUMBER_OF_THREADS = 0  # Defaults for reasonable number of threads -- op
 
 DEFAULT_QUEUE_DEPTH = 32
 
+# For read_ranges: requested ranges separated by at most this many bytes are fetched with one read,
+# as long as the combined read does not exceed the maximum size given.
+READ_RANGES_COALESCE_GAP = 128 * 1024
+READ_RANGES_MAXIMUM_COALESCED_SIZE = 16 * (1024**2)
+
+# For stream and put_stream: the size of each chunk transferred, and (if no window is given) the number of
+# chunks per thread that may be held in memory between the producer and the consumer.
+STREAM_CHUNK_SIZE = 4 * (1024**2)
+STREAM_WINDOW_CHUNKS_PER_THREAD = 2
+
+# Data objects of at most this many bytes are transferred by get, put, read_bytes and write_bytes as the payload of
+# a single request (DATA_OBJ_GET_AN or DATA_OBJ_PUT_AN), rather than through an opened descriptor.  The server's own
+# limit for such transfers, max_size_for_single_buffer_in_megabytes, is 32 by default.
+SINGLE_BUFFER_TRANSFER_SIZE = 4 * (1024**2)
+
 logger = logging.getLogger(__name__)
 
 
@@ -217,10 +294,25 @@ class DataObjectManager(Manager):
             if size is not None and isinstance(open_options, dict):
                 open_options[kw.DATA_SIZE_KW] = size
 
-    def _download(self, obj_path, local_path, num_threads, updatables=(), **options):
+    def _download(
+        self,
+        obj_path,
+        local_path,
+        num_threads,
+        updatables=(),
+        checksum=None,
+        report=None,
+        executor=None,
+        size_hint=None,
+        **options,
+    ):
         """Transfer the contents of a data object to a local file.
 
-        Called from get() when a local path is named.
+        Called from get() when a local path is named.  Returns a pair: the checksums computed in flight for a
+        single-threaded download, if any, in a dict (for verification by the caller), and the resource hierarchy
+        of the replica read, if known.
+        If size_hint, the size of the data object according to the catalog, is small enough, the
+        content is fetched in a single request.
         """
 
         local_file = (
@@ -233,6 +325,20 @@ class DataObjectManager(Manager):
         if os.path.exists(local_file) and kw.FORCE_FLAG_KW not in options:
             raise ex.OVERWRITE_WITHOUT_FORCE_FLAG
 
+        checksum_calculator = None
+        algorithms = resolve_algorithms(checksum, for_verification=True)
+        if size_hint is not None and self._can_transfer_single_buffer(size_hint, options):
+            data = self._get_single_buffer(obj_path, **options)
+            if data is not None:
+                if algorithms:
+                    checksum_calculator = ChecksumCalculator(algorithms)
+                    checksum_calculator.update(data)
+                with open(local_file, "wb") as f:
+                    f.write(data)
+                do_progress_updates(updatables, len(data))
+                return (checksum_calculator.finish() if checksum_calculator else None, None)
+
+        resc_hier = None
         data_open_returned_values_ = {}
         with self.open(obj_path, "r", returned_values=data_open_returned_values_, **options) as o:
             if self.should_parallelize_transfer(num_threads, o, open_options=options.items()):
@@ -245,6 +351,9 @@ class DataObjectManager(Manager):
                         target_resource_name=options.get(kw.RESC_NAME_KW, ""),
                         data_open_returned_values=data_open_returned_values_,
                         updatables=updatables,
+                        checksum=checksum,
+                        report=report,
+                        executor=executor,
                     ):
                         raise error
                 except ex.iRODSException as e:
@@ -252,10 +361,16 @@ class DataObjectManager(Manager):
                 except BaseException as e:
                     raise error from e
             else:
+                if algorithms:
+                    checksum_calculator = ChecksumCalculator(algorithms)
+                    resc_hier = self._replica_resc_hier(o.raw)
                 with open(local_file, "wb") as f:
                     for chunk in chunks(o, self.READ_BUFFER_SIZE):
                         f.write(chunk)
+                        if checksum_calculator:
+                            checksum_calculator.update(chunk)
                         do_progress_updates(updatables, len(chunk))
+        return (checksum_calculator.finish() if checksum_calculator else None, resc_hier)
 
     def get(
         self,
@@ -264,6 +379,9 @@ class DataObjectManager(Manager):
         num_threads=DEFAULT_NUMBER_OF_THREADS,
         updatables=(),
         replica_sort_function=None,
+        checksum=None,
+        report=None,
+        executor=None,
         **options,
     ):
         """
@@ -287,6 +405,15 @@ class DataObjectManager(Manager):
             replica_sort_function: a sort key function dictating the order of replica query results in 'self.replicas'.
                 If not specified, a default value of None will cause irods.data_objects._DEFAULT_SORT_KEY_FN to be
                 selected to determine the sort order.
+            checksum: if True (or the name of an algorithm, e.g. "sha2" or "md5"), a checksum of the downloaded
+                content is computed as the bytes are written to 'local_path', and compared with the catalog.
+                No second pass is made over the data; if no replica has a checksum to compare with, the
+                comparison is skipped.
+            report: an irods.transfer_report.TransferReport, to be filled in with throughput and timing metrics
+                if the download is done as a parallel transfer.
+            executor: a concurrent.futures.Executor, possibly shared with other transfers, in which to run the
+                threads of a parallel download.  It must be able to run all of them at once.  If None, an executor
+                is created for the download.
             **options: a combination of possible iRODS keyword options to be relayed to the data object open() call.
                 For a download request, FORCE_FLAG_KW may be used to ensure any pre-existing file at the 'local_path'
                 will be overwritten.
@@ -297,12 +424,11 @@ class DataObjectManager(Manager):
         Raises:
             DataObjectDoesNotExist: if the specified path does not exist, or exists as a collection rather than a data
                 object.
+            USER_CHKSUM_MISMATCH: if a checksum was requested and does not match the one in the catalog.
         """
         parent = self.sess.collections.get(irods_dirname(path))
 
-        # TODO: optimize
-        if local_path:
-            self._download(path, local_path, num_threads=num_threads, updatables=updatables, **options)
+        computed_checksums = resc_hier = None
 
         query = (
             self.sess
@@ -317,9 +443,56 @@ class DataObjectManager(Manager):
             # is for a DataObject and we don't explicitly join to Collection
 
         results = query.all()  # get up to max_rows replicas
+
+        if local_path:
+            # The catalog is consulted first, so that the size of a small data object is known before it is fetched.
+            (computed_checksums, resc_hier) = self._download(
+                path,
+                local_path,
+                num_threads=num_threads,
+                updatables=updatables,
+                checksum=checksum,
+                report=report,
+                executor=executor,
+                size_hint=max((row[DataObject.size] for row in results), default=None),
+                **options,
+            )
+
         if len(results) <= 0:
             raise ex.DataObjectDoesNotExist()
-        return iRODSDataObject(self, parent, results, replica_sort_function=replica_sort_function)
+        data_object = iRODSDataObject(self, parent, results, replica_sort_function=replica_sort_function)
+        if computed_checksums:
+            replicas = transferred_replicas(data_object.replicas, resc_hier, options)
+            verify_against_replicas(computed_checksums, replicas, path)
+        return data_object
+
+    @staticmethod
+    def _replica_resc_hier(raw):
+        """The resource hierarchy of the replica open through a descriptor, or None if it cannot be found out."""
+        try:
+            return raw.replica_access_info()[1] or None
+        except ex.iRODSException:
+            return None
+
+    def _check_registered_checksum(self, path, checksum_calculator, resc_hier=None, **options):
+        """Check the checksum that the server registered for the replica just written against that computed in flight.
+
+        The computed checksum is handed to the server with REG_CHKSUM_KW (or VERIFY_CHKSUM_KW) at the finalizing
+        close, or with the single-buffer put.  The client never registers a checksum itself, since one that the
+        server has not computed from the stored data would verify nothing: a replica left without a checksum is
+        only warned of.
+
+        Raises:
+            USER_CHKSUM_MISMATCH: if the checksums differ.
+        """
+        computed = checksum_calculator.finish()
+        # Results cached before the close would not show the checksum registered by it.
+        self._invalidate_queries(DataObject)
+        replicas = transferred_replicas(self.get(path).replicas, resc_hier, options, written=True)
+        if not any(r.checksum for r in replicas):
+            logger.warning("The server registered no checksum for the replica of %r just written.", path)
+            return
+        verify_against_replicas(computed, replicas, path)
 
     @staticmethod
     def _resolve_force_put_option(options, default_setting=None, true_value=""):
@@ -339,6 +512,7 @@ class DataObjectManager(Manager):
         else:
             del options[kw.FORCE_FLAG_KW]
 
+    @invalidates_queries(DataObject)
     def put(
         self,
         local_path,
@@ -346,17 +520,24 @@ class DataObjectManager(Manager):
         return_data_object=False,
         num_threads=DEFAULT_NUMBER_OF_THREADS,
         updatables=(),
+        checksum=None,
+        report=None,
+        executor=None,
         **options,
     ):
         # Decide if a put option should be used and modify options accordingly.
         self._resolve_force_put_option(options, default_setting=client_config.data_objects.force_put_by_default)
 
+        force = kw.FORCE_FLAG_KW in options
         if self.sess.collections.exists(irods_path):
             obj_path = iRODSCollection.normalize_path(irods_path, os.path.basename(local_path))  # noqa: PTH119
+            # Whether a data object of that name exists is not known.
+            known_absent = False
         else:
             obj_path = irods_path
-            if kw.FORCE_FLAG_KW not in options and self.exists(obj_path):
+            if not force and self.exists(obj_path):
                 raise ex.OVERWRITE_WITHOUT_FORCE_FLAG
+            known_absent = not force
         options.pop(kw.FORCE_FLAG_KW, None)
 
         replica_sort_function = options.pop('replica_sort_function', None)
@@ -376,6 +557,9 @@ class DataObjectManager(Manager):
                         target_resource_name=options.get(kw.RESC_NAME_KW, "") or options.get(kw.DEST_RESC_NAME_KW, ""),
                         open_options=options,
                         updatables=updatables,
+                        checksum=checksum,
+                        report=report,
+                        executor=executor,
                     ):
                         raise error
                 except ex.iRODSException as e:
@@ -383,13 +567,34 @@ class DataObjectManager(Manager):
                 except BaseException as e:
                     raise error from e
             else:
-                with self.open(obj_path, "w", **options) as o:
-                    # Set operation type to trigger acPostProcForPut
-                    if kw.OPR_TYPE_KW not in options:
-                        options[kw.OPR_TYPE_KW] = 1  # PUT_OPR
-                    for chunk in chunks(f, self.WRITE_BUFFER_SIZE):
-                        o.write(chunk)
-                        do_progress_updates(updatables, len(chunk))
+                algorithms = resolve_algorithms(checksum)
+                checksum_calculator = ChecksumCalculator(algorithms) if algorithms else None
+                # The server overwrites an existing data object given a single buffer only with FORCE_FLAG_KW, which
+                # is passed on only if the caller (or the configuration) asked for it.  Without it, a data object
+                # that may exist in the target collection is overwritten through open() as before.
+                if (force or known_absent) and self._can_transfer_single_buffer(os.fstat(f.fileno()).st_size, options):
+                    data = f.read()
+                    if checksum_calculator:
+                        checksum_calculator.update(data)
+                    put_options = dict(options, **{kw.FORCE_FLAG_KW: ""}) if force else options
+                    self._put_single_buffer(obj_path, data, checksum_calculator, **put_options)
+                    do_progress_updates(updatables, len(data))
+                else:
+                    with self.open(obj_path, "w", **options) as o:
+                        # Set operation type to trigger acPostProcForPut
+                        if kw.OPR_TYPE_KW not in options:
+                            options[kw.OPR_TYPE_KW] = 1  # PUT_OPR
+                        for chunk in chunks(f, self.WRITE_BUFFER_SIZE):
+                            o.write(chunk)
+                            if checksum_calculator:
+                                checksum_calculator.update(chunk)
+                            do_progress_updates(updatables, len(chunk))
+                        if checksum_calculator:
+                            # Hand the checksum computed in flight to the server at close.
+                            o.raw.options.update(checksum_calculator.close_options(o.raw.options))
+                            resc_hier = self._replica_resc_hier(o.raw)
+                    if checksum_calculator:
+                        self._check_registered_checksum(obj_path, checksum_calculator, resc_hier, **options)
         if kw.ALL_KW in options:
             repl_options = options.copy()
             repl_options[kw.UPDATE_REPL_KW] = ""
@@ -403,6 +608,7 @@ class DataObjectManager(Manager):
             return self.get(obj_path, replica_sort_function=replica_sort_function)
         return None
 
+    @invalidates_queries(DataObject)
     def chksum(self, path, **options):
         """
         See: https://github.com/irods/irods/blob/4-2-stable/lib/api/include/dataObjChksum.h
@@ -449,6 +655,9 @@ class DataObjectManager(Manager):
         data_open_returned_values=None,
         progressQueue=False,
         updatables=(),
+        checksum=None,
+        report=None,
+        executor=None,
     ):
         """Call into the irods.parallel library for multi-1247 GET.
 
@@ -456,6 +665,17 @@ class DataObjectManager(Manager):
         the condition that the data object is determined to be of appropriate size
         for parallel download.
 
+        'file_' may be the name of a local file or, to download without staging on
+        disk, a writable buffer (e.g. a bytearray, memoryview, mmap or NumPy array at
+        least as large as the data object) or a seekable file-like object.  Each
+        transfer thread writes directly into its own slice of a buffer.
+
+        If 'checksum' is True or names an algorithm, the downloaded bytes are hashed
+        in flight and compared with the catalog checksum of the replica read.
+
+        If given, 'report' (an irods.transfer_report.TransferReport) is filled in with metrics
+        of the transfer, and the transfer threads are run in 'executor' (a concurrent.futures.Executor
+        able to run all of them at once) rather than in one created for the purpose.
         """
         return parallel.io_main(
             self.sess,
@@ -467,6 +687,9 @@ class DataObjectManager(Manager):
             data_open_returned_values=data_open_returned_values,
             queueLength=(DEFAULT_QUEUE_DEPTH if progressQueue else 0),
             updatables=updatables,
+            checksum=checksum,
+            report=report,
+            executor=executor,
         )
 
     def parallel_put(
@@ -480,12 +703,25 @@ class DataObjectManager(Manager):
         open_options={},
         updatables=(),
         progressQueue=False,
+        checksum=None,
+        report=None,
+        executor=None,
     ):
         """Call into the irods.parallel library for multi-1247 PUT.
 
         Called from a session.data_objects.put(...) on the condition that the
         data object is determined to be of appropriate size for parallel upload.
 
+        'file_' may be the name of a local file, any object supporting the buffer
+        protocol (e.g. bytes, a memoryview or a NumPy array), or a seekable file-like
+        object.  Each transfer thread sends directly from its own slice of a buffer.
+
+        If 'checksum' is True or names an algorithm, the uploaded bytes are hashed
+        in flight and the result is registered with the replica when it is closed.
+
+        If given, 'report' (an irods.transfer_report.TransferReport) is filled in with metrics
+        of the transfer, and the transfer threads are run in 'executor' (a concurrent.futures.Executor
+        able to run all of them at once) rather than in one created for the purpose.
         """
         return parallel.io_main(
             self.sess,
@@ -498,12 +734,16 @@ class DataObjectManager(Manager):
             open_options=open_options,
             queueLength=(DEFAULT_QUEUE_DEPTH if progressQueue else 0),
             updatables=updatables,
+            checksum=checksum,
+            report=report,
+            executor=executor,
         )
 
     @staticmethod
     def _call_thru(c):
         return c() if callable(c) else c
 
+    @invalidates_queries(DataObject)
     def create(
         self, path, resource=None, force=client_config.getter("data_objects", "force_create_by_default"), **options
     ):
@@ -560,6 +800,16 @@ class DataObjectManager(Manager):
         kw.RESC_HIER_STR_KW,
     ))
 
+    def _use_default_resource(self, options):
+        # If no keywords are used that would influence the server as to the choice of a storage resource,
+        # then use the default resource in the client configuration.
+        if self._RESC_flags_for_open.isdisjoint(options.keys()):
+            # Use client-side default resource if available
+            try:
+                options[kw.DEST_RESC_NAME_KW] = self.sess.default_resource
+            except AttributeError:
+                pass
+
     def open(
         self,
         path,
@@ -572,17 +822,19 @@ class DataObjectManager(Manager):
         # global setting. Use True or False as an override.
         returned_values=None,  # Used to update session reference, for forging more conns to same host, in irods.parallel.io_main
         allow_redirect=client_config.getter("data_objects", "allow_redirect"),
+        read_ahead=0,  # For sequential reading: True, or the number of blocks to read ahead in a background thread.
+        read_ahead_block_size=READ_AHEAD_BLOCK_SIZE,
+        write_behind=0,  # For streamed writing: True, or the number of blocks to queue for a background thread to send.
+        write_behind_block_size=WRITE_BEHIND_BLOCK_SIZE,
+        block_cache=None,  # An irods.block_cache.BlockCache through which to serve reads (mode 'r' only).
         **options,
     ):
+        if read_ahead and write_behind:
+            raise ValueError("A data object cannot be opened with both read_ahead and write_behind.")
+        if block_cache is not None and mode != "r":
+            raise ValueError("A block cache may be used only with data objects opened in mode 'r'.")
         _raw_fd_holder = options.get("_raw_fd_holder", [])
-        # If no keywords are used that would influence the server as to the choice of a storage resource,
-        # then use the default resource in the client configuration.
-        if self._RESC_flags_for_open.isdisjoint(options.keys()):
-            # Use client-side default resource if available
-            try:
-                options[kw.DEST_RESC_NAME_KW] = self.sess.default_resource
-            except AttributeError:
-                pass
+        self._use_default_resource(options)
         createFlag = self.O_CREAT if create else 0
         flags, seek_to_end = {
             "r": (self.O_RDONLY, False),
@@ -593,6 +845,9 @@ class DataObjectManager(Manager):
             "a+": (self.O_RDWR | createFlag, True),
         }[mode]
         # TODO: Use seek_to_end
+        if mode != "r":
+            # Creation or truncation is seen in the catalog at once; the new size and checksum only after close.
+            self._invalidate_queries(DataObject)
 
         if not isinstance(returned_values, dict):
             returned_values = {}
@@ -673,21 +928,592 @@ class DataObjectManager(Manager):
 
         raw = iRODSDataObjectFileRaw(conn, desc, finalize_on_close=finalize_on_close, **options)
         raw.session = directed_sess
+        if mode != "r":
+            raw.on_close = functools.partial(self._invalidate_queries, DataObject)
 
         (_raw_fd_holder).append(raw)
 
+        if block_cache is not None:
+            raw = self._block_cached_raw(raw, block_cache, path)
+
+        if read_ahead:
+            raw = iRODSDataObjectReadAheadRaw(
+                raw,
+                blocks=(READ_AHEAD_DEFAULT_BLOCKS if read_ahead is True else int(read_ahead)),
+                block_size=read_ahead_block_size,
+            )
+
+        buffered_classes = (io.BufferedRandom, ManagedBufferedRandom)
+        if block_cache is not None:
+            # Cached streams are read-only.
+            buffered_classes = (io.BufferedReader, ManagedBufferedReader)
+        buffer_options = {}
+        if write_behind:
+            raw = iRODSDataObjectWriteBehindRaw(
+                raw,
+                blocks=(WRITE_BEHIND_DEFAULT_BLOCKS if write_behind is True else int(write_behind)),
+                block_size=write_behind_block_size,
+            )
+            # Coalesce small writes into blocks of the size sent to the server.
+            buffered_classes = (WriteBehindBufferedRandom, ManagedWriteBehindBufferedRandom)
+            buffer_options["buffer_size"] = write_behind_block_size
+
         if callable(auto_close):
             # Use case: auto_close has defaulted to the irods.configuration getter.
             # access entry in irods.configuration
             auto_close = auto_close()
         if auto_close:
-            ret_value = ManagedBufferedRandom(raw, _session=self.sess)
+            ret_value = buffered_classes[1](raw, _session=self.sess, **buffer_options)
         else:
-            ret_value = io.BufferedRandom(raw)
+            ret_value = buffered_classes[0](raw, **buffer_options)
         if "a" in mode:
             ret_value.seek(0, io.SEEK_END)
         return ret_value
 
+    def read_ranges(
+        self,
+        path,
+        ranges,
+        buffers=None,
+        num_threads=DEFAULT_NUMBER_OF_THREADS,
+        coalesce_gap=READ_RANGES_COALESCE_GAP,
+        **options,
+    ):
+        """
+        Read a number of byte ranges from a data object, using several connections in parallel.
+
+        Ranges lying close together are combined into single reads, and the resulting reads are shared out
+        among up to num_threads descriptors, each opened on its own connection.
+
+        Args:
+            path: the logical path of the data object.
+            ranges: a sequence of (offset, length) pairs.
+            buffers: if given, a sequence of writable buffers (e.g. bytearray or memoryview objects), one for each
+                range, into which the data is read.  Each must be at least as long as the corresponding range.
+            num_threads: the maximum number of descriptors (and threads) used.  The default of
+                DEFAULT_NUMBER_OF_THREADS selects a reasonable number.
+            coalesce_gap: ranges separated by at most this many bytes are fetched together.
+            **options: keywords for the open() of each descriptor, e.g. RESC_NAME_KW to select a replica.
+
+        Returns:
+            If buffers is None, a list of bytes objects, holding the data for each range in the order requested.
+            Otherwise, a list of the number of bytes read into each buffer.  In either case, a range extending past
+            the end of the data object yields fewer bytes than were requested.
+        """
+        ranges = [(int(offset), int(length)) for offset, length in ranges]
+        if buffers is not None and len(buffers) != len(ranges):
+            raise ValueError("The number of buffers must match the number of ranges.")
+        results = [None] * len(ranges)
+        spans = [s for s in _coalesce_ranges(ranges, coalesce_gap, READ_RANGES_MAXIMUM_COALESCED_SIZE) if s[1]]
+        for index, (_, length) in enumerate(ranges):
+            if length == 0:
+                results[index] = 0 if buffers is not None else b""
+        if not spans:
+            return results
+
+        if num_threads < 1:
+            num_threads = parallel.RECOMMENDED_NUM_THREADS_PER_TRANSFER
+        num_threads = min(num_threads, len(spans))
+
+        # Balance the work by giving each span, largest first, to the least loaded descriptor.
+        assignments = [[] for _ in range(num_threads)]
+        loads = [0] * num_threads
+        for span in sorted(spans, key=lambda span: -span[1]):
+            least_loaded = loads.index(min(loads))
+            assignments[least_loaded].append(span)
+            loads[least_loaded] += span[1]
+
+        def read_into(raw, offset, buffer):
+            raw.seek(offset, io.SEEK_SET)
+            view = memoryview(buffer).cast("B")
+            total = 0
+            while total < len(view):
+                count = raw.readinto(view[total:])
+                if not count:
+                    break
+                total += count
+            return total
+
+        def read_spans(assigned_spans):
+            with self.open(path, "r", **options) as handle:
+                raw = handle.raw
+                for span_offset, span_length, members in sorted(assigned_spans):
+                    if buffers is not None and len(members) == 1:
+                        # Read a lone range straight into the caller's buffer.
+                        index, offset, length = members[0]
+                        results[index] = read_into(raw, offset, memoryview(buffers[index]).cast("B")[:length])
+                        continue
+                    span_data = bytearray(span_length)
+                    span_data = memoryview(span_data)[: read_into(raw, span_offset, span_data)]
+                    for index, offset, length in members:
+                        piece = span_data[offset - span_offset : offset - span_offset + length]
+                        if buffers is None:
+                            results[index] = bytes(piece)
+                        else:
+                            memoryview(buffers[index]).cast("B")[: len(piece)] = piece
+                            results[index] = len(piece)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for future in [executor.submit(read_spans, assigned) for assigned in assignments]:
+                future.result()
+        return results
+
+    def _can_transfer_single_buffer(self, size, options):
+        """Whether a transfer of this size, with these options, may be done with a single request.  Options
+        only understood by open() (e.g. allow_redirect or read_ahead) rule it out."""
+        if size > SINGLE_BUFFER_TRANSFER_SIZE:
+            return False
+        open_parameters = inspect.signature(self.open).parameters
+        return not any(key in open_parameters for key in options)
+
+    def _get_single_buffer(self, path, **options):
+        """Fetch the content of a data object with one DATA_OBJ_GET_AN request.
+
+        Returns None if the server did not include the content in its reply, as it will not for a data object
+        larger than its single-buffer limit; the descriptor it opened instead is closed.
+        """
+        message_body = FileOpenRequest(
+            objPath=path,
+            createMode=0,
+            openFlags=self.O_RDONLY,
+            offset=0,
+            dataSize=0,
+            numThreads=self.sess.numThreads,
+            oprType=2,  # GET_OPR
+            KeyValPair_PI=StringStringMap(options),
+        )
+        message = iRODSMessage("RODS_API_REQ", msg=message_body, int_info=api_number["DATA_OBJ_GET_AN"])
+        with self.sess.pool.get_connection() as conn:
+            conn.send(message)
+            response = conn.recv()
+            if response.bs or response.int_info == 0:
+                return bytes(response.bs or b"")
+            # The reply holds the descriptor of a server-side portal for a parallel transfer; close it.
+            message = iRODSMessage(
+                "RODS_API_REQ", msg=INT_PI(myInt=response.int_info), int_info=api_number["OPR_COMPLETE_AN"]
+            )
+            conn.send(message)
+            conn.recv()
+        return None
+
+    def _put_single_buffer(self, path, data, checksum_calculator=None, **options):
+        """Create or overwrite a data object with one DATA_OBJ_PUT_AN request carrying its content."""
+        options = dict(options)
+        self._use_default_resource(options)
+        options[kw.DATA_INCLUDED_KW] = ""
+        options.setdefault(kw.OPR_TYPE_KW, 1)  # PUT_OPR
+        if checksum_calculator:
+            options.update(checksum_calculator.close_options(options, len(data)))
+        message_body = FileOpenRequest(
+            objPath=path,
+            createMode=0,
+            openFlags=self.O_WRONLY | self.O_CREAT | self.O_TRUNC,
+            offset=0,
+            dataSize=len(data),
+            numThreads=self.sess.numThreads,
+            oprType=1,  # PUT_OPR
+            KeyValPair_PI=StringStringMap(options),
+        )
+        message = iRODSMessage("RODS_API_REQ", msg=message_body, bs=bytes(data), int_info=api_number["DATA_OBJ_PUT_AN"])
+        with self.sess.pool.get_connection() as conn:
+            conn.send(message)
+            conn.recv()
+        if checksum_calculator:
+            self._check_registered_checksum(path, checksum_calculator, **options)
+
+    def read_bytes(self, path, **options):
+        """
+        Return the content of a data object as a bytes object.
+
+        Small data objects are fetched in a single round trip to the server, after a catalog lookup of their
+        size, with no descriptor opened.  A data object too large for that is read through open() instead.
+
+        Args:
+            path: the logical path of the data object.
+            **options: iRODS keywords selecting the replica, e.g. RESC_NAME_KW or REPL_NUM_KW.
+        """
+        # The size is checked first, since for a large data object the server would set up a parallel transfer
+        # portal instead of replying with the content.  (Uncached, for the sake of changes by other clients.)
+        query = self.sess.query(DataObject.size).filter(
+            Collection.name == irods_dirname(path), DataObject.name == irods_basename(path)
+        )
+        sizes = [row[DataObject.size] for row in query.cache_ttl(0)]
+        if sizes and self._can_transfer_single_buffer(max(sizes), options):
+            data = self._get_single_buffer(path, **options)
+            if data is not None:
+                return data
+        with self.open(path, "r", **options) as f:
+            return f.read()
+
+    @invalidates_queries(DataObject)
+    def write_bytes(self, path, data, checksum=None, **options):
+        """
+        Create, or overwrite, a data object with the given content.
+
+        Content of up to SINGLE_BUFFER_TRANSFER_SIZE bytes is sent with a single request; larger content is
+        written through open() instead.
+
+        Args:
+            path: the logical path of the data object.
+            data: a bytes-like object.
+            checksum: as for put, a checksum computed by the client and registered with the new replica.
+            **options: iRODS keywords for the creation of the data object, e.g. DEST_RESC_NAME_KW.  As for put,
+                FORCE_FLAG_KW allows an existing data object to be overwritten.
+
+        Raises:
+            OVERWRITE_WITHOUT_FORCE_FLAG: if the data object exists and FORCE_FLAG_KW was not given.
+        """
+        self._resolve_force_put_option(options, default_setting=client_config.data_objects.force_put_by_default)
+        algorithms = resolve_algorithms(checksum)
+        checksum_calculator = ChecksumCalculator(algorithms) if algorithms else None
+        if checksum_calculator:
+            checksum_calculator.update(data)
+        if self._can_transfer_single_buffer(len(data), options):
+            # The server refuses to overwrite an existing data object unless FORCE_FLAG_KW is given.
+            self._put_single_buffer(path, data, checksum_calculator, **options)
+            return
+        if kw.FORCE_FLAG_KW not in options and self.exists(path):
+            raise ex.OVERWRITE_WITHOUT_FORCE_FLAG
+        options.pop(kw.FORCE_FLAG_KW, None)
+        options.setdefault(kw.OPR_TYPE_KW, 1)  # PUT_OPR
+        with self.open(path, "w", **options) as f:
+            f.write(data)
+            if checksum_calculator:
+                f.raw.options.update(checksum_calculator.close_options(f.raw.options))
+                resc_hier = self._replica_resc_hier(f.raw)
+        if checksum_calculator:
+            self._check_registered_checksum(path, checksum_calculator, resc_hier, **options)
+
+    def stream(self, path, num_threads=DEFAULT_NUMBER_OF_THREADS, window=0, chunk_size=STREAM_CHUNK_SIZE, **options):
+        """
+        Generate the content of a data object, in order, as a sequence of bytes objects.
+
+        Chunks of the data object are fetched concurrently over up to num_threads connections, and held in
+        a reorder window until they can be yielded in sequence, so that consumers which cannot seek (e.g. a
+        pipe, a decompressor or an HTTP response) benefit from a parallel transfer.
+
+        Args:
+            path: the logical path of the data object.
+            num_threads: the maximum number of descriptors (and threads) used.  The default of
+                DEFAULT_NUMBER_OF_THREADS selects a reasonable number.
+            window: the maximum number of chunks fetched ahead of the consumer, bounding memory use at about
+                window * chunk_size bytes.  If zero, STREAM_WINDOW_CHUNKS_PER_THREAD chunks per thread are allowed.
+            chunk_size: the number of bytes fetched with each read, and so the size of the chunks yielded.
+            **options: keywords for the open() of each descriptor, e.g. RESC_NAME_KW to select a replica.
+
+        The descriptors are closed, and the threads stopped, when the generator is exhausted or closed.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        if num_threads < 1:
+            num_threads = parallel.RECOMMENDED_NUM_THREADS_PER_TRANSFER
+        if window < 1:
+            window = STREAM_WINDOW_CHUNKS_PER_THREAD * num_threads
+
+        handles = [self.open(path, "r", **options)]
+        executor = None
+        condition = threading.Condition()
+        state = {"next": 0, "consumed": 0, "stopped": False, "error": None}
+        ready = {}
+        try:
+            size = handles[0].raw.seek(0, io.SEEK_END)
+            chunk_count = -(-size // chunk_size)
+            num_threads = max(1, min(num_threads, chunk_count))
+            handles += [self.open(path, "r", **options) for _ in range(num_threads - 1)]
+
+            def fetch(raw):
+                try:
+                    while True:
+                        with condition:
+                            # Wait while the next chunk lies beyond the window ahead of the consumer.
+                            while not state["stopped"] and state["next"] >= state["consumed"] + window:
+                                condition.wait()
+                            if state["stopped"] or state["next"] >= chunk_count:
+                                return
+                            index = state["next"]
+                            state["next"] += 1
+                        offset = index * chunk_size
+                        buffer = bytearray(min(chunk_size, size - offset))
+                        raw.seek(offset, io.SEEK_SET)
+                        view = memoryview(buffer)
+                        total = 0
+                        while total < len(view):
+                            count = raw.readinto(view[total:])
+                            if not count:
+                                break
+                            total += count
+                        view.release()
+                        del buffer[total:]
+                        with condition:
+                            ready[index] = bytes(buffer)
+                            condition.notify_all()
+                except BaseException as e:
+                    with condition:
+                        state["error"] = e
+                        condition.notify_all()
+
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+            for handle in handles:
+                executor.submit(fetch, handle.raw)
+
+            for index in range(chunk_count):
+                with condition:
+                    while index not in ready and state["error"] is None:
+                        condition.wait()
+                    if index not in ready:
+                        raise state["error"]
+                    data = ready.pop(index)
+                    state["consumed"] = index + 1
+                    condition.notify_all()
+                if data:
+                    yield data
+        finally:
+            with condition:
+                state["stopped"] = True
+                condition.notify_all()
+            if executor is not None:
+                executor.shutdown(wait=True)
+            for handle in handles:
+                handle.close()
+
+    @staticmethod
+    def _fixed_size_chunks(source, chunk_size):
+        """Generate chunk_size bytearrays (the last possibly shorter) from a readable object or an iterable of
+        bytes-like objects."""
+        if hasattr(source, "readinto") or hasattr(source, "read"):
+            while True:
+                buffer = bytearray(chunk_size)
+                count = 0
+                if hasattr(source, "readinto"):
+                    view = memoryview(buffer)
+                    while count < chunk_size:
+                        n = source.readinto(view[count:])
+                        if not n:
+                            break
+                        count += n
+                    view.release()
+                else:
+                    while count < chunk_size:
+                        data = source.read(chunk_size - count)
+                        if not data:
+                            break
+                        buffer[count : count + len(data)] = data
+                        count += len(data)
+                del buffer[count:]
+                if buffer:
+                    yield buffer
+                if count < chunk_size:
+                    return
+        else:
+            buffer = bytearray()
+            for data in source:
+                buffer += data
+                while len(buffer) >= chunk_size:
+                    yield buffer[:chunk_size]
+                    del buffer[:chunk_size]
+            if buffer:
+                yield buffer
+
+    @invalidates_queries(DataObject)
+    def put_stream(
+        self,
+        source,
+        irods_path,
+        num_threads=DEFAULT_NUMBER_OF_THREADS,
+        window=0,
+        chunk_size=STREAM_CHUNK_SIZE,
+        checksum=None,
+        updatables=(),
+        return_data_object=False,
+        **options,
+    ):
+        """
+        Upload a data object from a source whose length need not be known in advance.
+
+        The source is read, in order, in chunks of chunk_size bytes, which are written concurrently through up to
+        num_threads descriptors open on the same replica, each at the chunk's offset.  The size of the data
+        object is that of the data read, and is registered when the replica is finalized.
+
+        Args:
+            source: an object with a readinto or read method (e.g. a pipe, a socket file or sys.stdin.buffer), or
+                an iterable of bytes-like objects (e.g. a generator).
+            irods_path: the logical path of the data object.
+            num_threads: the maximum number of descriptors (and threads) used.  The default of
+                DEFAULT_NUMBER_OF_THREADS selects a reasonable number.  Data that fits into one chunk is
+                written over a single descriptor.
+            window: the maximum number of chunks read ahead of the writing threads, bounding memory use at about
+                (window + num_threads) * chunk_size bytes.  If zero, STREAM_WINDOW_CHUNKS_PER_THREAD chunks per
+                thread are allowed.  Reading from the source blocks while the window is full.
+            chunk_size: the number of bytes written with each request.
+            checksum: as for put, a checksum computed in flight and registered with the new replica.
+            updatables: as for put, progress bar objects or callables updated with the number of bytes written.
+            return_data_object: if True, return an iRODSDataObject for the new data object.
+            **options: keywords for the creation of the data object, as for put.
+
+        Raises:
+            OVERWRITE_WITHOUT_FORCE_FLAG: if the data object exists and FORCE_FLAG_KW was not given.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        self._resolve_force_put_option(options, default_setting=client_config.data_objects.force_put_by_default)
+        if kw.FORCE_FLAG_KW not in options and self.exists(irods_path):
+            raise ex.OVERWRITE_WITHOUT_FORCE_FLAG
+        options.pop(kw.FORCE_FLAG_KW, None)
+        replica_sort_function = options.pop("replica_sort_function", None)
+        if kw.OPR_TYPE_KW not in options:
+            options[kw.OPR_TYPE_KW] = 1  # PUT_OPR
+
+        if num_threads < 1:
+            num_threads = parallel.RECOMMENDED_NUM_THREADS_PER_TRANSFER
+        if self.sess.server_version < parallel.MINIMUM_SERVER_VERSION:
+            num_threads = 1
+        if window < 1:
+            window = STREAM_WINDOW_CHUNKS_PER_THREAD * num_threads
+        algorithms = resolve_algorithms(checksum)
+        checksum_calculator = ChecksumCalculator(algorithms) if algorithms else None
+
+        chunk_source = self._fixed_size_chunks(source, chunk_size)
+        first_chunks = []
+        # Look ahead by a chunk, so that data of no more than one chunk is written without parallelism.
+        for chunk in chunk_source:
+            first_chunks.append(chunk)
+            if len(first_chunks) > 1 or len(chunk) < chunk_size:
+                break
+        if len(first_chunks) < 2:
+            num_threads = 1
+
+        open_options = dict(options)
+        if num_threads > 1:
+            open_options[kw.NUM_THREADS_KW] = str(num_threads)
+        returned_values = {}
+        handles = [self.open(irods_path, "w", returned_values=returned_values, **open_options)]
+        pending = queue.Queue(maxsize=window)
+        errors = []
+        executor = None
+        try:
+            if num_threads > 1:
+                # Further descriptors write to the same replica, identified by its token and resource hierarchy.
+                (replica_token, resc_hier) = handles[0].raw.replica_access_info()
+                directed_session = returned_values.get("session", self.sess)
+                secondary_options = {
+                    kw.NUM_THREADS_KW: str(num_threads),
+                    kw.RESC_HIER_STR_KW: resc_hier,
+                    kw.REPLICA_TOKEN_KW: replica_token,
+                }
+                if kw.DATA_SIZE_KW in options:
+                    secondary_options[kw.DATA_SIZE_KW] = options[kw.DATA_SIZE_KW]
+                for _ in range(num_threads - 1):
+                    handles.append(
+                        directed_session.data_objects.open(
+                            irods_path,
+                            "a",
+                            create=False,
+                            finalize_on_close=False,
+                            allow_redirect=False,
+                            **secondary_options,
+                        )
+                    )
+
+            def write_chunks(raw):
+                position = None
+                while True:
+                    item = pending.get()
+                    if item is None:
+                        return
+                    if errors:
+                        continue  # - drain the queue, so that the reader is not blocked.
+                    (offset, data) = item
+                    try:
+                        if position != offset:
+                            raw.seek(offset, io.SEEK_SET)
+                        raw.write(memoryview(data))
+                        position = offset + len(data)
+                        do_progress_updates(updatables, len(data))
+                    except BaseException as e:
+                        errors.append(e)
+
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+            workers = [executor.submit(write_chunks, handle.raw) for handle in handles]
+            offset = 0
+            try:
+                for chunk in itertools.chain(first_chunks, chunk_source):
+                    if errors:
+                        break
+                    if checksum_calculator:
+                        checksum_calculator.update(chunk)
+                    pending.put((offset, chunk))
+                    offset += len(chunk)
+            finally:
+                for _ in workers:
+                    pending.put(None)
+                concurrent.futures.wait(workers)
+            if errors:
+                raise errors[0]
+            if checksum_calculator:
+                raw_options = handles[0].raw.options
+                raw_options.update(checksum_calculator.close_options(raw_options, offset))
+                written_resc_hier = self._replica_resc_hier(handles[0].raw)
+            # The initial descriptor is closed last, finalizing the replica.
+            for handle in handles[1:] + handles[:1]:
+                handle.close()
+        except BaseException:
+            # Finalize the replica even though the upload failed, so that it is not left locked.
+            for handle in handles[1:] + handles[:1]:
+                if not handle.closed:
+                    try:
+                        handle.close()
+                    except Exception as e:
+                        logger.warning("Error closing handle during upload of %r: %r", irods_path, e)
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if checksum_calculator:
+            self._check_registered_checksum(irods_path, checksum_calculator, written_resc_hier, **options)
+        if return_data_object:
+            return self.get(irods_path, replica_sort_function=replica_sort_function)
+        return None
+
+    def _block_cached_raw(self, raw, cache, path):
+        """Wrap raw so that reads are served through the cache.
+
+        The cache key is made from the catalog's current record of the replica that was opened, so
+        that blocks cached from earlier versions of the data object are never used.  Replicas that are
+        not good, or that have no checksum and were modified too recently to be told apart from a rewrite
+        in the same second, are read without the cache.
+        """
+        _, resc_hier = raw.replica_access_info()
+        query = self.sess.query(
+            DataObject.modify_time,
+            DataObject.checksum,
+            DataObject.size,
+            DataObject.version,
+            DataObject.replica_status,
+            DataObject.resc_hier,
+        )
+        for row in query.filter(Collection.name == irods_dirname(path), DataObject.name == irods_basename(path)):
+            if row[DataObject.resc_hier] != resc_hier:
+                continue
+            modify_time, checksum = row[DataObject.modify_time], row[DataObject.checksum]
+            recently_modified = time.time() - modify_time.timestamp() < RECENT_MODIFICATION_SECONDS
+            if row[DataObject.replica_status] != "1" or (recently_modified and not checksum):
+                logger.debug("Replica opened for %r may still be changing; reading without the block cache.", path)
+                return raw
+            key = BlockCache.key(
+                self.sess.zone,
+                path,
+                modify_time,
+                checksum,
+                row[DataObject.size],
+                row[DataObject.version],
+                row[DataObject.replica_status],
+            )
+            return iRODSDataObjectCachedRaw(raw, cache, key, row[DataObject.size])
+        logger.warning("Replica opened for %r was not found in the catalog; reading without the block cache.", path)
+        return raw
+
+    @invalidates_queries(DataObject)
     def replica_truncate(self, path, desired_size, **options):
 
         if self.sess.server_version == (4, 3, 2):
@@ -717,6 +1543,7 @@ class DataObjectManager(Manager):
 
         return json.loads(msg.myStr)
 
+    @invalidates_queries(DataObject)
     def trim(self, path, **options):
 
         try:
@@ -740,6 +1567,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject, DataObjectMeta, DataAccess)
     def unlink(self, path, force=False, **options):
         if force:
             options[kw.FORCE_FLAG_KW] = ""
@@ -765,6 +1593,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject, DataObjectMeta, DataAccess)
     def unregister(self, path, **options):
         # https://github.com/irods/irods/blob/4.2.1/lib/api/include/dataObjInpOut.h#L190
         options[kw.OPR_TYPE_KW] = 26  # UNREG_OPR: prevents deletion from disk.
@@ -782,6 +1611,62 @@ class DataObjectManager(Manager):
             return False
         return True
 
+    def get_many(self, paths, replica_sort_function=None, prefetch=()):
+        """Look up many data objects at once.
+
+        The parent collections of the paths are looked up first (see CollectionManager.get_many), and then the data
+        objects, with queries over many collections and names apiece rather than two queries per path.  prefetch
+        may name relations ("metadata" and/or "acls") to be loaded for all of the data objects at once, as by
+        iRODSDataObject.prefetch.
+
+        Returns:
+            a dict mapping each of the given paths at which a data object exists onto an iRODSDataObject.
+        """
+        found = {
+            path: iRODSDataObject(self, parent, rows, replica_sort_function=replica_sort_function)
+            for path, (parent, rows) in self._replica_rows(paths, DataObject).items()
+        }
+        if prefetch:
+            _prefetch.prefetch_data_objects(self.sess, found.values(), prefetch)
+        return found
+
+    def exists_many(self, paths):
+        """Return a dict mapping each of the given paths onto True if a data object exists there, else False."""
+        paths = list(paths)
+        found = self._replica_rows(paths, DataObject.id)
+        return {path: path in found for path in paths}
+
+    def _replica_rows(self, paths, *columns):
+        """Return a dict mapping each of the given paths at which a data object exists onto a pair: its collection,
+        as an iRODSCollection, and the query rows (with the given columns) for its replicas."""
+        paths = list(dict.fromkeys(paths))
+        parents = self.sess.collections.get_many({irods_dirname(path) for path in paths})
+        paths_by_key = {}
+        for path in paths:
+            parent = parents.get(irods_dirname(path))
+            if parent is not None:
+                key = (parent.id, irods_basename(path))
+                paths_by_key.setdefault(path.split("/")[1], {}).setdefault(key, []).append((path, parent))
+
+        found = {}
+        for zone, wanted in paths_by_key.items():
+            for chunk in _batch._chunks(sorted(wanted)):
+                query = (
+                    self.sess
+                    .query(DataObject.collection_id, DataObject.name, *columns)
+                    .filter(_batch._condition(DataObject.collection_id, {coll_id for (coll_id, _) in chunk}))
+                    .filter(_batch._condition(DataObject.name, {name for (_, name) in chunk}))
+                    .add_keyword(kw.ZONE_KW, zone)
+                )
+                if self.sess.ticket__:
+                    query = query.filter(Collection.id != 0)  # As in get(), a join needed when using a ticket.
+                for row in query:
+                    # Rows for other pairings of the collections and names in the chunk are not wanted.
+                    for path, parent in wanted.get((row[DataObject.collection_id], row[DataObject.name]), ()):
+                        found.setdefault(path, (parent, []))[1].append(row)
+        return {path: found[path] for path in paths if path in found}
+
+    @invalidates_queries(DataObject)
     def move(self, src_path, dest_path):
         # check if dest is a collection
         # if so append filename to it
@@ -818,6 +1703,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject)
     def copy(self, src_path, dest_path, **options):
         # check if dest is a collection
         # if so append filename to it
@@ -854,6 +1740,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject)
     def truncate(self, path, size, **options):
         message_body = FileOpenRequest(
             objPath=path,
@@ -875,6 +1762,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject)
     def replicate(self, path, resource=None, **options):
         if resource:
             options[kw.DEST_RESC_NAME_KW] = resource
@@ -899,6 +1787,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject)
     def register(self, file_path, obj_path, **options):
         options[kw.FILE_PATH_KW] = file_path
 
@@ -918,6 +1807,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject)
     def modDataObjMeta(self, data_obj_info, meta_dict, **options):
         if "rescHier" not in data_obj_info and "rescName" not in data_obj_info and "replNum" not in data_obj_info:
             meta_dict["all"] = ""
@@ -980,6 +1870,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
 
+    @invalidates_queries(DataObject)
     def touch(self, path, **options):
         """Change the mtime of a data object.
 
@@ -3,7 +3,9 @@ import copy
 from os.path import dirname, basename
 from typing import Any, Dict
 
-from irods.manager import Manager
+from irods.column import Like
+from irods.manager import Manager, invalidates_queries
+from irods.manager._internal import _batch
 from irods.message import MetadataRequest, iRODSMessage, JSON_Message
 from irods.api_number import api_number
 from irods.models import (
@@ -23,6 +25,10 @@ import irods.keywords as kw
 logger = logging.getLogger(__name__)
 
 
+# The models whose query results are invalidated by a change to the metadata of any kind of object.
+_METADATA_MODELS = (DataObjectMeta, CollectionMeta, ResourceMeta, UserMeta)
+
+
 class InvalidAtomicAVURequest(Exception):
     pass
 
@@ -85,17 +91,36 @@ class MetadataManager(Manager):
             User: "user",
         }[model_cls]
 
+    _meta_models = {
+        DataObject: DataObjectMeta,
+        Collection: CollectionMeta,
+        Resource: ResourceMeta,
+        User: UserMeta,
+    }
+
+    def _meta_columns(self, model):
+        columns = (model.id, model.name, model.value, model.units)
+        if self.use_timestamps:
+            columns += (model.create_time, model.modify_time)
+        return columns
+
+    def _meta_from_row(self, model, row):
+        opts = {"avu_id": row[model.id]}
+        if self.use_timestamps:
+            opts.update(
+                create_time=row[model.create_time],
+                modify_time=row[model.modify_time],
+            )
+        return self._opts['iRODSMeta_type'](None, None, None)._from_column_triple(
+            row[model.name], row[model.value], row[model.units], **opts
+        )
+
     def get(self, model_cls, path):
         if not path:
             # Short circuit.  This should be of the same type as the object returned at the function's end.
             return []
         resource_type = self._model_class_to_resource_type(model_cls)
-        model = {
-            "d": DataObjectMeta,
-            "C": CollectionMeta,
-            "R": ResourceMeta,
-            "u": UserMeta,
-        }[resource_type]
+        model = self._meta_models[model_cls]
         conditions = {
             "d": [Collection.name == dirname(path), DataObject.name == basename(path)],
             "C": [Collection.name == path],
@@ -103,27 +128,76 @@ class MetadataManager(Manager):
             "u": [User.name == path],
         }[resource_type]
 
-        columns = (model.id, model.name, model.value, model.units)
-        if self.use_timestamps:
-            columns += (model.create_time, model.modify_time)
-        results = self.sess.query(*columns).filter(*conditions)._all()
-
-        def meta_opts(row):
-            opts = {"avu_id": row[model.id]}
-            if self.use_timestamps:
-                opts.update(
-                    create_time=row[model.create_time],
-                    modify_time=row[model.modify_time],
-                )
-            return opts
-
-        return [
-            self._opts['iRODSMeta_type'](None, None, None)._from_column_triple(
-                row[model.name], row[model.value], row[model.units], **meta_opts(row)
-            )
-            for row in results
-        ]
+        results = self.sess.query(*self._meta_columns(model)).filter(*conditions)._all()
+        return [self._meta_from_row(model, row) for row in results]
+
+    def get_many(self, model_cls, paths):
+        """Fetch the AVUs of many objects of one kind at once.
+
+        paths are logical paths for data objects and collections, or names for resources and users.  Rather than
+        one query per object, the AVUs are fetched with paged queries over many objects apiece.
 
+        Returns:
+            a dict mapping each of the given paths onto a list of the object's AVUs, as get() would return them.
+        """
+        model = self._meta_models[model_cls]
+        found = {path: [] for path in paths}
+        if model_cls is DataObject:
+            name_columns = (Collection.name, DataObject.name)
+            keys = {(dirname(path), basename(path)): path for path in found if path}
+        else:
+            name_columns = ({Collection: Collection.name, Resource: Resource.name, User: User.name}[model_cls],)
+            keys = {(path,): path for path in found if path}
+
+        for chunk in _batch._chunks(sorted(keys)):
+            conditions = [_batch._condition(column, {key[i] for key in chunk}) for i, column in enumerate(name_columns)]
+            for row in self.sess.query(*(name_columns + self._meta_columns(model))).filter(*conditions):
+                # Rows for other pairings of the collections and names in the chunk are not wanted.
+                path = keys.get(tuple(row[column] for column in name_columns))
+                if path is not None:
+                    found[path].append(self._meta_from_row(model, row))
+        return found
+
+    def get_for_collection_children(self, coll_path, recursive=False):
+        """Fetch the AVUs of the data objects and subcollections in a collection, or with recursive=True, of all
+        those below it, with paged queries over all of the objects of each kind at once.
+
+        Returns:
+            a dict mapping the path of each of these data objects and collections that has AVUs onto a list of them.
+        """
+        coll_path = coll_path.rstrip("/") or "/"
+        prefix = coll_path.rstrip("/") + "/"
+        found = {}
+
+        def below(name):
+            # LIKE matches '_' and '%' in the names themselves as wildcards, so the rows are filtered precisely too.
+            # The root collection is matched by its own prefix, and is its own parent.
+            return name != coll_path and name.startswith(prefix)
+
+        # The collection itself is queried apart from those below it, lest 'path%' match sibling trees too.
+        in_collection = Collection.name == coll_path
+        data_conditions = [in_collection]
+        if recursive:
+            data_conditions.append(Like(Collection.name, prefix + "%"))
+            collection_condition = Like(Collection.name, prefix + "%")
+        else:
+            collection_condition = Collection.parent_name == coll_path
+
+        columns = (Collection.name, DataObject.name) + self._meta_columns(DataObjectMeta)
+        for condition in data_conditions:
+            for row in self.sess.query(*columns).filter(condition):
+                if condition is in_collection or below(row[Collection.name]):
+                    path = row[Collection.name].rstrip("/") + "/" + row[DataObject.name]
+                    found.setdefault(path, []).append(self._meta_from_row(DataObjectMeta, row))
+
+        columns = (Collection.name,) + self._meta_columns(CollectionMeta)
+        for row in self.sess.query(*columns).filter(collection_condition):
+            name = row[Collection.name]
+            if below(name):
+                found.setdefault(name, []).append(self._meta_from_row(CollectionMeta, row))
+        return found
+
+    @invalidates_queries(*_METADATA_MODELS)
     def add(self, model_cls, path, meta, **opts):
 
         resource_type = self._model_class_to_resource_type(model_cls)
@@ -136,6 +210,7 @@ class MetadataManager(Manager):
             response = conn.recv()
         logger.debug(response.int_info)
 
+    @invalidates_queries(*_METADATA_MODELS)
     def remove(self, model_cls, path, meta, **opts):
         resource_type = self._model_class_to_resource_type(model_cls)
         message_body = MetadataRequest(
@@ -147,6 +222,7 @@ class MetadataManager(Manager):
             response = conn.recv()
         logger.debug(response.int_info)
 
+    @invalidates_queries(*_METADATA_MODELS)
     def copy(self, src_model_cls, dest_model_cls, src, dest, **opts):
         src_resource_type = self._model_class_to_resource_type(src_model_cls)
         dest_resource_type = self._model_class_to_resource_type(dest_model_cls)
@@ -160,6 +236,7 @@ class MetadataManager(Manager):
             response = conn.recv()
         logger.debug(response.int_info)
 
+    @invalidates_queries(*_METADATA_MODELS)
     def set(self, model_cls, path, meta, **opts):
         resource_type = self._model_class_to_resource_type(model_cls)
         message_body = MetadataRequest(
@@ -182,6 +259,7 @@ class MetadataManager(Manager):
             opJSON["units"] = op.avu.units
         return opJSON
 
+    @invalidates_queries(*_METADATA_MODELS)
     def apply_atomic_operations(self, model_cls, path, *avu_ops):
         if not all(isinstance(op, AVUOperation) for op in avu_ops):
             raise InvalidAtomicAVURequest("avu_ops must contain 1 or more AVUOperations")
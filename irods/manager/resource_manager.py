@@ -1,5 +1,5 @@
-from irods.models import Resource
-from irods.manager import Manager
+from irods.models import DataObject, Resource
+from irods.manager import Manager, invalidates_queries
 from irods.message import GeneralAdminRequest, iRODSMessage
 from irods.exception import ResourceDoesNotExist, NoResultFound, OperationNotSupported
 from irods.api_number import api_number
@@ -29,6 +29,7 @@ class ResourceManager(Manager):
             raise ResourceDoesNotExist()
         return iRODSResource(self, result)
 
+    @invalidates_queries(Resource)
     def create(
         self,
         name,
@@ -79,6 +80,7 @@ class ResourceManager(Manager):
         logger.debug(response.int_info)
         return self.get(name, zone)
 
+    @invalidates_queries(Resource, DataObject)
     def remove(self, name, test=False):
         if test:
             mode = "--dryrun"
@@ -94,6 +96,7 @@ class ResourceManager(Manager):
             # date resource manager
         logger.debug(response.int_info)
 
+    @invalidates_queries(Resource, DataObject)
     def modify(self, name, attribute, value):
         with self.sess.pool.get_connection() as conn:
             message_body = GeneralAdminRequest("modify", "resource", name, attribute, self.serialize(value))
@@ -110,6 +113,7 @@ class ResourceManager(Manager):
         logger.debug(response.int_info)
         return self.get(name)
 
+    @invalidates_queries(Resource)
     def add_child(self, parent, child, context=""):
         with self.sess.pool.get_connection() as conn:
             # check server version
@@ -132,6 +136,7 @@ class ResourceManager(Manager):
             # date resource manager
         logger.debug(response.int_info)
 
+    @invalidates_queries(Resource)
     def remove_child(self, parent, child):
         with self.sess.pool.get_connection() as conn:
             # check server version
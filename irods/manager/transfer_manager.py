@@ -0,0 +1,308 @@
+import concurrent.futures
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+
+from irods.manager import Manager
+from irods.parallel import RECOMMENDED_NUM_THREADS_PER_TRANSFER, AsyncNotify, BadCallbackTarget
+from irods.transfer_report import TransferReport
+
+# Priorities for scheduled transfers.  Queued interactive transfers are always started before bulk ones.
+INTERACTIVE = 0
+BULK = 1
+
+# Default budget for the number of data streams (each a thread with its own connection) in use at once
+# by all the transfers scheduled through a session.
+DEFAULT_MAX_STREAMS = 16
+
+
+class TransferHandle:
+    """Tracks a transfer scheduled through a session's TransferManager.
+
+    The interface is compatible with irods.parallel.AsyncNotify, i.e. that of the object returned by a
+    NONBLOCKING parallel transfer, and additionally that of a concurrent.futures.Future.
+    """
+
+    def __init__(self, operation, source, destination, priority, requested_streams, callback=None):
+        self.operation = operation
+        self.source = source
+        self.destination = destination
+        self.priority = priority
+        self.requested_streams = requested_streams
+        self.streams = 0  # - the number granted when the transfer is started
+        self.report = TransferReport()
+        self.progress = [0, 0]
+        self._future = concurrent.futures.Future()
+        self._lock = threading.Lock()
+        self.set_transfer_done_callback(callback)
+        self._future.add_done_callback(self._invoke_done_callback)
+
+    def __repr__(self):
+        return "<{}.{} {} {!r} -> {!r} ({})>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            self.operation,
+            self.source,
+            self.destination,
+            self._state(),
+        )
+
+    def _state(self):
+        if self._future.cancelled():
+            return "cancelled"
+        if self._future.done():
+            return "done"
+        return "running" if self.streams else "queued"
+
+    def set_transfer_done_callback(self, callback):
+        """Set a callable to be called, with this handle as the argument, when the transfer succeeds."""
+        if callback is not None and not callable(callback):
+            raise BadCallbackTarget('"callback" must be a callable accepting at least 1 argument')
+        self.done_callback = callback
+
+    def _invoke_done_callback(self, future):
+        callback, self.done_callback = self.done_callback, None
+        if callback is not None and not future.cancelled() and future.exception() is None:
+            callback(self)
+
+    def _update_progress(self, n):
+        with self._lock:
+            self.progress[0] += n
+
+    def wait_until_transfer_done(self, timeout=float("inf"), progressBar=False):
+        """Wait (for at most `timeout' seconds) for the transfer to finish, and return whether it has."""
+        end = time.time() + timeout
+        while not self._future.done():
+            remaining = end - time.time()
+            if remaining <= 0:
+                break
+            try:
+                self._future.exception(timeout=min(0.1, remaining))
+            except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+                pass
+            if progressBar and self.progress[1]:
+                print("  " + AsyncNotify.asciiBar(self.progress) + "\r", end="", file=sys.stderr)
+                sys.stderr.flush()
+        return self._future.done()
+
+    @property
+    def futures(self):
+        return [self._future]
+
+    @property
+    def futures_done(self):
+        if self._future.done() and not self._future.cancelled() and self._future.exception() is None:
+            return {self._future: self.progress[0]}
+        return {}
+
+    # Future-like methods.
+
+    def done(self):
+        return self._future.done()
+
+    def cancelled(self):
+        return self._future.cancelled()
+
+    def cancel(self):
+        """Cancel the transfer if it has not yet been started, returning True if it was cancelled."""
+        return self._future.cancel()
+
+    def result(self, timeout=None):
+        """Wait for the transfer to finish, then return its result or raise the exception it raised."""
+        return self._future.result(timeout)
+
+    def exception(self, timeout=None):
+        return self._future.exception(timeout)
+
+    def add_done_callback(self, fn):
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+class TransferManager(Manager):
+    """Schedules the transfers requested through session.transfers, sharing one bounded pool of worker
+    threads and a budget of data streams among them.
+
+    Transfers are started in order of priority (INTERACTIVE before BULK), and in order of submission
+    within a priority.  Each is granted as many streams as it requests, up to a fair share of the budget
+    among all transfers that are running or waiting, and never more than are free at the time.  A
+    transfer granted a single stream is done without parallelism.
+
+        >>> from irods.manager.transfer_manager import INTERACTIVE
+        >>> handles = [session.transfers.get(path, local_dir) for path in paths]
+        >>> urgent = session.transfers.get(another_path, local_dir, priority=INTERACTIVE)
+        >>> for h in handles + [urgent]:
+        ...     h.result()
+    """
+
+    def _set_manager_session(self, sess):
+        super(TransferManager, self)._set_manager_session(sess)
+        # A cloned session gets a scheduler of its own.
+        self.max_streams = DEFAULT_MAX_STREAMS
+        self._condition = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._running = set()
+        self._streams_in_use = 0
+        self._executor = None
+        # The number of running transfers that use each pool, the current one or one retired by configure().
+        self._executor_transfers = {}
+        self._dispatcher = None
+        self._shutdown = False
+
+    def configure(self, max_streams):
+        """Set the budget of data streams shared by all transfers, taking effect with the next transfer started."""
+        if max_streams < 1:
+            raise ValueError("max_streams must be at least 1.")
+        with self._condition:
+            if self._executor is not None and max_streams > self.max_streams:
+                # Make room in the pool by replacing it.  The transfers already running keep submitting their
+                # streams to the old one, which is shut down only when the last of them is done.
+                self._retire_executor_if_unused(self._executor, replaced=True)
+                self._executor = None
+            self.max_streams = max_streams
+            self._condition.notify_all()
+
+    @property
+    def queued(self):
+        with self._condition:
+            return [entry[2] for entry in sorted(self._queue)]
+
+    @property
+    def running(self):
+        with self._condition:
+            return list(self._running)
+
+    @property
+    def streams_in_use(self):
+        return self._streams_in_use
+
+    def get(self, path, local_path, priority=BULK, num_threads=0, callback=None, **options):
+        """Schedule the download of a data object, as by session.data_objects.get(path, local_path, ...).
+
+        Returns a TransferHandle.
+        """
+        return self._submit("get", path, local_path, priority, num_threads, callback, options)
+
+    def put(self, local_path, irods_path, priority=BULK, num_threads=0, callback=None, **options):
+        """Schedule the upload of a local file, as by session.data_objects.put(local_path, irods_path, ...).
+
+        Returns a TransferHandle.
+        """
+        from irods.manager.data_object_manager import MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE
+
+        size = os.path.getsize(local_path)
+        if size <= MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE:
+            num_threads = 1  # - it will not be done in parallel, so one stream is all it needs.
+        return self._submit("put", local_path, irods_path, priority, num_threads, callback, options, size=size)
+
+    def _submit(self, operation, source, destination, priority, num_threads, callback, options, size=0):
+        if priority not in (INTERACTIVE, BULK):
+            raise ValueError("priority must be INTERACTIVE or BULK.")
+        requested = num_threads if num_threads > 0 else RECOMMENDED_NUM_THREADS_PER_TRANSFER
+        handle = TransferHandle(operation, source, destination, priority, requested, callback=callback)
+        handle.progress[1] = size
+        handle._options = options
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("The transfer manager has been shut down.")
+            # Wake the dispatcher (and any callers of join) when the transfer is done or cancelled.
+            handle.add_done_callback(self._notify)
+            heapq.heappush(self._queue, (handle.priority, next(self._sequence), handle))
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+                self._dispatcher.start()
+            self._condition.notify_all()
+        return handle
+
+    def _notify(self, handle=None):
+        with self._condition:
+            self._condition.notify_all()
+
+    def _dispatch_loop(self):
+        with self._condition:
+            while True:
+                # Drop queued transfers that were cancelled.
+                while self._queue and self._queue[0][2].cancelled():
+                    heapq.heappop(self._queue)
+                if self._shutdown and not self._queue:
+                    return
+                if not self._queue or self._streams_in_use >= self.max_streams:
+                    self._condition.wait()
+                    continue
+                handle = heapq.heappop(self._queue)[2]
+                if not handle._future.set_running_or_notify_cancel():
+                    continue
+                fair_share = max(1, self.max_streams // (len(self._running) + len(self._queue) + 1))
+                handle.streams = min(handle.requested_streams, fair_share, self.max_streams - self._streams_in_use)
+                self._streams_in_use += handle.streams
+                self._running.add(handle)
+                if self._executor is None:
+                    # A parallel transfer's coordinating thread (i.e. the caller of get or put) needs a worker
+                    # in addition to those of its streams, so the pool can hold at most twice the stream budget.
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=2 * self.max_streams, thread_name_prefix="irods-transfer"
+                    )
+                self._executor_transfers[self._executor] = self._executor_transfers.get(self._executor, 0) + 1
+                self._executor.submit(self._run, handle, self._executor)
+
+    def _retire_executor_if_unused(self, executor, replaced=False):
+        """Shut down a pool that has been replaced, once no running transfer uses it.  Called with the lock held."""
+        if (replaced or executor is not self._executor) and not self._executor_transfers.get(executor):
+            self._executor_transfers.pop(executor, None)
+            executor.shutdown(wait=False)
+
+    def _run(self, handle, executor):
+        options = dict(handle._options)
+        updatables = options.get("updatables", ())
+        if not isinstance(updatables, (list, tuple)):
+            updatables = [updatables]
+        options["updatables"] = list(updatables) + [handle._update_progress]
+        options["report"] = handle.report
+        options["num_threads"] = handle.streams
+        options["executor"] = executor
+        try:
+            if handle.operation == "get":
+                self.sess.data_objects.get(handle.source, handle.destination, **options)
+            else:
+                self.sess.data_objects.put(handle.source, handle.destination, **options)
+        except BaseException as e:
+            handle._future.set_exception(e)
+        else:
+            if handle.report.total_bytes:
+                handle.progress[1] = handle.report.total_bytes
+            handle._future.set_result(True)
+        finally:
+            with self._condition:
+                self._running.discard(handle)
+                self._streams_in_use -= handle.streams
+                self._executor_transfers[executor] -= 1
+                self._retire_executor_if_unused(executor)
+                self._condition.notify_all()
+
+    def join(self, timeout=None):
+        """Wait until no transfers are queued or running, returning True if that is so before the timeout."""
+        end = None if timeout is None else time.time() + timeout
+        with self._condition:
+            while self._running or any(not entry[2].cancelled() for entry in self._queue):
+                remaining = None if end is None else end - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def shutdown(self, wait=True, cancel_queued=False):
+        """Stop accepting transfers.  Queued transfers are cancelled if `cancel_queued' is True, and are
+        otherwise still run; if `wait' is True, return only when all have finished."""
+        with self._condition:
+            self._shutdown = True
+            if cancel_queued:
+                for entry in self._queue:
+                    entry[2].cancel()
+            self._condition.notify_all()
+        if wait:
+            self.join()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
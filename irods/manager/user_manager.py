@@ -2,8 +2,8 @@ import logging
 import os
 import warnings
 
-from irods.models import User, Group
-from irods.manager import Manager
+from irods.models import Quota, User, UserAuth, Group
+from irods.manager import Manager, invalidates_queries
 from irods.message import (
     UserAdminRequest,
     GeneralAdminRequest,
@@ -30,13 +30,16 @@ class UserManager(Manager):
     def _get_session(self):
         return self.sess
 
+    @invalidates_queries(Quota)
     def calculate_usage(self):
         return _do_GeneralAdminRequest(self._get_session, "calculate-usage")
 
     # TODO: remove this in branch 2.x (#482)
+    @invalidates_queries(Quota)
     def set_quota(self, user_name, amount, resource="total"):
         return _do_GeneralAdminRequest(self._get_session, "set-quota", "user", user_name, resource, str(amount))
 
+    @invalidates_queries(Quota)
     def remove_quota(self, user_name, resource="total"):
         return _do_GeneralAdminRequest(self._get_session, "set-quota", "user", user_name, resource, "0")
 
@@ -83,6 +86,7 @@ class UserManager(Manager):
             raise UserDoesNotExist()
         return iRODSUser(self, result)
 
+    @invalidates_queries(User)
     def create_remote(self, user_name: str, user_zone: str):
         """
         Create an entry in the local catalog for a remote user.  The user_type will be 'rodsuser'.
@@ -91,6 +95,7 @@ class UserManager(Manager):
             raise ValueError(f"Parameter [{user_zone = }] must be a remote zone.")
         return self.create_with_password(user_name, password='', user_zone=user_zone)
 
+    @invalidates_queries(User)
     def create_with_password(self, user_name: str, password: str, user_zone: str = ""):
         """This method can be used by a groupadmin to initialize the password field while creating the new user.
         (This is necessary since group administrators may not change the password of an existing user.)
@@ -114,6 +119,7 @@ class UserManager(Manager):
         logger.debug(response.int_info)
         return self.get(user_name, user_zone)
 
+    @invalidates_queries(User)
     def create(self, user_name, user_type, user_zone="", auth_str=""):
         message_body = GeneralAdminRequest(
             "add",
@@ -130,6 +136,7 @@ class UserManager(Manager):
         logger.debug(response.int_info)
         return self.get(user_name, user_zone)
 
+    @invalidates_queries()
     def remove(self, user_name, user_zone="", _object=None):
         if _object is None:
             _object = self.get(user_name, user_zone)
@@ -239,6 +246,7 @@ class UserManager(Manager):
 
         logger.debug(response.int_info)
 
+    @invalidates_queries(User, UserAuth)
     def modify(self, user_name, option, new_value, user_zone=""):
 
         # must append zone to username for this API call
@@ -303,6 +311,7 @@ class GroupManager(UserManager):
             return (UserAdminRequest, "USER_ADMIN_AN")
         return (GeneralAdminRequest, "GENERAL_ADMIN_AN")
 
+    @invalidates_queries(User, Group)
     def create(
         self,
         name,
@@ -362,6 +371,7 @@ class GroupManager(UserManager):
         results = self.sess.query(User).filter(User.type != "rodsgroup", Group.name == name)
         return [iRODSUser(self, row) for row in results]
 
+    @invalidates_queries(User, Group)
     def addmember(self, group_name, user_name, user_zone="", group_admin=None, **options):
         (MessageClass, api_key) = self._api_info(group_admin)
 
@@ -372,6 +382,7 @@ class GroupManager(UserManager):
             response = conn.recv()
         logger.debug(response.int_info)
 
+    @invalidates_queries(User, Group)
     def removemember(self, group_name, user_name, user_zone="", group_admin=None, **options):
         (MessageClass, api_key) = self._api_info(group_admin)
 
@@ -382,9 +393,11 @@ class GroupManager(UserManager):
             response = conn.recv()
         logger.debug(response.int_info)
 
+    @invalidates_queries(Quota)
     def remove_quota(self, group_name, resource="total"):
         self.set_quota(group_name, amount=0, resource=resource)
 
+    @invalidates_queries(Quota)
     def set_quota(self, group_name, amount, resource="total"):
         message_body = GeneralAdminRequest("set-quota", "group", group_name, resource, str(amount))
         request = iRODSMessage("RODS_API_REQ", msg=message_body, int_info=api_number["GENERAL_ADMIN_AN"])
@@ -2,7 +2,7 @@ import logging
 
 from irods.models import Zone
 from irods.zone import iRODSZone
-from irods.manager import Manager
+from irods.manager import Manager, invalidates_queries
 from irods.message import GeneralAdminRequest, iRODSMessage
 from irods.api_number import api_number
 from irods.exception import ZoneDoesNotExist, NoResultFound
@@ -20,6 +20,7 @@ class ZoneManager(Manager):
             raise ZoneDoesNotExist()
         return iRODSZone(self, result)
 
+    @invalidates_queries(Zone)
     def create(self, zone_name, zone_type):
         message_body = GeneralAdminRequest(
             "add",
@@ -34,6 +35,7 @@ class ZoneManager(Manager):
         logger.debug(response.int_info)
         return self.get(zone_name)
 
+    @invalidates_queries(Zone)
     def remove(self, zone_name):
         message_body = GeneralAdminRequest("rm", "zone", zone_name)
         request = iRODSMessage("RODS_API_REQ", msg=message_body, int_info=api_number["GENERAL_ADMIN_AN"])
@@ -59,6 +61,7 @@ class ZoneManager(Manager):
         logger.debug(response.int_info)
         return response.get_json_encoded_struct()
 
+    @invalidates_queries(Zone)
     def modify(self, zone_name, attribute, value):
         """Modify a zone attribute."""
         if attribute == "connection":
@@ -429,6 +429,15 @@ class iRODSMessage:
         return msg_header_length + msg_header
 
     def pack(self):
+        leading_part, bs = self.pack_parts()
+        return leading_part + bs
+
+    def pack_parts(self):
+        """Pack the message as a pair: (all that precedes the byte stream, the byte stream).
+
+        This lets a large byte stream (e.g. a memoryview onto a mapped file) be sent as is, rather
+        than first being copied into a single buffer with the header.
+        """
         # pack main message and endcode if needed
         if self.msg:
             main_msg = self.encode_unicode(self.msg.pack())
@@ -442,7 +451,7 @@ class iRODSMessage:
         # pack header
         packed_header = self.pack_header(self.msg_type, len(main_msg), len(self.error), len(self.bs), self.int_info)
 
-        return packed_header + main_msg + self.error + self.bs
+        return packed_header + main_msg + self.error, self.bs
 
     def get_main_message(self, cls, r_error=None):
         msg = cls()
@@ -456,6 +465,13 @@ class iRODSMessage:
                 #   through as usual for express reporting by instances of irods.connection.Connection .
                 message = "Server response was {self.msg} while parsing as [{cls}]".format(**locals())
                 raise self.ResponseNotParseable(message)
+        if cls is GenQueryResponse:
+            from .gen_query_out import decode_gen_query_out
+
+            try:
+                return decode_gen_query_out(self.msg)
+            except ValueError:
+                logger.debug("Falling back to the full parser for a GenQueryOut_PI message.", exc_info=True)
         msg.unpack(ET().fromstring(self.msg))
         return msg
 
@@ -1109,6 +1125,14 @@ class STR_PI(Message):
     myStr = StringProperty()
 
 
+# define INT_PI "int myInt;"
+
+
+class INT_PI(Message):
+    _name = "INT_PI"
+    myInt = IntegerProperty()
+
+
 def DataObjInfo_for_session(session):
 
     class DataObjInfo(Message):
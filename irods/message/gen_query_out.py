@@ -0,0 +1,108 @@
+"""
+A decoder for GenQueryOut_PI messages, the responses to general and specific queries.
+
+Rather than building an element tree of the whole response (an Element for every value of every row)
+and then walking it, the decoder scans the text of the message for the few header fields and for the
+values of each SqlResult_PI, collecting the values of each column into a list.  The values are decoded as
+the parser in use for the thread would decode them (see irods.message.ET): with the entity and line ending
+rules of XML for STANDARD_XML and SECURE_XML, or the entity rules of the iRODS protocol, which depend on the
+server version, for QUASI_XML.
+
+A message in any but the layout sent by the server raises ValueError, in which case it is left to be
+parsed as any other message.
+"""
+
+import re
+
+from . import quasixml
+
+_HEADER_FIELDS = ("rowCnt", "attriCnt", "continueInx", "totalRowCount")
+_COLUMN_FIELDS = ("attriInx", "reslen")
+
+_OPEN_TAG = "<GenQueryOut_PI>"
+_COLUMN_TAG = "<SqlResult_PI>"
+_FIELD = re.compile(r"<(\w+)>([^<]*)</\1>")
+_VALUE = re.compile(r"<value>([^<]*)</value>")
+_ENTITY = re.compile(r"&([^;&<]*)(;?)")
+
+# Joins the values of a column while their entities are decoded; it cannot occur in XML text.
+_SEPARATOR = "\0"
+
+_XML_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+
+# The named entities of XML but &amp;, which is decoded last.
+_XML_REPLACEMENTS = [("&" + name + ";", char) for (name, char) in _XML_ENTITIES.items() if name != "amp"]
+
+
+def _xml_entity(match):
+    (name, semicolon) = match.groups()
+    if semicolon:
+        if name in _XML_ENTITIES:
+            return _XML_ENTITIES[name]
+        if name.startswith("#x"):
+            return chr(int(name[2:], 16))
+        if name.startswith("#"):
+            return chr(int(name[1:], 10))
+    raise ValueError("Undefined or unterminated entity: &{}{}".format(name, semicolon))
+
+
+def _decode_xml_entities(text):
+    if "&#" not in text:
+        decoded = text
+        for entity, char in _XML_REPLACEMENTS:
+            if entity in decoded:
+                decoded = decoded.replace(entity, char)
+        # Unless an ampersand is stray, or begins an undefined entity, all that remain begin &amp;.
+        if decoded.count("&") == decoded.count("&amp;"):
+            return decoded.replace("&amp;", "&")
+    return _ENTITY.sub(_xml_entity, text)
+
+
+def _fields(text, names):
+    found = dict(_FIELD.findall(text))
+    return {name: int(found[name]) if name in found else None for name in names}
+
+
+def decode_gen_query_out(msg, xml_type=None):
+    """Decode the text (bytes or str) of a GenQueryOut_PI message into an irods.message.GenQueryResponse.
+
+    xml_type is an irods.message.XML_Parser_Type; by default, that of the parser in use for the thread.
+    """
+    from . import XML_Parser_Type, GenQueryResponse, GenQueryResponseColumn, current_XML_parser
+
+    if xml_type is None:
+        xml_type = current_XML_parser()
+    text = msg.decode("utf-8") if isinstance(msg, (bytes, bytearray, memoryview)) else msg
+
+    # Constructs such as CDATA sections, processing instructions and empty-element tags are never sent by the
+    # server, and are left to a full parser.
+    if not text.lstrip().startswith(_OPEN_TAG) or "<!" in text or "<?" in text or "/>" in text:
+        raise ValueError("Not in the layout of a GenQueryOut_PI message.")
+
+    if xml_type == XML_Parser_Type.QUASI_XML:
+        decode_entities = quasixml.decode_entities
+    else:
+        decode_entities = _decode_xml_entities
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    sections = text.split(_COLUMN_TAG)
+    columns = []
+    for section in sections[1:]:
+        # The fields of a SqlResult_PI precede its values.
+        first_value = section.find("<value>")
+        fields = _fields(section if first_value < 0 else section[:first_value], _COLUMN_FIELDS)
+        values = raw_values = _VALUE.findall(section)
+        if len(raw_values) != section.count("<value>"):
+            raise ValueError("Malformed value in SqlResult_PI.")
+        if raw_values and "&" in section:
+            # The entities in all values of the column are decoded at once.
+            values = decode_entities(_SEPARATOR.join(raw_values)).split(_SEPARATOR)
+            if len(values) != len(raw_values):
+                raise ValueError("Invalid character in SqlResult_PI value.")
+        if "" in values:
+            # As in an element tree, empty values are None.
+            values = [v or None for v in values]
+        columns.append(GenQueryResponseColumn(value=values, **fields))
+
+    return GenQueryResponse(SqlResult_PI=columns, **_fields(sections[0], _HEADER_FIELDS))
@@ -197,11 +197,16 @@ class iRODSMetaCollection:
         x._reset_metadata()
         return x
 
-    def __init__(self, manager, model_cls, path):
+    def __init__(self, manager, model_cls, path, avus=None):
         self._manager = manager
         self._model_cls = model_cls
         self._path = path
-        self._reset_metadata()
+        self._prefetched = avus is not None
+        if self._prefetched:
+            # AVUs already fetched, as by a prefetch; they are reloaded by the first change made through this object.
+            self._meta = list(avus)
+        else:
+            self._reset_metadata()
 
     def _reset_metadata(self):
         m = self._manager
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import mmap
 import os
 import ssl
 import time
@@ -12,6 +13,7 @@ import multiprocessing
 from typing import List, Union, Any
 import weakref
 
+from irods.checksum import ChecksumCalculator, resolve_algorithms, transferred_replicas, verify_against_replicas
 from irods.data_object import iRODSDataObject
 from irods.exception import DataObjectDoesNotExist
 import irods.keywords as kw
@@ -118,7 +120,9 @@ class AsyncNotify:
     If enabled, the callback function (or callable object) will be triggered
     when all parts of the parallel transfer are complete.  It should accept
     exactly one argument, the irods.parallel.AsyncNotify instance that
-    is calling it.
+    is calling it.  If the transfer completes but fails verification (as
+    against a checksum computed in flight), the callback is not triggered,
+    and the `error' attribute holds the exception.
     """
 
     def set_transfer_done_callback(self, callback):
@@ -127,11 +131,17 @@ class AsyncNotify:
                 raise BadCallbackTarget('"callback" must be a callable accepting at least 1 argument')
         self.done_callback = callback
 
-    def __init__(self, futuresList, callback=None, progress_Queue=None, total=None, keep_=()):
+    def __init__(self, futuresList, callback=None, progress_Queue=None, total=None, keep_=(), verify=None):
         """AsyncNotify initialization (used internally to the io.parallel library).
         The casual user will only be concerned with the callback parameter, called when all threads
         of the parallel PUT or GET have been terminated and the data object closed.
+
+        If not None, `verify' is called once the transfer has completed, before the callback.  An exception
+        it raises (e.g. USER_CHKSUM_MISMATCH for a checksum computed in flight) is kept as the `error'
+        attribute, and the callback is then not called.
         """
+        self.error = None
+        self._verify = verify
         self._futures = set(futuresList)
         self._futures_done = dict()
         self.keep = dict(keep_)
@@ -206,7 +216,16 @@ class AsyncNotify:
                 self.__invoke_futures_done_logic(skip_user_callback=(None in self._futures_done.values()))
 
     def __invoke_futures_done_logic(self, skip_user_callback=False):
+        if self.report:
+            self.report.finish(succeeded=not skip_user_callback)
         try:
+            if not skip_user_callback and self._verify is not None:
+                try:
+                    self._verify()
+                except Exception as e:
+                    logger.warning("Verification of a parallel transfer failed: %r", e)
+                    self.error = e
+                    skip_user_callback = True
             if not skip_user_callback and callable(self.done_callback):
                 self.done_callback(self)
         finally:
@@ -218,6 +237,12 @@ class AsyncNotify:
     def futures(self):
         return list(self._futures)
 
+    @property
+    def report(self):
+        """The irods.transfer_report.TransferReport passed in for the transfer (if any), updated live as it
+        proceeds."""
+        return self.keep.get("report")
+
     @property
     def futures_done(self):
         return dict(self._futures_done)
@@ -278,42 +303,263 @@ def _io_send_bytes_progress(queueObject, item):
 COPY_BUF_SIZE = (1024**2) * 4
 
 
-def _copy_part(src, dst, length, queueObject, debug_info, mgr, updatables=()):
+class _MappedLocalFile:
+    """A local file memory-mapped for the duration of a parallel transfer, and shared among
+    the transfer threads.
+
+    For a GET, the file is created and preallocated to the full size of the data object before
+    being mapped.  Each transfer thread is given its own view onto the map (see `open_view'),
+    and the map is closed when the owner and all views have been closed.
+    """
+
+    def __init__(self, fname, size, writable):
+        """Open and map the file, preallocating it first if it is to be written."""
+        self.__lock = threading.Lock()
+        self.__refs = 1  # - held by the owner, i.e. the code launching the transfer threads.
+        with open(fname, "w+b" if writable else "rb") as f:
+            if writable:
+                _preallocate(f.fileno(), size)
+            self.mapping = mmap.mmap(f.fileno(), size, access=(mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ))
+
+    def open_view(self):
+        with self.__lock:
+            self.__refs += 1
+        return _MappedFileView(self)
+
+    def close(self):
+        with self.__lock:
+            self.__refs -= 1
+            if self.__refs > 0:
+                return
+        try:
+            self.mapping.close()
+        except BufferError:
+            # A slice of the map is still referenced somewhere; the map will be closed once it is collected.
+            pass
+
+
+def _preallocate(fd, size):
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        # Not available on this platform or filesystem; a sparse file of the right size will do.
+        os.ftruncate(fd, size)
+
+
+class _MappedFileView:
+    """A minimal file-like object over a _MappedLocalFile, with its own position.
+
+    read() returns memoryview slices of the map rather than copies, and writable_view() exposes
+    a slice of the map into which a data object may be read directly.
+    """
+
+    def __init__(self, mapped_file):
+        """Take a view of the whole map, starting at offset zero."""
+        self._mapped_file = mapped_file
+        self._view = memoryview(mapped_file.mapping)
+        self._pos = 0
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: len(self._view)}[whence]
+        self._pos = base + offset
+        return self._pos
+
+    def read(self, size):
+        buf = self._view[self._pos : self._pos + size]
+        self._pos += len(buf)
+        return buf
+
+    def writable_view(self, size):
+        return self._view[self._pos : self._pos + size]
+
+    def advance(self, size):
+        self._pos += size
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mapped_file.close()
+
+
+class _SharedBuffer:
+    """A caller's buffer (any object supporting the buffer protocol, e.g. a bytearray, a memoryview, an mmap
+    or a NumPy array), shared among the threads of a parallel transfer in place of a local file.
+
+    Like a _MappedLocalFile, it gives each thread its own _MappedFileView, so that data moves between the
+    buffer and the network without intermediate copies.  The buffer itself is left open.
+    """
+
+    def __init__(self, buffer, writable):
+        """Take a flat, byte-oriented view of the buffer, which must be writable if the transfer is a GET."""
+        self.mapping = memoryview(buffer).cast("B")
+        if writable and self.mapping.readonly:
+            raise TypeError("The target buffer of a parallel get must be writable.")
+
+    def open_view(self):
+        return _MappedFileView(self)
+
+    def close(self):
+        pass
+
+
+class _SharedFileObject:
+    """A caller's seekable file-like object, shared among the threads of a parallel transfer in place of a
+    local file.  Each thread is given its own _SharedFileView; the object itself is left open."""
+
+    def __init__(self, file_object):
+        self.file_object = file_object
+        self.lock = threading.Lock()
+
+    def open_view(self):
+        return _SharedFileView(self)
+
+    def close(self):
+        pass
+
+
+class _SharedFileView:
+    """A file-like object with its own position in a _SharedFileObject.  Each read or write is made at
+    that position, while holding the lock for the underlying object."""
+
+    def __init__(self, shared):
+        self._shared = shared
+        self._pos = 0
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos}[whence]
+        self._pos = base + offset
+        return self._pos
+
+    def read(self, size):
+        with self._shared.lock:
+            self._shared.file_object.seek(self._pos)
+            data = self._shared.file_object.read(size)
+        self._pos += len(data)
+        return data
+
+    def write(self, data):
+        with self._shared.lock:
+            self._shared.file_object.seek(self._pos)
+            self._shared.file_object.write(data)
+        self._pos += len(data)
+        return len(data)
+
+    def close(self):
+        pass
+
+
+def _is_local_path(file_):
+    return isinstance(file_, (str, os.PathLike))
+
+
+def _is_buffer(file_):
+    """Whether an object supports the buffer protocol (as do bytes, bytearray, memoryview and mmap.mmap, the last
+    despite also having the methods of a file)."""
+    try:
+        memoryview(file_).release()
+    except TypeError:
+        return False
+    return True
+
+
+def _shared_local_data(file_, writable):
+    """Wrap a buffer or file-like object given in place of a local filename, for sharing among transfer threads."""
+    if not _is_buffer(file_) and hasattr(file_, "seek") and hasattr(file_, "write" if writable else "read"):
+        return _SharedFileObject(file_)
+    return _SharedBuffer(file_, writable)
+
+
+def _local_data_size(file_):
+    """The size, in bytes, of a local file, buffer, or seekable file-like object."""
+    if _is_local_path(file_):
+        return os.path.getsize(file_)
+    if not _is_buffer(file_) and hasattr(file_, "seek"):
+        position = file_.tell()
+        size = file_.seek(0, os.SEEK_END)
+        file_.seek(position)
+        return size
+    return memoryview(file_).nbytes
+
+
+def _copy_part(src, dst, length, queueObject, debug_info, mgr, updatables=(), checksum=None, stats=None):
     """
     The work-horse for performing the copy between file and data object.
 
     It also helps determine whether there has been a large enough increment of
     bytes to inform the progress bar of a need to update.
+
+    If not None, `checksum' is a (ChecksumCalculator, offset) pair:  the bytes copied
+    are hashed in flight, with the offset locating them within the data object.
+
+    If the local file is memory-mapped, data is read from the data object directly into the
+    map (GET), or written to the data object directly from slices of it (PUT), with no
+    intermediate buffers.
+
+    If not None, `stats' is the irods.transfer_report.StreamStats in which the timing of each
+    chunk, and of the messages exchanged with the server, is recorded.
     """
     from irods.manager.data_object_manager import do_progress_updates
 
-    bytecount = 0
-    accum = 0
-    while True and bytecount < length:
-        if mgr._quit:
-            # Indicate by the return value that we are aborting (this part of) the data transfer.
-            # In the great majority of cases, this should be seen by the application as an overall
-            # abort of the PUT or GET of the requested object.
-            bytecount = None
-            break
-        buf = src.read(min(COPY_BUF_SIZE, length - bytecount))
-        buf_len = len(buf)
-        if 0 == buf_len:
-            break
-        dst.write(buf)
-        bytecount += buf_len
-        accum += buf_len
-        if queueObject and accum and _io_send_bytes_progress(queueObject, accum):
-            accum = 0
-        do_progress_updates(updatables, buf_len)
-        if verboseConnection:
-            print("(" + debug_info + ")", end="", file=sys.stderr)
-            sys.stderr.flush()
-
-    # In a put or get, exactly one of (src,dst) is a file. Find which and close that one first.
+    # In a put or get, exactly one of (src,dst) is a file.
     (file_, obj_) = (src, dst) if dst in mgr else (dst, src)
+    conn = getattr(getattr(obj_, "raw", None), "conn", None) if stats else None
+    if conn:
+        conn.transfer_stats = stats
+    try:
+        offset = stats.offset if stats else 0
+
+        bytecount = 0
+        accum = 0
+        clock = time.perf_counter
+        while True and bytecount < length:
+            if mgr._quit:
+                # Indicate by the return value that we are aborting (this part of) the data transfer.
+                # In the great majority of cases, this should be seen by the application as an overall
+                # abort of the PUT or GET of the requested object.
+                bytecount = None
+                break
+            t0 = clock()
+            if isinstance(dst, _MappedFileView):
+                buf = dst.writable_view(min(COPY_BUF_SIZE, length - bytecount))
+                buf_len = src.readinto(buf)
+                t1 = t2 = clock()
+                if not buf_len:
+                    break
+                buf = buf[:buf_len]
+                dst.advance(buf_len)
+            else:
+                buf = src.read(min(COPY_BUF_SIZE, length - bytecount))
+                t1 = clock()
+                buf_len = len(buf)
+                if 0 == buf_len:
+                    break
+                dst.write(buf)
+                t2 = clock()
+            if checksum:
+                checksum[0].update(buf, checksum[1] + bytecount)
+            if stats:
+                (network, local) = (t1 - t0, t2 - t1) if src is obj_ else (t2 - t1, t1 - t0)
+                stats.add_chunk(offset + bytecount, buf_len, local, network, (clock() - t2) if checksum else 0.0)
+            bytecount += buf_len
+            accum += buf_len
+            if queueObject and accum and _io_send_bytes_progress(queueObject, accum):
+                accum = 0
+            do_progress_updates(updatables, buf_len)
+            if verboseConnection:
+                print("(" + debug_info + ")", end="", file=sys.stderr)
+                sys.stderr.flush()
+
+        buf = None  # - Release any slice of a memory-mapped file, so that the map can be closed.
+    finally:
+        if conn:
+            conn.transfer_stats = None
+    if stats:
+        stats.finish()
+
+    # Close the file first.
     file_.close()
-    mgr.remove_io(obj_)  # 1. closes obj if it is not the mgr's initial descriptor
+    mgr.remove_io(obj_, stats)  # 1. closes obj if it is not the mgr's initial descriptor
     # 2. blocks at barrier until all transfer threads are done copying
     # 3. closes with finalize if obj is mgr's initial descriptor
     return bytecount
@@ -330,8 +576,11 @@ class _Multipart_close_manager:
 
     """
 
-    def __init__(self, initial_io_, exit_barrier_, executor=None):
+    def __init__(self, initial_io_, exit_barrier_, executor=None, close_options=None, report=None, owns_executor=True):
         self._quit = False
+        self.report = report
+        self.owns_executor = owns_executor
+        self.close_options = close_options
         self.exit_barrier = exit_barrier_
         self.initial_io = initial_io_
         self.__lock = threading.Lock()
@@ -348,7 +597,12 @@ class _Multipart_close_manager:
 
     def shutdown(self):
         if self.executor:
-            self.executor.shutdown(cancel_futures=True)
+            if self.owns_executor:
+                self.executor.shutdown(cancel_futures=True)
+            else:
+                # A shared executor is left running for the other transfers using it.
+                for future in self.futures:
+                    future.cancel()
 
     def quit(self):
         from irods.session import _exclude_fds_from_auto_close
@@ -381,23 +635,35 @@ class _Multipart_close_manager:
     # synchronizes all of the parallel threads just before exit, so that we know
     # exactly when to perform a finalizing close on the data object
 
-    def remove_io(self, Io):
+    def remove_io(self, Io, stats=None):
         is_initial = True
+        t0 = time.perf_counter()
         with self.__lock:
             if Io is not self.initial_io:
                 Io.close()
                 self.aux.remove(Io)
                 is_initial = False
+        t1 = time.perf_counter()
         broken = False
         try:
             self.exit_barrier.wait()
         except threading.BrokenBarrierError:
             broken = True
+        if stats:
+            stats.close_seconds += t1 - t0
+            stats.barrier_seconds += time.perf_counter() - t1
         if is_initial and not (broken or self._quit):
             self.finalize()
 
     def finalize(self):
+        # Late-bound keywords (e.g. a checksum computed in flight) for the finalizing close.
+        if self.close_options:
+            raw_options = self.initial_io.raw.options
+            raw_options.update(self.close_options(raw_options))
+        t0 = time.perf_counter()
         self.initial_io.close()
+        if self.report:
+            self.report.finalize_seconds += time.perf_counter() - t0
 
 
 def _io_part(
@@ -409,6 +675,8 @@ def _io_part(
     thread_debug_id="",
     queueObject=None,
     updatables=None,
+    checksum_calculator=None,
+    stats=None,
 ):
     """
     Runs in a separate thread to manage the transfer of a range of bytes within the data object.
@@ -424,10 +692,13 @@ def _io_part(
     file_.seek(offset)
     if thread_debug_id == "":  # for more succinct thread identifiers while debugging.
         thread_debug_id = str(threading.currentThread().ident)
+    checksum = (checksum_calculator, offset) if checksum_calculator else None
+    if stats:
+        stats.start()
     return (
-        _copy_part(file_, objHandle, length, queueObject, thread_debug_id, mgr_, updatables)
+        _copy_part(file_, objHandle, length, queueObject, thread_debug_id, mgr_, updatables, checksum, stats)
         if Operation.isPut()
-        else _copy_part(objHandle, file_, length, queueObject, thread_debug_id, mgr_, updatables)
+        else _copy_part(objHandle, file_, length, queueObject, thread_debug_id, mgr_, updatables, checksum, stats)
     )
 
 
@@ -461,17 +732,43 @@ def _io_multipart_threaded(
     else:
         queueObject = None
 
+    checksum_calculator = extra_options.get("checksum_calculator")
+    close_options = None
+    if checksum_calculator and Operation.isPut():
+        # The checksum is complete only once every thread has passed the exit barrier,
+        # which is when the close manager finalizes the data object.
+        close_options = lambda keywords: checksum_calculator.close_options(keywords, total_size)
+
+    report = extra_options.get("report")
+
+    # A shared executor (see irods.manager.transfer_manager) must have a worker free for every thread of the
+    # transfer, since these wait on each other at the exit barrier.
+    executor = extra_options.get("executor")
+    owns_executor = executor is None
+    if owns_executor:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+
     futures = []
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
     num_threads = min(num_threads, len(ranges))
-    mgr = _Multipart_close_manager(Io, Barrier(num_threads), executor)
+    mgr = _Multipart_close_manager(
+        Io, Barrier(num_threads), executor, close_options=close_options, report=report, owns_executor=owns_executor
+    )
     counter = 1
-    gen_file_handle = lambda: open(fname, Operation.disk_file_mode(initial_open=(counter == 1)))
+    mapped_file = None
+    if not _is_local_path(fname):
+        # A buffer or file-like object, rather than the name of a local file.
+        gen_file_handle = _shared_local_data(fname, writable=Operation.isGet()).open_view
+    elif extra_options.get("memory_map") and total_size > 0:
+        mapped_file = _MappedLocalFile(fname, total_size, writable=Operation.isGet())
+        gen_file_handle = mapped_file.open_view
+    else:
+        gen_file_handle = lambda: open(fname, Operation.disk_file_mode(initial_open=(counter == 1)))
     File = gen_file_handle()
 
     thread_opts = {
         "updatables": extra_options.get("updatables", ()),
         "queueObject": queueObject,
+        "checksum_calculator": checksum_calculator,
     }
 
     transfer_managers[mgr] = (_quit_current_transfer, [id(mgr)])
@@ -480,7 +777,9 @@ def _io_multipart_threaded(
         thread_setup_error = None
 
         for byte_range in ranges:
+            stats = report.new_stream(byte_range.start, len(byte_range)) if report else None
             if Io is None:
+                t0 = time.perf_counter()
                 Io = session.data_objects.open(
                     Data_object.path,
                     Operation.data_object_mode(initial_open=False),
@@ -494,6 +793,8 @@ def _io_multipart_threaded(
                         kw.REPLICA_TOKEN_KW: replica_token,
                     },
                 )
+                if stats:
+                    stats.open_seconds = time.perf_counter() - t0
             mgr.add_io(Io)
             logger.debug("target_host = %s", Io.raw.session.pool.account.host)
             if File is None:
@@ -502,7 +803,15 @@ def _io_multipart_threaded(
                 f = None
                 futures.append(
                     f := executor.submit(
-                        _io_part, Io, byte_range, File, Operation, mgr, thread_debug_id=str(counter), **thread_opts
+                        _io_part,
+                        Io,
+                        byte_range,
+                        File,
+                        Operation,
+                        mgr,
+                        thread_debug_id=str(counter),
+                        stats=stats,
+                        **thread_opts,
                     )
                 )
             except RuntimeError as error:
@@ -518,6 +827,11 @@ def _io_multipart_threaded(
         if thread_setup_error:
             raise thread_setup_error
 
+        if mapped_file:
+            # Leave it to the transfer threads to close their views, and thereby the map.
+            mapped_file.close()
+            mapped_file = None
+
         bytes_transferred = 0
 
         if Operation.isNonBlocking():
@@ -538,6 +852,8 @@ def _io_multipart_threaded(
     except BaseException as e:
         if isinstance(e, (SystemExit, KeyboardInterrupt, RuntimeError)):
             mgr.quit()
+        if mapped_file:
+            mapped_file.close()
         raise
 
 
@@ -551,6 +867,9 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
     """
     The entry point for parallel transfers (multithreaded PUT and GET operations).
 
+    In place of the name of a local file, fname may be a buffer (any object supporting the buffer protocol,
+    writable in the case of a GET) or a seekable file-like object.
+
     Here, we do the following:
     * instantiate the data object, if this has not already been done.
     * determine replica information and the appropriate number of threads.
@@ -564,6 +883,11 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
     if isinstance(Data, tuple):
         (Data, Io) = Data[:2]
 
+    # Metrics are gathered only into a report that the caller supplies.
+    report = kwopt.get("report")
+    if report:
+        report.start("put" if Operation.isPut() else "get", Data if isinstance(Data, str) else Data.path, total_bytes)
+
     if isinstance(Data, str):
         d_path = Data
         try:
@@ -593,6 +917,7 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
         open_options[kw.DATA_SIZE_KW] = str(total_bytes)
 
     output_values = {}
+    t0 = time.perf_counter()
     if not Io:
         (Io, rawfile) = session.data_objects.open_with_FileRaw(
             (d_path or Data.path),
@@ -608,6 +933,8 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
             Io["returned_values"] = output_values
             Io = Io()
         rawfile = Io.raw
+    if report:
+        report.open_seconds += time.perf_counter() - t0
 
     if not output_values:
         output_values = kwopt.get("data_open_returned_values", {})
@@ -626,19 +953,39 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
     if Operation.isGet():
         total_bytes = Io.seek(0, os.SEEK_END)
         Io.seek(0, os.SEEK_SET)
+        if not _is_local_path(fname) and _is_buffer(fname) and memoryview(fname).nbytes < total_bytes:
+            Io.close()
+            raise ValueError("The target buffer is smaller than the data object ({} bytes).".format(total_bytes))
     else:  # isPut
         if total_bytes < 0:
-            with open(fname, "rb") as f:
-                f.seek(0, os.SEEK_END)
-                total_bytes = f.tell()
+            total_bytes = _local_data_size(fname)
+
+    if report:
+        report.total_bytes = total_bytes
 
     # Get necessary info and initiate threaded transfers.
 
+    t0 = time.perf_counter()
     (replica_token, resc_hier) = rawfile.replica_access_info()
+    if report:
+        report.replica_info_seconds += time.perf_counter() - t0
 
     queueLength = kwopt.get("queueLength", 0)
 
-    pass_thru_options = ("updatables", "queueLength")
+    # Hash the transferred bytes in flight, if requested.  A GET is verified against whichever kind of
+    # checksum the catalog holds; for a PUT, the result is handed to the server at the finalizing close.
+    checksum_calculator = None
+    checksum_algorithms = resolve_algorithms(kwopt.get("checksum"), for_verification=Operation.isGet())
+    if checksum_algorithms:
+        checksum_calculator = ChecksumCalculator(checksum_algorithms, local_file=fname)
+
+    memory_map = kwopt.get("memory_map")
+    if memory_map is None:
+        from irods.client_configuration import data_objects as data_objects_config
+
+        memory_map = data_objects_config.parallel_transfers_use_mmap
+
+    pass_thru_options = ("updatables", "queueLength", "executor")
     retval = _io_multipart_threaded(
         Operation,
         (Data, Io),
@@ -648,6 +995,9 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
         fname,
         total_bytes,
         num_threads=num_threads,
+        checksum_calculator=checksum_calculator,
+        memory_map=memory_map,
+        report=report,
         **{k: v for k, v in kwopt.items() if k in pass_thru_options},
     )
 
@@ -655,6 +1005,13 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
     #   - immediately with an AsyncNotify instance, if Oper.NONBLOCKING flag is used.
     #   - upon completion with a boolean completion status, otherwise.
 
+    def verify_checksum():
+        if Operation.isGet():
+            replicas = transferred_replicas(Data.replicas, resc_hier)
+            verify_against_replicas(checksum_calculator.finish(total_bytes), replicas, Data.path)
+        else:
+            session.data_objects._check_registered_checksum(Data.path, checksum_calculator, resc_hier)
+
     if Operation.isNonBlocking():
         (futures, mgr, chunk_notify_queue) = retval
 
@@ -665,11 +1022,17 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
             futures,  # individual futures, one per transfer thread
             progress_Queue=chunk_notify_queue,  # for notifying the progress indicator thread
             total=total_bytes,  # total number of bytes for parallel transfer
-            keep_={"mgr": mgr},  # objects needing to be persisted while futures are pending
+            # objects needing to be persisted while futures are pending (or, as with the checksum, after completion)
+            keep_={"mgr": mgr, "checksum": checksum_calculator, "report": report},
+            verify=(verify_checksum if checksum_calculator else None),
         )
         return async_notify
     else:
         (_bytes_transferred, _bytes_total) = retval
+        if report:
+            report.finish(succeeded=(_bytes_transferred == _bytes_total))
+        if checksum_calculator and _bytes_transferred == _bytes_total:
+            verify_checksum()
         return _bytes_transferred == _bytes_total
 
 
@@ -728,6 +1091,9 @@ if __name__ == "__main__":
     # kwarg options 'N' (num threads) and 'R' (target resource name) are via command-line
     # kwarg['num_threads'] (overrides 'N' when called as a library)
     # kwarg['target_resource_name'] (overrides 'R' when called as a library)
+    # kwarg['checksum'] (True or an algorithm name, to checksum the data in flight)
+    # kwarg['report'] (an irods.transfer_report.TransferReport, filled in with the metrics of the transfer)
+    # kwarg['executor'] (a concurrent.futures.Executor, shared with other transfers, to run the transfer threads)
     if isinstance(ret, AsyncNotify):
         print("waiting on completion...", file=sys.stderr)
         ret.set_transfer_done_callback(lambda r: print("Async transfer done for:", r, file=sys.stderr))
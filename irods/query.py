@@ -1,8 +1,10 @@
 from collections import OrderedDict
+import queue
+import threading
 
 from irods import MAX_SQL_ROWS
-from irods.models import Model
-from irods.column import Column, Column_remover, Keyword
+from irods.models import DataObject, Model
+from irods.column import Between, Column, Column_remover, Keyword
 from irods.message import (
     IntegerIntegerMap,
     IntegerStringMap,
@@ -18,6 +20,7 @@ from irods.message import (
 from irods.api_number import api_number
 from irods.exception import CAT_NO_ROWS_FOUND, MultipleResultsFound, NoResultFound
 from irods.results import ResultSet, SpecificQueryResultSet
+from irods.query_cache import models_of, request_key
 
 query_number = {
     "ORDER_BY": 0x400,
@@ -36,6 +39,9 @@ query_number = {
 
 IRODS_QUERY_LIMIT = 500
 
+# How often, in seconds, a thread prefetching the pages of a query checks whether the caller has stopped.
+PREFETCH_POLL_INTERVAL = 0.1
+
 
 class Query:
     def __init__(self, sess, *args, **kwargs):
@@ -47,6 +53,7 @@ class Query:
         self._offset = 0
         self._continue_index = 0
         self._keywords = {}
+        self._cache_ttl = None
 
         for arg in args:
             if isinstance(arg, type) and issubclass(arg, Model):
@@ -69,6 +76,7 @@ class Query:
         new_q._offset = self._offset
         new_q._continue_index = self._continue_index
         new_q._keywords = self._keywords
+        new_q._cache_ttl = self._cache_ttl
         return new_q
 
     def add_keyword(self, keyword, value=""):
@@ -196,20 +204,55 @@ class Query:
         }
         return GenQueryRequest(**args)
 
+    def cache_ttl(self, seconds):
+        """Set how long, in seconds, the results of this query may be kept in the session's query cache (see
+        irods.query_cache).  Zero prevents the query from using the cache at all."""
+        new_q = self._clone()
+        new_q._cache_ttl = seconds
+        return new_q
+
+    def _query_cache(self):
+        """Return the session's query cache, if it has one and the next page of this query may be taken from it."""
+        cache = getattr(self.sess, "query_cache", None)
+        if cache is None or self._cache_ttl == 0 or self._continue_index != 0 or self._limit == 0:
+            return None
+        return cache
+
     def execute(self):
-        with self.sess.pool.get_connection() as conn:
-            message_body = self._message()
-            message = iRODSMessage("RODS_API_REQ", msg=message_body, int_info=api_number["GEN_QUERY_AN"])
+        return self._execute()
+
+    def _execute(self, conn=None):
+        message_body = self._message()
+        cache = self._query_cache()
+        if cache is not None:
+            key = request_key(self.sess, message_body)
+            results = cache.get(key)
+            if results is not None:
+                return ResultSet(results)
+
+        if conn is None:
+            with self.sess.pool.get_connection() as conn:
+                results = self._request(conn, message_body)
+        else:
+            results = self._request(conn, message_body)
 
-            conn.send(message)
-            try:
-                result_message = conn.recv()
-                results = result_message.get_main_message(GenQueryResponse)
-                result_set = ResultSet(results)
-            except CAT_NO_ROWS_FOUND:
-                result_set = ResultSet(empty_gen_query_out(list(self.columns.keys())))
+        result_set = ResultSet(results)
+        # A result with more pages to come refers to a statement open on one server agent, so is not reusable.
+        if cache is not None and result_set.continue_index == 0:
+            models = models_of(list(self.columns) + [criterion.query_key for criterion in self.criteria])
+            cache.put(key, results, models, ttl=self._cache_ttl)
         return result_set
 
+    def _request(self, conn, message_body):
+        message = iRODSMessage("RODS_API_REQ", msg=message_body, int_info=api_number["GEN_QUERY_AN"])
+
+        conn.send(message)
+        try:
+            result_message = conn.recv()
+            return result_message.get_main_message(GenQueryResponse)
+        except CAT_NO_ROWS_FOUND:
+            return empty_gen_query_out(list(self.columns.keys()))
+
     def close(self):
         """Closes an open query on the server side.
         self._continue_index must be set to a valid value (returned by a previous query API call).
@@ -229,7 +272,16 @@ class Query:
             self.continue_index(result_set.continue_index).close()
         return result_set
 
-    def get_batches(self):
+    def get_batches(self, prefetch=0):
+        """Generate the results of the query as a sequence of ResultSets, one per page.
+
+        If prefetch is positive, up to that many pages are requested ahead of the caller by a background
+        thread, so that the latency of each request overlaps the processing of the pages before it.
+        """
+        if prefetch > 0:
+            yield from self._prefetched_batches(prefetch)
+            return
+
         result_set = self.execute()
 
         try:
@@ -245,14 +297,105 @@ class Query:
             if result_set.continue_index > 0:
                 self.continue_index(result_set.continue_index).close()
 
-    def get_results(self):
-        for result_set in self.get_batches():
+    def _prefetched_batches(self, depth):
+        fetcher = _PageFetcher(self, depth)
+        try:
+            while True:
+                (_, item) = fetcher.pages.get()
+                if item is _PageFetcher.DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            fetcher.stop()
+
+    def _partitions(self, partitions, key):
+        """Split the query into (at most) the given number of queries over disjoint, contiguous ranges of key."""
+        bounds = []
+        for func in ("SELECT_MIN", "SELECT_MAX"):
+            bound_query = self._clone()
+            bound_query.columns = OrderedDict([(key, query_number[func])])
+            result_set = bound_query.execute()
+            value = result_set[0][key] if len(result_set) else None
+            if not isinstance(value, int):
+                return []  # - no rows
+            bounds.append(value)
+        (lowest, highest) = bounds
+        span = highest - lowest + 1
+        edges = sorted(set(lowest + span * i // partitions for i in range(partitions)) | {highest + 1})
+        partition_queries = []
+        for start, end in zip(edges, edges[1:]):
+            partition_query = self._clone()
+            # A new list, since clones share their criteria and filter() would extend them in place.
+            partition_query.criteria = self.criteria + [Between(key, (start, end - 1))]
+            partition_queries.append(partition_query)
+        return partition_queries
+
+    def parallel_iter(self, partitions=4, key=None, ordered=False, prefetch=2):
+        """Generate the rows of the query, running it as concurrent queries over disjoint ranges of an integer column.
+
+        The minimum and maximum of key (by default DataObject.id) among the rows are found first, and the range
+        between them split into the given number of partitions.  The query for each partition is paged through
+        over a connection of its own, in a thread of its own, with up to prefetch pages held ahead of the caller.
+
+        If ordered is False, rows are generated as they arrive from any partition; otherwise all the rows of
+        one partition are generated before those of the next, in ascending order of key range.
+        """
+        if key is None:
+            key = DataObject.id
+        if partitions < 1 or prefetch < 1:
+            raise ValueError("partitions and prefetch must be positive.")
+        partition_queries = self._partitions(partitions, key)
+        shared_pages = None if ordered else queue.Queue(maxsize=prefetch * max(1, len(partition_queries)))
+        fetchers = []
+        try:
+            fetchers = [_PageFetcher(query, prefetch, shared_pages) for query in partition_queries]
+            if ordered:
+                sources = [(fetcher.pages, 1) for fetcher in fetchers]
+            else:
+                sources = [(shared_pages, len(fetchers))] if fetchers else []
+            for pages, remaining in sources:
+                while remaining:
+                    (_, item) = pages.get()
+                    if item is _PageFetcher.DONE:
+                        remaining -= 1
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        yield from item
+        finally:
+            for fetcher in fetchers:
+                fetcher.stopped.set()
+            for fetcher in fetchers:
+                fetcher.stop()
+
+    def get_results(self, prefetch=0):
+        for result_set in self.get_batches(prefetch=prefetch):
             for result in result_set:
                 yield result
 
     def __iter__(self):
         return self.get_results()
 
+    def to_numpy(self):
+        """Return a dict mapping the selected columns onto NumPy arrays of their values (see irods.columnar)."""
+        from irods.columnar import to_numpy
+
+        return to_numpy(self.get_batches())
+
+    def to_pandas(self, dictionary_encode=None):
+        """Return the results as a pandas DataFrame (see irods.columnar)."""
+        from irods.columnar import to_pandas
+
+        return to_pandas(self.get_batches(), dictionary_encode=dictionary_encode)
+
+    def to_arrow(self, dictionary_encode=None):
+        """Return the results as a pyarrow Table (see irods.columnar)."""
+        from irods.columnar import to_arrow
+
+        return to_arrow(self.get_batches(), dictionary_encode=dictionary_encode)
+
     def one(self):
         results = self.execute()
         if results.continue_index > 0:
@@ -278,6 +421,51 @@ class Query:
 #         pass
 
 
+class _PageFetcher:
+    """Requests the pages of a general query in a background thread, up to `depth' pages ahead of the consumer.
+
+    Pages are put into the queue `pages' (which may be shared with other fetchers) as (fetcher, item) pairs,
+    where item is a ResultSet, the exception that ended the query, or finally DONE.
+    """
+
+    DONE = object()
+
+    def __init__(self, query, depth, pages=None):
+        self.pages = queue.Queue(maxsize=depth) if pages is None else pages
+        self.stopped = threading.Event()
+        self._thread = threading.Thread(target=self._fetch, args=(query,), daemon=True)
+        self._thread.start()
+
+    def _hand_over(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.pages.put((self, item), timeout=PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _fetch(self, query):
+        # A continuation must be requested of the same server agent, so one connection is held throughout.
+        try:
+            with query.sess.pool.get_connection() as conn:
+                result_set = query._execute(conn)
+                while self._hand_over(result_set) and result_set.continue_index > 0:
+                    result_set = query.continue_index(result_set.continue_index)._execute(conn)
+                if self.stopped.is_set() and result_set.continue_index > 0:
+                    # The consumer has stopped early; close the query on the server side.
+                    query.continue_index(result_set.continue_index).limit(0)._execute(conn)
+        except BaseException as e:
+            self._hand_over(e)
+        finally:
+            self._hand_over(self.DONE)
+
+    def stop(self):
+        """Stop fetching, and wait for the query to be closed on the server if it was unfinished."""
+        self.stopped.set()
+        self._thread.join()
+
+
 class SpecificQuery:
     def __init__(self, sess, sql=None, alias=None, columns=None, args=None):
         if not sql and not alias:
@@ -333,6 +521,13 @@ class SpecificQuery:
             **sql_args,
         )
 
+        cache = getattr(self.session, "query_cache", None) if self._continue_index == 0 else None
+        if cache is not None:
+            key = request_key(self.session, message_body)
+            results = cache.get(key)
+            if results is not None:
+                return SpecificQueryResultSet(results, self._columns)
+
         request = iRODSMessage("RODS_API_REQ", msg=message_body, int_info=api_number["SPECIFIC_QUERY_AN"])
 
         with self.session.pool.get_connection() as conn:
@@ -340,7 +535,11 @@ class SpecificQuery:
             response = conn.recv()
 
         results = response.get_main_message(GenQueryResponse)
-        return SpecificQueryResultSet(results, self._columns)
+        result_set = SpecificQueryResultSet(results, self._columns)
+        # The tables read by a specific query are not known, so its results are dropped by any invalidation.
+        if cache is not None and result_set.continue_index == 0:
+            cache.put(key, results)
+        return result_set
 
     def __iter__(self):
         return self.get_results()
@@ -0,0 +1,150 @@
+"""
+An optional cache for the results of general (GenQuery) and specific queries.
+
+Assigning a QueryCache to a session's `query_cache' attribute enables it:
+
+    >>> from irods.query_cache import QueryCache
+    >>> from irods.models import Resource, User
+    >>> session.query_cache = QueryCache(max_entries=1000, ttl=5, model_ttls={Resource: 60, User: 30})
+
+Results are keyed by the request sent to the server (i.e. the columns, conditions and keywords of the
+query) together with the server, zone, user and ticket of the session, and are reused until they expire.
+Only queries that are answered in a single page are cached.  The lifetime of a cached result is the
+query's own, if one was set with Query.cache_ttl, and otherwise the least of the TTLs given for the models
+whose columns the query refers to, or failing those, the cache's default TTL.
+
+The managers of the session (session.data_objects, session.metadata, etc.) drop the cached results that
+may be affected by each change they make to the catalog.  Changes made by other clients are not seen
+until the results expire.
+"""
+
+import collections
+import threading
+import time
+
+from irods.models import Model
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# The default lifetime, in seconds, of a cached result.
+DEFAULT_TTL = 5.0
+
+_column_models = {}
+
+
+def _all_models(cls=Model):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_models(subclass)
+
+
+def models_of(columns):
+    """Return the set of model classes (e.g. irods.models.DataObject) to which the given columns belong."""
+    if not _column_models:
+        _column_models.update((col.icat_id, model) for model in _all_models() for col in model._columns)
+    return frozenset(_column_models[col.icat_id] for col in columns if col.icat_id in _column_models)
+
+
+def request_key(session, message_body):
+    """Make a cache key for a query request as sent through the given session."""
+    account = session.pool.account
+    return (
+        account.host,
+        account.port,
+        account.client_zone,
+        account.client_user,
+        account.proxy_user,
+        session.ticket__,
+        type(message_body).__name__,
+        message_body.pack(),
+    )
+
+
+class QueryCache:
+    """A thread-safe, size-bounded LRU cache of query results with per-entry expiry.
+
+    The attributes `hits', `misses', `evictions' (of unexpired entries, to bound the size) and
+    `invalidations' count the events since the cache was made, or last had its statistics reset.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, model_ttls=None):
+        """Make a cache holding at most max_entries results.
+
+        ttl is the default lifetime of a cached result, in seconds; model_ttls may map model classes
+        (e.g. irods.models.Resource) onto lifetimes for the results of queries involving them.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.model_ttls = dict(model_ttls or {})
+        self._entries = collections.OrderedDict()  # key -> (expiry, value, models)
+        self._lock = threading.Lock()
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    @property
+    def statistics(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, models):
+        """The lifetime of a result of a query involving the given models."""
+        ttls = [self.model_ttls[m] for m in models or () if m in self.model_ttls]
+        return min(ttls) if ttls else self.ttl
+
+    def get(self, key):
+        """Return the unexpired value cached under key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value, models=None, ttl=None):
+        """Cache a value.  models is the set of models involved in the query, or None if they are unknown (as
+        for a specific query), in which case the value is dropped by any invalidation."""
+        if ttl is None:
+            ttl = self.ttl_for(models)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value, models)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *models):
+        """Drop the cached results of queries involving any of the given models, or all results if none are given."""
+        models = frozenset(models)
+        with self._lock:
+            stale = [
+                key
+                for key, (_, _, entry_models) in self._entries.items()
+                if not models or entry_models is None or entry_models & models
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        self.invalidate()
@@ -1,17 +1,117 @@
+from irods.column import DateTime, String
 from irods.models import ModelBase
 
 
+def _converter(column_type):
+    """Return a function converting the string form of a column's values into Python objects, or None if the
+    strings are to be kept as they are.  Values that cannot be converted are kept as strings."""
+    to_python = column_type.to_python
+    if to_python is String.to_python:
+        return None
+
+    def convert(value):
+        try:
+            return to_python(value)
+        except (TypeError, ValueError):
+            return value
+
+    if not issubclass(column_type, DateTime):
+        return convert
+
+    # Timestamps repeat often in listings and are costly to convert, so each distinct one is converted once.
+    converted = {}
+
+    def convert_timestamp(value):
+        try:
+            return converted[value]
+        except KeyError:
+            result = converted[value] = convert(value)
+            return result
+
+    return convert_timestamp
+
+
 class ResultSet:
+    """The rows returned for one batch of a general query.
+
+    The values are held as received, one array per column, and converted to Python objects only as rows or
+    columns are accessed; the dict for a row is built when the row is first requested, and the same dict is
+    returned thereafter.  Use column() to fetch all values of one column without building any rows.
+    """
+
     def __init__(self, raw):
         self.length = raw.rowCnt
         col_length = raw.attriCnt
         self.cols = raw.SqlResult_PI[:col_length]
-        self.rows = [self._format_row(i) for i in range(self.length)]
+        self._keys = self._column_keys()
+        self._converters = [_converter(self._column_for_key(i).column_type) for i in range(len(self.cols))]
+        self._converted_columns = {}
+        self._rows = None  # - the row dicts built so far, with None in the place of the others
+        self._all_rows_built = False
         try:
             self.continue_index = raw.continueInx
         except KeyError:
             self.continue_index = 0
 
+    def _column_keys(self):
+        """The keys of the row dicts, in the order of self.cols."""
+        return [ModelBase.columns()[col.attriInx] for col in self.cols]
+
+    def _column_for_key(self, index):
+        return self._keys[index]
+
+    @property
+    def columns(self):
+        """The keys (for a general query, the model columns) of the row dicts, in the order selected."""
+        return list(self._keys)
+
+    def column(self, key, raw=False):
+        """Return a list of the values, converted to Python objects, of one column in all rows.
+
+        key may be a column of the query (e.g. DataObject.size) or the position of a column in self.columns.
+        If raw is True, the values are returned as the strings received from the server.
+        """
+        index = key if isinstance(key, int) else self._index_of(key)
+        if raw:
+            return self.cols[index].value[: self.length]
+        try:
+            return list(self._converted_columns[index])
+        except KeyError:
+            pass
+        values = self.cols[index].value[: self.length]
+        convert = self._converters[index]
+        converted = list(values) if convert is None else [convert(value) for value in values]
+        self._converted_columns[index] = converted
+        return list(converted)
+
+    def _index_of(self, key):
+        for index, candidate in enumerate(self._keys):
+            if type(candidate) is type(key) and candidate == key:
+                return index
+        raise KeyError(key)
+
+    def _value(self, column_index, row_index):
+        converted = self._converted_columns.get(column_index)
+        if converted is not None:
+            return converted[row_index]
+        value = self.cols[column_index].value[row_index]
+        convert = self._converters[column_index]
+        return value if convert is None else convert(value)
+
+    def tuples(self):
+        """Generate the rows as tuples of values, in the order of self.columns."""
+        for index in range(self.length):
+            yield tuple(self._value(i, index) for i in range(len(self.cols)))
+
+    @property
+    def rows(self):
+        """A list of all rows as dicts.  Building it costs a dict per row; prefer iterating, or column()."""
+        if not self._all_rows_built:
+            for index in range(self.length):
+                self._row(index)
+            self._all_rows_built = True
+        return self._rows if self._rows is not None else []
+
     def __str__(self):
         from prettytable import PrettyTable
 
@@ -30,25 +130,28 @@ class ResultSet:
         table.align = "l"
         return table.get_html_string(*args, **kwargs)
 
-    @staticmethod
-    def _format_attribute(attribute_index, value):
-        col = ModelBase.columns()[attribute_index]
-        try:
-            return (col, col.column_type.to_python(value))
-        except (TypeError, ValueError):
-            return (col, value)
-
-    _get_column_values = lambda self, index: [(col, col.value[index]) for col in self.cols]
-
     def _format_row(self, index):
-        values = self._get_column_values(index)
-        return dict([self._format_attribute(col.attriInx, value) for col, value in values])
+        return {key: self._value(i, index) for i, key in enumerate(self._keys)}
+
+    def _row(self, index):
+        if self._rows is None:
+            self._rows = [None] * self.length
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = self._format_row(index)
+        return row
 
     def __getitem__(self, index):
-        return self.rows.__getitem__(index)
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ResultSet index out of range")
+        return self._row(index)
 
     def __iter__(self):
-        return self.rows.__iter__()
+        return (self._row(i) for i in range(self.length))
 
     def __len__(self):
         return self.length
@@ -57,7 +160,7 @@ class ResultSet:
     def has_value(self, value):
         found = False
 
-        for row in self.rows:
+        for row in self:
             if value in list(row.values()):
                 found = True
 
@@ -69,24 +172,13 @@ class SpecificQueryResultSet(ResultSet):
         self._query_columns = columns
         super(SpecificQueryResultSet, self).__init__(raw)
 
-    def _format_row(self, index):
-        values = [col.value[index] for col in self.cols]
-
-        formatted_row = {}
-
-        for i, value in enumerate(values):
-            try:
-                column = self._query_columns[i]
-                result_key = column
-            except TypeError:
-                column = ModelBase.columns()[0]  # SpecificQueryResult.value
-                result_key = i
-
-            try:
-                formatted_value = column.column_type.to_python(value)
-            except (TypeError, ValueError):
-                formatted_value = value
-
-            formatted_row[result_key] = formatted_value
+    def _column_keys(self):
+        # Values are keyed by the columns given for the query, if any, and otherwise by position.
+        try:
+            return [self._query_columns[i] for i in range(len(self.cols))]
+        except TypeError:
+            return list(range(len(self.cols)))
 
-        return formatted_row
+    def _column_for_key(self, index):
+        key = self._keys[index]
+        return ModelBase.columns()[0] if isinstance(key, int) else key  # SpecificQueryResult.value
@@ -25,6 +25,7 @@ from irods.manager.access_manager import AccessManager
 from irods.manager.user_manager import UserManager, GroupManager
 from irods.manager.resource_manager import ResourceManager
 from irods.manager.zone_manager import ZoneManager
+from irods.manager.transfer_manager import TransferManager
 from irods.message import iRODSMessage, STR_PI
 from irods.exception import NetworkException, NotImplementedInIRODSServer
 from irods.password_obfuscation import decode
@@ -40,13 +41,13 @@ _sessions_lock = threading.Lock()
 
 def _exclude_fds_from_auto_close(descriptors: Iterable):
     """Remove all descriptors from consideration for auto_close."""
-    from irods.manager.data_object_manager import ManagedBufferedRandom
+    from irods.manager.data_object_manager import ManagedBufferedIO
 
     with _fds_lock:
         fds: dict[BufferedRandom, Any] = _fds or {}
         for fd in descriptors:
             fds.pop(fd, None)
-            if isinstance(fd, ManagedBufferedRandom):
+            if isinstance(fd, ManagedBufferedIO):
                 fd.do_close = False
 
 
@@ -139,8 +140,11 @@ class iRODSSession:
         self.groups = GroupManager(self)
         self.resources = ResourceManager(self)
         self.zones = ZoneManager(self)
+        self.transfers = TransferManager(self)
         self._auto_cleanup = auto_cleanup
         self.ticket__ = ""
+        # An optional irods.query_cache.QueryCache, shared with clones of this session.
+        self.query_cache = None
         # A mapping for each connection - holds whether the session's assigned ticket has been applied.
         self.ticket_applied = weakref.WeakKeyDictionary()
 
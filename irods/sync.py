@@ -0,0 +1,291 @@
+"""
+Mirror a local directory tree into a collection, or a collection into a local directory.
+
+The remote side of the tree is listed with a single paginated query (rather than a call to
+exists() or get() per data object), compared with a stat() scan of the local side, and only
+the files that differ are transferred, by way of the ordinary put() and get() calls so that
+large files go through the parallel transfer engine.
+"""
+
+import collections
+import logging
+import os
+
+import irods.exception as ex
+import irods.keywords as kw
+from irods.checksum import ChecksumCalculator, algorithm_of
+from irods.column import Like
+from irods.manager.data_object_manager import DEFAULT_NUMBER_OF_THREADS
+from irods.models import Collection, DataObject
+
+logger = logging.getLogger(__name__)
+
+# Ways in which a file and data object of the same relative path may be compared.
+#   "size":      transfer only if the sizes differ.
+#   "mtime":     transfer if the sizes differ, or the source was modified after the destination.
+#   "checksum":  transfer if the sizes differ, or the local file's checksum differs from that
+#                in the catalog.  Falls back to "mtime" if the catalog holds no checksum.
+COMPARISON_MODES = ("size", "mtime", "checksum")
+
+_GOOD_REPLICA = "1"
+
+RemoteEntry = collections.namedtuple("RemoteEntry", ("size", "modify_time", "checksum"))
+LocalEntry = collections.namedtuple("LocalEntry", ("size", "mtime"))
+SyncAction = collections.namedtuple("SyncAction", ("operation", "source", "destination", "size", "reason"))
+
+
+class SyncPlan(list):
+    """The list of SyncAction's needed to bring the destination of a sync up to date.
+
+    Operations are "mkdir" (a local directory or a collection is to be created), "upload", and
+    "download".  Printing the plan gives a human-readable summary, suitable as dry-run output.
+    """
+
+    @property
+    def transfers(self):
+        return [a for a in self if a.operation != "mkdir"]
+
+    @property
+    def total_bytes(self):
+        return sum(a.size for a in self.transfers)
+
+    def __str__(self):
+        lines = []
+        for a in self:
+            if a.operation == "mkdir":
+                lines.append("mkdir     {}".format(a.destination))
+            else:
+                lines.append(
+                    "{:<9} {} -> {} ({} bytes, {})".format(a.operation, a.source, a.destination, a.size, a.reason)
+                )
+        lines.append("{} file(s) to transfer, {} bytes in total".format(len(self.transfers), self.total_bytes))
+        return "\n".join(lines)
+
+
+def _join(parent, relative):
+    return parent.rstrip("/") + "/" + relative if relative else parent
+
+
+def remote_tree(session, coll_path):
+    """List the data objects and subcollections under a collection.
+
+    Returns a (data_objects, collections) pair: a dict mapping the path of each data object
+    (relative to coll_path) onto a RemoteEntry, and a set of relative subcollection paths.
+    When a data object has several replicas, the most recently modified good replica is
+    described, if there is one.
+    """
+    coll_path = coll_path.rstrip("/")
+    prefix = coll_path + "/"
+
+    def relative_path(name):
+        # LIKE matches '_' and '%' in the names themselves as wildcards, so filter precisely here.
+        if name == coll_path:
+            return ""
+        if name.startswith(prefix):
+            return name[len(prefix) :]
+        return None
+
+    collection_names = set()
+    for row in session.query(Collection.name).filter(Like(Collection.name, prefix + "%")):
+        relative = relative_path(row[Collection.name])
+        if relative:
+            collection_names.add(relative)
+
+    data_objects = {}
+    chosen = {}
+    query = session.query(
+        Collection.name,
+        DataObject.name,
+        DataObject.size,
+        DataObject.modify_time,
+        DataObject.checksum,
+        DataObject.replica_status,
+    ).filter(Like(Collection.name, coll_path + "%"))
+    for row in query:
+        relative = relative_path(row[Collection.name])
+        if relative is None:
+            continue
+        path = _join(relative, row[DataObject.name]) if relative else row[DataObject.name]
+        key = (row[DataObject.replica_status] == _GOOD_REPLICA, row[DataObject.modify_time])
+        if path in chosen and chosen[path] >= key:
+            continue
+        chosen[path] = key
+        data_objects[path] = RemoteEntry(row[DataObject.size], row[DataObject.modify_time], row[DataObject.checksum])
+    return data_objects, collection_names
+
+
+def local_tree(local_dir):
+    """List the files and subdirectories under a local directory.
+
+    Returns a (files, directories) pair: a dict mapping the '/'-separated path of each regular
+    file (relative to local_dir) onto a LocalEntry, and a set of relative subdirectory paths.
+    """
+    files = {}
+    directories = set()
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        with os.scandir(os.path.join(local_dir, relative)) as entries:
+            for entry in entries:
+                path = _join(relative, entry.name) if relative else entry.name
+                if entry.is_dir(follow_symlinks=True):
+                    directories.add(path)
+                    pending.append(path)
+                elif entry.is_file(follow_symlinks=True):
+                    st = entry.stat(follow_symlinks=True)
+                    files[path] = LocalEntry(st.st_size, st.st_mtime)
+    return files, directories
+
+
+def _local_checksum(local_path, size, algorithm):
+    # With no data fed in, finish() reads all of the file back from disk to complete the digest.
+    return ChecksumCalculator((algorithm,), local_file=local_path).finish(size)[algorithm]
+
+
+def _reason_to_transfer(local, remote, local_path, compare, upload):
+    """Return why the file and data object differ, or None if they are deemed the same."""
+    if compare not in COMPARISON_MODES:
+        raise ValueError("compare must be one of {}".format(COMPARISON_MODES))
+    if remote is None:
+        return "new"
+    if local is None:
+        return "missing"
+    if local.size != remote.size:
+        return "size differs"
+    if compare == "size":
+        return None
+    if compare == "checksum":
+        algorithm = algorithm_of(remote.checksum)
+        try:
+            if algorithm:
+                return (
+                    None
+                    if _local_checksum(local_path, local.size, algorithm) == remote.checksum
+                    else "checksum differs"
+                )
+        except ValueError:
+            pass  # Not an algorithm the client can compute.
+    # Catalog times have a resolution of one second.
+    remote_mtime = remote.modify_time.timestamp()
+    if upload and int(local.mtime) > remote_mtime:
+        return "local file is newer"
+    if not upload and remote_mtime > int(local.mtime):
+        return "data object is newer"
+    return None
+
+
+def plan_sync_up(session, local_dir, coll_path, compare="mtime"):
+    """Return the SyncPlan for sync_up, without transferring anything."""
+    local_files, local_dirs = local_tree(local_dir)
+    try:
+        session.collections.get(coll_path)
+    except ex.CollectionDoesNotExist:
+        remote_objects, remote_colls = {}, set()
+        plan = SyncPlan([SyncAction("mkdir", None, coll_path, 0, "new")])
+    else:
+        remote_objects, remote_colls = remote_tree(session, coll_path)
+        plan = SyncPlan()
+    for relative in sorted(local_dirs - remote_colls):
+        plan.append(SyncAction("mkdir", None, _join(coll_path, relative), 0, "new"))
+    for relative in sorted(local_files):
+        local_path = os.path.join(local_dir, *relative.split("/"))
+        reason = _reason_to_transfer(
+            local_files[relative], remote_objects.get(relative), local_path, compare, upload=True
+        )
+        if reason:
+            plan.append(
+                SyncAction("upload", local_path, _join(coll_path, relative), local_files[relative].size, reason)
+            )
+    return plan
+
+
+def plan_sync_down(session, coll_path, local_dir, compare="mtime"):
+    """Return the SyncPlan for sync_down, without transferring anything."""
+    session.collections.get(coll_path)  # raises CollectionDoesNotExist, as appropriate
+    remote_objects, remote_colls = remote_tree(session, coll_path)
+    if os.path.isdir(local_dir):
+        local_files, local_dirs = local_tree(local_dir)
+        plan = SyncPlan()
+    else:
+        local_files, local_dirs = {}, set()
+        plan = SyncPlan([SyncAction("mkdir", None, local_dir, 0, "new")])
+    for relative in sorted(remote_colls - local_dirs):
+        plan.append(SyncAction("mkdir", None, os.path.join(local_dir, *relative.split("/")), 0, "new"))
+    for relative in sorted(remote_objects):
+        local_path = os.path.join(local_dir, *relative.split("/"))
+        reason = _reason_to_transfer(
+            local_files.get(relative), remote_objects[relative], local_path, compare, upload=False
+        )
+        if reason:
+            plan.append(
+                SyncAction("download", _join(coll_path, relative), local_path, remote_objects[relative].size, reason)
+            )
+    return plan
+
+
+def sync_up(
+    session, local_dir, coll_path, dry_run=False, compare="mtime", num_threads=DEFAULT_NUMBER_OF_THREADS, **options
+):
+    """Upload the files under local_dir that are new or changed relative to the data objects under coll_path.
+
+    Args:
+        session: the iRODSSession.
+        local_dir: the local directory to be mirrored.
+        coll_path: the collection into which it is mirrored (created if it does not exist).
+        dry_run: if True, only compute and return the plan.
+        compare: one of COMPARISON_MODES, selecting how changes are detected.
+        num_threads: as for session.data_objects.put.
+        **options: further keywords for session.data_objects.put (e.g. checksum=True or kw.DEST_RESC_NAME_KW).
+
+    Returns:
+        The SyncPlan that was (or, for a dry run, would have been) carried out.
+    """
+    plan = plan_sync_up(session, local_dir, coll_path, compare=compare)
+    if dry_run:
+        return plan
+    for action in plan:
+        if action.operation == "mkdir":
+            session.collections.create(action.destination)
+        else:
+            put_options = dict(options)
+            if action.reason != "new":
+                put_options[kw.FORCE_FLAG_KW] = ""
+            logger.debug("uploading %r (%s)", action.source, action.reason)
+            session.data_objects.put(action.source, action.destination, num_threads=num_threads, **put_options)
+    return plan
+
+
+def sync_down(
+    session, coll_path, local_dir, dry_run=False, compare="mtime", num_threads=DEFAULT_NUMBER_OF_THREADS, **options
+):
+    """Download the data objects under coll_path that are new or changed relative to the files under local_dir.
+
+    Each downloaded file has its modification time set to that of the data object, so that
+    subsequent syncs in "mtime" mode see it as up to date.
+
+    Args:
+        session: the iRODSSession.
+        coll_path: the collection to be mirrored.
+        local_dir: the local directory into which it is mirrored (created if it does not exist).
+        dry_run: if True, only compute and return the plan.
+        compare: one of COMPARISON_MODES, selecting how changes are detected.
+        num_threads: as for session.data_objects.get.
+        **options: further keywords for session.data_objects.get (e.g. checksum=True or kw.RESC_NAME_KW).
+
+    Returns:
+        The SyncPlan that was (or, for a dry run, would have been) carried out.
+    """
+    plan = plan_sync_down(session, coll_path, local_dir, compare=compare)
+    if dry_run:
+        return plan
+    for action in plan:
+        if action.operation == "mkdir":
+            os.makedirs(action.destination, exist_ok=True)
+        else:
+            logger.debug("downloading %r (%s)", action.source, action.reason)
+            obj = session.data_objects.get(
+                action.source, action.destination, num_threads=num_threads, **dict(options, **{kw.FORCE_FLAG_KW: ""})
+            )
+            mtime = obj.modify_time.timestamp()
+            os.utime(action.destination, (mtime, mtime))
+    return plan
@@ -7,7 +7,8 @@ import socket
 import shutil
 import unittest
 import time
-from irods.meta import iRODSMetaCollection
+from irods.access import iRODSAccess
+from irods.meta import iRODSMeta, iRODSMetaCollection
 from irods.exception import CollectionDoesNotExist
 from irods.models import Collection, DataObject
 import irods.test.helpers as helpers
@@ -263,6 +264,77 @@ class TestCollection(unittest.TestCase):
         with self.assertRaises(StopIteration):
             next(colls)
 
+    def test_walk_collection_in_single_pass(self):
+        filenames = ["foo", "bar"]
+        for path in ("a", "a/b", "a/b/c", "a_x", "d"):
+            helpers.make_collection(self.sess, self.test_coll_path + "/" + path, filenames)
+        # A sibling whose name begins with that of the walked collection must not be walked.
+        sibling = helpers.make_collection(self.sess, self.test_coll_path + "Z", filenames)
+        helpers.make_object(self.sess, self.test_coll_path + "/top")
+        try:
+
+            def summary(walk):
+                return sorted(
+                    (coll.path, sorted(s.name for s in subcolls), sorted(d.name for d in objs))
+                    for coll, subcolls, objs in walk
+                )
+
+            expected = [(self.test_coll_path, ["a", "a_x", "d"], ["top"])]
+            for path in ("a", "a/b", "a/b/c", "a_x", "d"):
+                subcolls = {"a": ["b"], "a/b": ["c"]}.get(path, [])
+                expected.append((self.test_coll_path + "/" + path, subcolls, sorted(filenames)))
+            self.assertEqual(summary(self.test_coll.walk()), sorted(expected))
+            self.assertEqual(summary(self.test_coll.walk(topdown=False)), sorted(expected))
+            self.assertEqual(summary(self.test_coll.walk(streaming=True)), sorted(expected))
+
+            # Pruning the subcollections in top-down order skips their subtrees.
+            walked = []
+            for coll, subcolls, _ in self.test_coll.walk():
+                walked.append(coll.name)
+                subcolls[:] = [s for s in subcolls if s.name != "a"]
+            self.assertEqual(sorted(walked), ["a_x", "d", "test_dir"])
+        finally:
+            sibling.remove(recurse=True, force=True)
+
+    def test_prefetch_collection_relations(self):
+        for path in ("a", "a_b"):
+            helpers.make_collection(self.sess, self.test_coll_path + "/" + path, ["foo", "bar"])
+        self.sess.metadata.add(Collection, self.test_coll_path + "/a", iRODSMeta("coll_key", "coll_value"))
+        self.sess.metadata.add(DataObject, self.test_coll_path + "/a/foo", iRODSMeta("obj_key", "obj_value"))
+
+        def summary(obj):
+            return (
+                obj.path,
+                sorted((m.name, m.value) for m in obj.metadata.items()),
+                sorted((a.access_name, a.user_name) for a in self.sess.acls.get(obj)),
+            )
+
+        relations = ("data_objects", "subcollections", "metadata", "acls")
+        paths = [self.test_coll_path, self.test_coll_path + "/a"]
+        prefetched = [self.sess.collections.get(path, prefetch=relations) for path in paths]
+        prefetched += self.sess.collections.get_many(paths, prefetch=relations).values()
+        for coll in prefetched:
+            lazy = self.sess.collections.get(coll.path)
+            self.assertEqual(summary(coll), summary(lazy))
+            self.assertEqual(
+                sorted(summary(o) for o in coll.data_objects), sorted(summary(o) for o in lazy.data_objects)
+            )
+            self.assertEqual(
+                sorted(summary(c) for c in coll.subcollections), sorted(summary(c) for c in lazy.subcollections)
+            )
+
+        self.assertEqual(sorted(c.name for c in prefetched[0].subcollections), ["a", "a_b"])
+        self.assertEqual(sorted(o.name for o in prefetched[1].data_objects), ["bar", "foo"])
+
+        foo = self.sess.data_objects.get_many([self.test_coll_path + "/a/foo"], prefetch=("metadata", "acls"))
+        self.assertEqual(summary(foo[self.test_coll_path + "/a/foo"])[1], [("obj_key", "obj_value")])
+
+        # Prefetched ACLs are not reported once ACLs have been changed through the session.
+        self.sess.acls.set(iRODSAccess("read", self.test_coll_path + "/a", "public"))
+        self.assertIn("public", [user_name for _, user_name in summary(prefetched[1])[2]])
+        with self.assertRaises(ValueError):
+            self.test_coll.prefetch("replicas")
+
     def test_collection_metadata(self):
         self.assertIsInstance(self.test_coll.metadata, iRODSMetaCollection)
 
@@ -10,9 +10,11 @@ import io
 import itertools
 import json
 import logging
+import mmap
 import os
 import random
 import re
+import shutil
 import socket
 import stat
 import string
@@ -50,7 +52,7 @@ def is_localhost_synonym(name):
     return localhost_with_optional_domain_pattern.match(name.lower()) or is_localhost_ip(name)
 
 
-from tempfile import NamedTemporaryFile, gettempdir, mktemp
+from tempfile import NamedTemporaryFile, gettempdir, mkdtemp, mktemp
 
 import irods.client_configuration as config
 import irods.exception as ex
@@ -560,12 +562,303 @@ class TestDataObjOps(unittest.TestCase):
                 if Data.exists(dobj_path):
                     Data.unlink(dobj_path, force=True)
 
+    def _checksum_in_flight_round_trip(self, size):
+        Data = self.sess.data_objects
+        dobj_path = "{}/in_flight_checksum_{}".format(self.coll_path, size)
+        content = os.urandom(size)
+        expected = "sha2:" + base64.b64encode(hashlib.sha256(content).digest()).decode("ascii")
+        with NamedTemporaryFile() as f, NamedTemporaryFile() as g:
+            try:
+                f.write(content)
+                f.flush()
+                Data.put(f.name, dobj_path, checksum=True)
+                self.assertEqual(Data.get(dobj_path).replicas[0].checksum, expected)
+                Data.get(dobj_path, g.name, checksum=True, **{kw.FORCE_FLAG_KW: ""})
+                with open(g.name, "rb") as downloaded:
+                    self.assertEqual(downloaded.read(), content)
+            finally:
+                if Data.exists(dobj_path):
+                    Data.unlink(dobj_path, force=True)
+
+    def test_checksum_in_flight__serial_transfer(self):
+        self._checksum_in_flight_round_trip(1024**2)
+
+    def test_checksum_in_flight__parallel_transfer(self):
+        self._checksum_in_flight_round_trip(data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 3 * 1024**2 + 17)
+
+    def test_checksum_in_flight__get_detects_mismatch(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/in_flight_checksum_mismatch".format(self.coll_path)
+        with NamedTemporaryFile() as f, NamedTemporaryFile() as g:
+            try:
+                f.write(b"original content\n")
+                f.flush()
+                Data.put(f.name, dobj_path, checksum=True)
+                # Register a checksum that does not match the content.
+                Data.modDataObjMeta({"objPath": dobj_path, "replNum": 0}, {kw.CHKSUM_KW: "sha2:" + "A" * 43 + "="})
+                with self.assertRaises(ex.USER_CHKSUM_MISMATCH):
+                    Data.get(dobj_path, g.name, checksum=True, **{kw.FORCE_FLAG_KW: ""})
+            finally:
+                if Data.exists(dobj_path):
+                    Data.unlink(dobj_path, force=True)
+
+    def test_checksum_in_flight__get_verifies_the_replica_read(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/in_flight_checksum_replica_read".format(self.coll_path)
+        with self.create_simple_resc() as other_resc, NamedTemporaryFile() as f, NamedTemporaryFile() as g:
+            try:
+                f.write(b"original content\n")
+                f.flush()
+                Data.put(f.name, dobj_path, checksum=True)
+                Data.replicate(dobj_path, **{kw.DEST_RESC_NAME_KW: other_resc})
+                first_resc = Data.get(dobj_path).replicas[0].resource_name
+                bad_checksum = {kw.CHKSUM_KW: "sha2:" + "A" * 43 + "="}
+                Data.modDataObjMeta({"objPath": dobj_path, "rescName": other_resc}, dict(bad_checksum))
+                # A wrong checksum on a replica that was not read does not fail the transfer ...
+                Data.get(dobj_path, g.name, checksum=True, **{kw.FORCE_FLAG_KW: "", kw.RESC_NAME_KW: first_resc})
+                # ... but it does when that replica is the one read.
+                with self.assertRaises(ex.USER_CHKSUM_MISMATCH):
+                    Data.get(dobj_path, g.name, checksum=True, **{kw.FORCE_FLAG_KW: "", kw.RESC_NAME_KW: other_resc})
+            finally:
+                if Data.exists(dobj_path):
+                    Data.unlink(dobj_path, force=True)
+
+    def test_open_with_read_ahead(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/read_ahead_test_object".format(self.coll_path)
+        content = os.urandom(5 * 1024**2 + 1234)
+        try:
+            with Data.open(dobj_path, "w") as f:
+                f.write(content)
+            with Data.open(dobj_path, "r", read_ahead=3, read_ahead_block_size=1024**2) as f:
+                self.assertEqual(f.seek(0, os.SEEK_END), len(content))
+                f.seek(0)
+                self.assertEqual(f.read(), content)
+                # Random access, including seeks inside and outside the read-ahead window.
+                for offset in (4 * 1024**2, 100, 3 * 1024**2 + 7, len(content) - 10):
+                    f.seek(offset)
+                    self.assertEqual(f.read(1000), content[offset : offset + 1000])
+        finally:
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
+    def test_open_with_write_behind(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/write_behind_test_object".format(self.coll_path)
+        lines = ["line {}\n".format(i).encode() for i in range(200000)]
+        try:
+            with Data.open(dobj_path, "w", write_behind=2, write_behind_block_size=256 * 1024) as f:
+                for line in lines:
+                    f.write(line)
+                f.flush()
+                f.write(b"last line\n")
+            with Data.open(dobj_path, "r") as f:
+                self.assertEqual(f.read(), b"".join(lines) + b"last line\n")
+        finally:
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
+    def test_read_bytes_and_write_bytes(self):
+        from irods.manager.data_object_manager import SINGLE_BUFFER_TRANSFER_SIZE
+
+        Data = self.sess.data_objects
+        dobj_path = "{}/single_buffer_test_object".format(self.coll_path)
+        try:
+            # Small content is sent and received in a single request; larger content through a descriptor.
+            for content in (b"", b"hello", os.urandom(SINGLE_BUFFER_TRANSFER_SIZE + 1)):
+                Data.write_bytes(dobj_path, content, checksum=True, **{kw.FORCE_FLAG_KW: ""})
+                self.assertEqual(Data.read_bytes(dobj_path), content)
+                obj = Data.get(dobj_path)
+                self.assertEqual(obj.size, len(content))
+                self.assertTrue(obj.checksum)
+
+            with self.assertRaises(ex.OVERWRITE_WITHOUT_FORCE_FLAG):
+                Data.write_bytes(dobj_path, b"other content")
+
+            # Content beyond the server's own single-buffer limit is read through a descriptor too.
+            content = os.urandom(data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 1)
+            with Data.open(dobj_path, "w") as f:
+                f.write(content)
+            self.assertEqual(Data.read_bytes(dobj_path), content)
+
+            # Small files pass through get and put in the same way.
+            with NamedTemporaryFile(delete=False) as f:
+                f.write(b"small file")
+            try:
+                Data.put(f.name, dobj_path, checksum=True, **{kw.FORCE_FLAG_KW: ""})
+                self.assertEqual(Data.read_bytes(dobj_path), b"small file")
+                os.unlink(f.name)
+                Data.get(dobj_path, f.name, checksum=True)
+                with open(f.name, "rb") as local_file:
+                    self.assertEqual(local_file.read(), b"small file")
+            finally:
+                if os.path.exists(f.name):
+                    os.unlink(f.name)
+        finally:
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
+    def test_single_buffer_transfers_obey_default_resource(self):
+        with self.create_simple_resc() as resc_name:
+            session = self._session_cloned_from_existing(default_resource=resc_name)
+            dobj_path = "{}/single_buffer_default_resc".format(self.coll_path)
+            with NamedTemporaryFile(delete=False) as f:
+                f.write(b"small file")
+            try:
+                session.data_objects.write_bytes(dobj_path, b"content")
+                self.assertEqual([r.resource_name for r in session.data_objects.get(dobj_path).replicas], [resc_name])
+                session.data_objects.unlink(dobj_path, force=True)
+                session.data_objects.put(f.name, dobj_path)
+                self.assertEqual([r.resource_name for r in session.data_objects.get(dobj_path).replicas], [resc_name])
+            finally:
+                os.unlink(f.name)
+                if session.data_objects.exists(dobj_path):
+                    session.data_objects.unlink(dobj_path, force=True)
+                session.cleanup()
+
+    def test_stream(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/stream_test_object".format(self.coll_path)
+        content = os.urandom(10 * 1024**2 + 123)
+        try:
+            with Data.open(dobj_path, "w") as f:
+                f.write(content)
+            for num_threads, window in ((1, 0), (4, 0), (3, 1)):
+                chunks = list(Data.stream(dobj_path, num_threads=num_threads, window=window, chunk_size=1024**2))
+                self.assertEqual(len(chunks), 11)
+                self.assertEqual(b"".join(chunks), content)
+
+            # Abandoning the generator early releases its connections.
+            generator = Data.stream(dobj_path, num_threads=4, chunk_size=1024**2)
+            self.assertEqual(next(generator), content[: 1024**2])
+            generator.close()
+            self.assertEqual(len(self.sess.pool.active), 0)
+        finally:
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
+    def test_put_stream(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/put_stream_test_object".format(self.coll_path)
+        content = os.urandom(10 * 1024**2 + 123)
+        try:
+            sources = (
+                lambda: io.BytesIO(content),
+                lambda: (content[i : i + 100000] for i in range(0, len(content), 100000)),
+            )
+            for make_source in sources:
+                progress = []
+                Data.put_stream(
+                    make_source(),
+                    dobj_path,
+                    num_threads=4,
+                    chunk_size=1024**2,
+                    checksum=True,
+                    updatables=[progress.append],
+                    **{kw.FORCE_FLAG_KW: ""},
+                )
+                obj = Data.get(dobj_path)
+                self.assertEqual(obj.size, len(content))
+                self.assertEqual(sum(progress), len(content))
+                self.assertTrue(obj.checksum)
+                with obj.open("r") as f:
+                    self.assertEqual(f.read(), content)
+
+            # Data fitting into one chunk, including none at all, is uploaded over a single connection.
+            for small in (b"", b"abc"):
+                Data.put_stream(iter([small]), dobj_path, **{kw.FORCE_FLAG_KW: ""})
+                with Data.open(dobj_path, "r") as f:
+                    self.assertEqual(f.read(), small)
+        finally:
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
+    def test_open_with_block_cache(self):
+        from irods.block_cache import RECENT_MODIFICATION_SECONDS, BlockCache
+
+        Data = self.sess.data_objects
+        dobj_path = "{}/block_cache_test_object".format(self.coll_path)
+        cache_dir = mkdtemp()
+        cache = BlockCache(cache_dir, max_bytes=64 * 1024**2, block_size=1024**2)
+        try:
+            content = os.urandom(3 * 1024**2 + 5)
+            with Data.open(dobj_path, "w") as f:
+                f.write(content)
+            # Just modified and without a checksum, the replica could be rewritten without changing its cache key.
+            with Data.open(dobj_path, "r", block_cache=cache) as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(cache.bytes_used, 0)
+            time.sleep(RECENT_MODIFICATION_SECONDS)
+            for _ in range(2):
+                with Data.open(dobj_path, "r", block_cache=cache) as f:
+                    self.assertEqual(f.read(), content)
+            self.assertEqual(cache.bytes_used, len(content))
+
+            # A modified data object must not be served from the blocks cached for its earlier content.
+            time.sleep(1.5)
+            new_content = os.urandom(len(content))
+            with Data.open(dobj_path, "w") as f:
+                f.write(new_content)
+            with Data.open(dobj_path, "r", block_cache=cache) as f:
+                self.assertEqual(f.read(), new_content)
+        finally:
+            shutil.rmtree(cache_dir)
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
+    def test_read_ranges(self):
+        Data = self.sess.data_objects
+        dobj_path = "{}/read_ranges_test_object".format(self.coll_path)
+        content = os.urandom(3 * 1024**2)
+        ranges = [(2 * 1024**2, 100), (0, 10), (5, 10), (len(content) - 5, 50), (1024**2, 0), (1024, 512 * 1024)]
+        expected = [content[offset : offset + length] for offset, length in ranges]
+        try:
+            with Data.open(dobj_path, "w") as f:
+                f.write(content)
+            self.assertEqual(Data.read_ranges(dobj_path, ranges, num_threads=3), expected)
+            buffers = [bytearray(length) for _, length in ranges]
+            counts = Data.read_ranges(dobj_path, ranges, buffers=buffers)
+            self.assertEqual(counts, [len(_) for _ in expected])
+            self.assertEqual([bytes(b[:n]) for b, n in zip(buffers, counts)], expected)
+        finally:
+            if Data.exists(dobj_path):
+                Data.unlink(dobj_path, force=True)
+
     def test_obj_exists(self):
         obj_name = "this_object_will_exist_once_made"
         exists_path = "{}/{}".format(self.coll_path, obj_name)
         helpers.make_object(self.sess, exists_path)
         self.assertTrue(self.sess.data_objects.exists(exists_path))
 
+    def test_get_many_and_exists_many(self):
+        import irods.manager._internal._batch as batch
+
+        subcoll_path = self.coll_path + "/get_many"
+        names = ["obj_{}".format(i) for i in range(12)]
+        helpers.make_collection(self.sess, subcoll_path, names)
+        present = [subcoll_path + "/" + name for name in names]
+        absent = [subcoll_path + "/absent", self.coll_path + "/no_such_collection/obj_0"]
+        old_max_length = batch.IN_CONDITION_MAX_LENGTH
+        try:
+            # Force the lookups to be split among several queries.
+            batch.IN_CONDITION_MAX_LENGTH = 40
+            self.assertEqual(
+                self.sess.data_objects.exists_many(present + absent),
+                dict([(path, True) for path in present] + [(path, False) for path in absent]),
+            )
+            found = self.sess.data_objects.get_many(absent + present)
+            self.assertEqual(list(found), present)
+            for path, data_object in found.items():
+                self.assertEqual(data_object.path, path)
+                self.assertEqual(data_object.id, self.sess.data_objects.get(path).id)
+            self.assertEqual(
+                self.sess.collections.exists_many([subcoll_path, subcoll_path + "/", absent[1]]),
+                {subcoll_path: True, subcoll_path + "/": True, absent[1]: False},
+            )
+        finally:
+            batch.IN_CONDITION_MAX_LENGTH = old_max_length
+            self.sess.collections.remove(subcoll_path, force=True)
+
     def test_obj_does_not_exist(self):
         does_not_exist_name = "this_object_will_never_exist"
         does_not_exist_path = "{}/{}".format(self.coll_path, does_not_exist_name)
@@ -1413,6 +1706,100 @@ class TestDataObjOps(unittest.TestCase):
         # Test put/get with binary file that is large enough to trigger parallel transfers.
         self._check_obj_put_get(data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 1)
 
+    def test_obj_put_get_large_with_memory_mapped_file(self):
+        with config.loadlines(entries=[dict(setting="data_objects.parallel_transfers_use_mmap", value=True)]):
+            self._check_obj_put_get(data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 4099)
+
+    def test_parallel_put_and_get_with_memory_buffers(self):
+        file_size = data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 3
+        obj_path = "{}/parallel_buffer_test_object".format(self.coll_path)
+        content = os.urandom(file_size)
+        Data = self.sess.data_objects
+        try:
+            for source in (content, memoryview(content), io.BytesIO(content)):
+                self.assertTrue(Data.parallel_put(source, obj_path, num_threads=3, checksum=True))
+                self.assertEqual(Data.get(obj_path).size, file_size)
+
+                target = bytearray(file_size)
+                self.assertTrue(Data.parallel_get(obj_path, target, num_threads=3, checksum=True))
+                self.assertEqual(target, content)
+
+                target = io.BytesIO()
+                self.assertTrue(Data.parallel_get(obj_path, target, num_threads=3))
+                self.assertEqual(target.getvalue(), content)
+
+            # An mmap.mmap has file methods but is shared as a buffer, without copying or locking.
+            with mmap.mmap(-1, file_size) as target:
+                self.assertTrue(Data.parallel_get(obj_path, target, num_threads=3))
+                self.assertEqual(target[:], content)
+                self.assertTrue(Data.parallel_put(target, obj_path, num_threads=3))
+                self.assertEqual(Data.get(obj_path).size, file_size)
+
+            with self.assertRaises(ValueError):
+                Data.parallel_get(obj_path, bytearray(file_size - 1), num_threads=3)
+            with mmap.mmap(-1, file_size - 1) as target, self.assertRaises(ValueError):
+                Data.parallel_get(obj_path, target, num_threads=3)
+        finally:
+            if Data.exists(obj_path):
+                Data.unlink(obj_path, force=True)
+
+    def test_checksum_in_flight__nonblocking_parallel_transfers(self):
+        file_size = data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 3
+        obj_path = "{}/nonblocking_checksum_test_object".format(self.coll_path)
+        content = os.urandom(file_size)
+        Data = self.sess.data_objects
+        try:
+            handle = Data.parallel_put(content, obj_path, async_=True, num_threads=3, checksum=True)
+            self.assertTrue(handle.wait_until_transfer_done(timeout=120))
+            self.assertIsNone(handle.error)
+            self.assertTrue(Data.get(obj_path).replicas[0].checksum)
+
+            # A mismatch is surfaced through the returned object.
+            Data.modDataObjMeta({"objPath": obj_path, "replNum": 0}, {kw.CHKSUM_KW: "sha2:" + "A" * 43 + "="})
+            handle = Data.parallel_get(obj_path, bytearray(file_size), async_=True, num_threads=3, checksum=True)
+            self.assertTrue(handle.wait_until_transfer_done(timeout=120))
+            self.assertIsInstance(handle.error, ex.USER_CHKSUM_MISMATCH)
+        finally:
+            if Data.exists(obj_path):
+                Data.unlink(obj_path, force=True)
+
+    def test_parallel_put_and_get_with_transfer_report(self):
+        from irods.transfer_report import TransferReport
+
+        file_size = data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 1
+        obj_path = "{}/transfer_report_test_object".format(self.coll_path)
+        test_file = os.path.join(gettempdir(), "transfer_report_test_file")
+        try:
+            with open(test_file, "wb") as f:
+                f.write(os.urandom(file_size))
+            for operation, transfer in (
+                ("put", lambda report: self.sess.data_objects.put(test_file, obj_path, num_threads=3, report=report)),
+                (
+                    "get",
+                    lambda report: self.sess.data_objects.get(
+                        obj_path, test_file, num_threads=3, report=report, **{kw.FORCE_FLAG_KW: ""}
+                    ),
+                ),
+            ):
+                report = TransferReport()
+                transfer(report)
+                self.assertEqual(report.operation, operation)
+                self.assertTrue(report.succeeded)
+                self.assertEqual(report.bytes_transferred, file_size)
+                self.assertEqual(len(report.streams), 3)
+                self.assertEqual(sum(len(s.chunks) for s in report.streams), len(report.chunks))
+                seconds = report.time_breakdown()
+                self.assertGreater(seconds["send"], 0)
+                self.assertGreater(seconds["reply"], 0)
+                self.assertGreater(seconds["finalize"], 0)
+                self.assertGreater(report.throughput, 0)
+                self.assertIsNotNone(report.latency_percentiles()[50])
+        finally:
+            if os.path.exists(test_file):
+                os.unlink(test_file)
+            if self.sess.data_objects.exists(obj_path):
+                self.sess.data_objects.unlink(obj_path, force=True)
+
     def _check_obj_put_get(self, file_size):
         # Can't do one step open/create with older servers
         if self.sess.server_version <= (4, 1, 4):
@@ -3038,6 +3425,122 @@ class TestDataObjOps(unittest.TestCase):
                     data.unlink(force=True)
 
 
+class TestChecksumCalculator(unittest.TestCase):
+    """Hashing of out-of-order parts, without a server."""
+
+    def test_parts_beyond_the_pending_limit_wait_rather_than_being_dropped(self):
+        from irods.checksum import ChecksumCalculator
+
+        content = os.urandom(64 * 1024)
+        part_size = 1024
+        # Each thread hashes a contiguous range, as do those of a parallel transfer.
+        ranges = [(start, start + len(content) // 4) for start in range(0, len(content), len(content) // 4)]
+        calculator = ChecksumCalculator("sha2", max_pending=4 * part_size, stall_timeout=30)
+
+        def hash_range(start, end):
+            if start == 0:
+                time.sleep(0.2)  # - so that the other threads run ahead
+            for offset in range(start, end, part_size):
+                calculator.update(content[offset : offset + part_size], offset)
+
+        threads = [threading.Thread(target=hash_range, args=r) for r in ranges]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calculator.dropped_bytes, 0)
+        self.assertEqual(calculator.position, len(content))
+        expected = "sha2:" + base64.b64encode(hashlib.sha256(content).digest()).decode("ascii")
+        self.assertEqual(calculator.finish(len(content)), {"sha2": expected})
+
+
+class TestWriteBehind(unittest.TestCase):
+    """Failure handling of write-behind streams, without a server."""
+
+    class FailingRaw(io.RawIOBase):
+        def __init__(self, fail_at_write):
+            super().__init__()
+            self.fail_at_write = fail_at_write
+            self.written = []
+            self.finalize_on_close = True
+
+        def write(self, b):
+            if len(self.written) == self.fail_at_write:
+                raise IOError("injected failure")
+            self.written.append(bytes(b))
+            return len(b)
+
+        def seek(self, offset, whence=io.SEEK_SET):
+            return offset
+
+        def readinto(self, b):
+            return 0
+
+    def test_a_failed_send_is_raised_by_every_later_operation(self):
+        from irods.data_object import iRODSDataObjectWriteBehindRaw
+
+        raw = self.FailingRaw(fail_at_write=1)
+        stream = iRODSDataObjectWriteBehindRaw(raw, blocks=2, block_size=4)
+        stream.write(b"abcd")
+        stream.write(b"efgh")
+        with self.assertRaises(IOError):
+            stream.flush()
+        for operation in (
+            lambda: stream.write(b"ijkl"),
+            stream.flush,
+            lambda: stream.seek(0),
+            lambda: stream.readinto(bytearray(4)),
+        ):
+            with self.assertRaises(IOError):
+                operation()
+        with self.assertRaises(IOError):
+            stream.close()
+        # Nothing after the failure was sent, and the replica was not finalized.
+        self.assertEqual(raw.written, [b"abcd"])
+        self.assertTrue(raw.closed)
+        self.assertFalse(raw.finalize_on_close)
+
+
+class TestBlockCache(unittest.TestCase):
+    """Size bounds and read-only streams of the block cache, without a server."""
+
+    def setUp(self):
+        self.cache_dir = mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_cache_is_walked_only_when_over_its_limit(self):
+        from irods.block_cache import BlockCache
+
+        cache = BlockCache(self.cache_dir, max_bytes=4 * 16, block_size=16)
+        walks = []
+        entries = cache._entries
+        cache._entries = lambda: (walks.append(None), entries())[1]
+        for index in range(4):
+            cache.put("key", index, bytes(16))
+        # Measured at the first put, and within the limit until the fifth.
+        self.assertEqual(len(walks), 1)
+        cache.put("key", 4, bytes(16))
+        self.assertEqual(len(walks), 2)
+        self.assertLessEqual(cache.bytes_used, cache.max_bytes)
+        self.assertIsNone(cache.get("key", 0))
+
+    def test_cached_stream_is_read_only(self):
+        from irods.block_cache import BlockCache, iRODSDataObjectCachedRaw
+
+        content = os.urandom(40)
+        cache = BlockCache(self.cache_dir, block_size=16)
+        raw = iRODSDataObjectCachedRaw(io.BytesIO(content), cache, "key", len(content))
+        self.assertFalse(raw.writable())
+        with io.BufferedReader(raw) as stream:
+            self.assertEqual(stream.read(), content)
+            stream.seek(10)
+            self.assertEqual(stream.read(5), content[10:15])
+            with self.assertRaises(io.UnsupportedOperation):
+                stream.write(b"x")
+
+
 if __name__ == "__main__":
     # let the tests find the parent irods lib
     sys.path.insert(0, os.path.abspath("../.."))
@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import irods.test.helpers as helpers
+
+try:
+    import fsspec
+except ImportError:
+    fsspec = None
+
+
+@unittest.skipIf(fsspec is None, "fsspec is not installed")
+class TestFsspec(unittest.TestCase):
+    def setUp(self):
+        from irods.fsspec import iRODSFileSystem
+
+        self.sess = helpers.make_session()
+        self.coll_path = "/{0.zone}/home/{0.username}/test_fsspec".format(self.sess)
+        self.content = os.urandom(9 * 1024**2 + 17)
+        helpers.make_collection(self.sess, self.coll_path + "/sub", object_names=["small"])
+        with self.sess.data_objects.open(self.coll_path + "/large", "w") as f:
+            f.write(self.content)
+        self.fs = iRODSFileSystem(session=self.sess, skip_instance_cache=True)
+
+    def tearDown(self):
+        self.sess.collections.remove(self.coll_path, recurse=True, force=True)
+        self.sess.cleanup()
+
+    def test_listing(self):
+        self.assertEqual(
+            self.fs.ls("irods:/" + self.coll_path, detail=False), [self.coll_path + "/large", self.coll_path + "/sub"]
+        )
+        self.assertEqual(self.fs.info(self.coll_path + "/large")["size"], len(self.content))
+        self.assertEqual(self.fs.info(self.coll_path + "/sub")["type"], "directory")
+        self.assertEqual(self.fs.find(self.coll_path), [self.coll_path + "/large", self.coll_path + "/sub/small"])
+        with self.assertRaises(FileNotFoundError):
+            self.fs.info(self.coll_path + "/nonexistent")
+
+    def test_reading(self):
+        path = self.coll_path + "/large"
+        with self.fs.open(path, "rb") as f:
+            f.seek(5 * 1024**2)
+            self.assertEqual(f.read(1000), self.content[5 * 1024**2 : 5 * 1024**2 + 1000])
+            f.seek(0)
+            self.assertEqual(f.read(), self.content)
+        self.assertEqual(self.fs.cat_file(path, start=-10), self.content[-10:])
+        self.assertEqual(
+            self.fs.cat_ranges([path, path, self.coll_path + "/sub/small"], [0, 100, 0], [10, 200, None]),
+            [self.content[:10], self.content[100:200], b"blah"],
+        )
+
+    def test_writing(self):
+        path = self.coll_path + "/written"
+        with self.fs.open(path, "wb", block_size=5 * 1024**2) as f:
+            f.write(self.content)
+        self.assertEqual(self.fs.cat_file(path), self.content)
+
+    def test_discarded_write_closes_its_handle(self):
+        path = self.coll_path + "/discarded"
+        with self.fs.open(path, "wb", block_size=1024**2) as f:
+            f.write(self.content)  # - more than a block, so the data object has been opened
+            handle = f._handle
+            self.assertFalse(handle.closed)
+            f.discard()
+            self.assertTrue(handle.closed)
+            self.assertTrue(f.closed)
+
+    def test_transfers_report_progress(self):
+        from fsspec.callbacks import Callback
+
+        local_dir = tempfile.mkdtemp()
+        try:
+            local_path = os.path.join(local_dir, "large")
+            callback = Callback()
+            self.fs.get_file(self.coll_path + "/large", local_path, callback=callback)
+            with open(local_path, "rb") as f:
+                self.assertEqual(f.read(), self.content)
+            self.assertEqual((callback.value, callback.size), (len(self.content), len(self.content)))
+
+            callback = Callback()
+            self.fs.put_file(local_path, self.coll_path + "/uploaded", callback=callback)
+            self.assertEqual(self.fs.cat_file(self.coll_path + "/uploaded"), self.content)
+            self.assertEqual((callback.value, callback.size), (len(self.content), len(self.content)))
+
+            outfile = io.BytesIO()
+            self.fs.get_file(self.coll_path + "/sub/small", None, outfile=outfile)
+            self.assertEqual(outfile.getvalue(), b"blah")
+        finally:
+            shutil.rmtree(local_dir)
+
+
+if __name__ == "__main__":
+    # let the tests find the parent irods lib
+    sys.path.insert(0, os.path.abspath("../.."))
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Compare the times taken to decode a page of general query results (a GenQueryOut_PI message) by parsing it
+into an element tree and unpacking that, and by irods.message.gen_query_out.decode_gen_query_out.
+
+No server is needed.  Run as:
+
+    python -m irods.test.gen_query_out_benchmark [--rows 500] [--columns 20] [--repeat 5]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+import xml.etree.ElementTree as ET_xml
+from html import escape
+
+from irods.message import GenQueryResponse, XML_Parser_Type, quasixml
+from irods.message.gen_query_out import decode_gen_query_out
+
+
+def make_page(rows, columns, encode):
+    """Make the text of a page of results, laid out as by the server (one element per line).  One value in ten
+    holds characters that are encoded as entities."""
+    sql_results = "".join(
+        "<SqlResult_PI>\n<attriInx>{}</attriInx>\n<reslen>1088</reslen>\n{}</SqlResult_PI>\n".format(
+            400 + column,
+            "".join(
+                "<value>{}</value>\n".format(
+                    encode("/tempZone/home/rods/coll_{}/{}_{}".format(column, "R&D" if row % 10 == 0 else "obj", row))
+                )
+                for row in range(rows)
+            ),
+        )
+        for column in range(columns)
+    )
+    return (
+        "<GenQueryOut_PI>\n<rowCnt>{}</rowCnt>\n<attriCnt>{}</attriCnt>\n<continueInx>1</continueInx>\n"
+        "<totalRowCount>0</totalRowCount>\n{}</GenQueryOut_PI>\n".format(rows, columns, sql_results)
+    ).encode("utf-8")
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def unpack_element_tree(parser, page):
+    response = GenQueryResponse()
+    response.unpack(parser.fromstring(page))
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for xml_type, xml_parser, encode in (
+        (XML_Parser_Type.STANDARD_XML, ET_xml, lambda v: escape(v, quote=False)),
+        (XML_Parser_Type.QUASI_XML, quasixml, quasixml.encode_entities),
+    ):
+        page = make_page(args.rows, args.columns, encode)
+        assert decode_gen_query_out(page, xml_type).pack() == unpack_element_tree(xml_parser, page).pack()
+
+        decode_with_tree = lambda: unpack_element_tree(xml_parser, page)
+        decode = lambda: decode_gen_query_out(page, xml_type)
+        tree = min(timeit.repeat(decode_with_tree, number=1, repeat=args.repeat))
+        scan = min(timeit.repeat(decode, number=1, repeat=args.repeat))
+        print(
+            "{}: {} rows x {} columns ({} bytes): element tree {:.2f} ms, decoder {:.2f} ms ({:.1f}x); "
+            "peak memory {:.1f} MiB vs {:.1f} MiB".format(
+                xml_type.name,
+                args.rows,
+                args.columns,
+                len(page),
+                tree * 1e3,
+                scan * 1e3,
+                tree / scan,
+                peak_memory(decode_with_tree) / 2**20,
+                peak_memory(decode) / 2**20,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
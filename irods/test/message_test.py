@@ -20,8 +20,13 @@ from irods.message import (
     GenQueryRequest,
     GenQueryResponseColumn,
     GenQueryResponse,
+    XML_Parser_Type,
 )
+from irods.message import quasixml
+from irods.message.gen_query_out import decode_gen_query_out
 from irods.message.ordered import OrderedProperty
+from html import escape
+import xml.etree.ElementTree as ET_xml
 
 
 class TestMessages(unittest.TestCase):
@@ -206,6 +211,35 @@ class TestMessages(unittest.TestCase):
         self.assertEqual(gqo2.rowCnt, 2)
         self.assertEqual(gqo2.pack(), expected)
 
+    def test_gen_query_out_decoder(self):
+        values = ["plain", "", " spaced ", "a&b<c>'\"`", "crlf\r\nand\rcr", "\u00fc\u00f1\u00ee", "&amp;"]
+        for xml_type, parser, encode in (
+            (XML_Parser_Type.STANDARD_XML, ET_xml, lambda v: escape(v, quote=False)),
+            (XML_Parser_Type.QUASI_XML, quasixml, quasixml.encode_entities),
+        ):
+            columns = "".join(
+                "<SqlResult_PI><attriInx>{}</attriInx><reslen>64</reslen>{}</SqlResult_PI>".format(
+                    attribute, "".join("<value>{}</value>".format(encode(v)) for v in values)
+                )
+                for attribute in (403, 407)
+            )
+            text = (
+                "<GenQueryOut_PI><rowCnt>7</rowCnt><attriCnt>2</attriCnt><continueInx>5</continueInx>"
+                "<totalRowCount>0</totalRowCount>{}</GenQueryOut_PI>\n".format(columns)
+            ).encode("utf-8")
+
+            expected = GenQueryResponse()
+            expected.unpack(parser.fromstring(text))
+            decoded = decode_gen_query_out(text, xml_type)
+            self.assertEqual(decoded.pack(), expected.pack())
+            self.assertEqual(decoded.SqlResult_PI[1].value, expected.SqlResult_PI[1].value)
+            self.assertIsNone(decoded.SqlResult_PI[0].value[1])
+
+        with self.assertRaises(ValueError):
+            decode_gen_query_out(
+                b"<GenQueryOut_PI><rowCnt>1</rowCnt><SqlResult_PI><value/></SqlResult_PI></GenQueryOut_PI>"
+            )
+
     def test_ordered_properties_have_unique_ids(self):
         property1 = OrderedProperty()
         property2 = OrderedProperty()
@@ -129,6 +129,43 @@ class TestMeta(unittest.TestCase):
     create_simple_resc_hierarchy = helpers.create_simple_resc_hierarchy
     create_simple_resc = helpers.create_simple_resc
 
+    def test_get_many_and_get_for_collection_children(self):
+        sub_path = self.coll_path + "/sub"
+        helpers.make_collection(self.sess, sub_path, ["a", "b"])
+        other_path = self.obj_path + "_without_avus"
+        self.sess.data_objects.create(other_path)
+        paths = [self.obj_path, sub_path + "/a", sub_path + "/b"]
+        for i, path in enumerate(paths):
+            self.sess.metadata.set(DataObject, path, iRODSMeta("n", str(i)))
+        self.sess.metadata.add(DataObject, self.obj_path, iRODSMeta("m", "x"))
+        self.sess.metadata.set(Collection, sub_path, iRODSMeta("c", "1"))
+
+        def as_triples(avus_by_path):
+            return {path: sorted((m.name, m.value) for m in avus) for path, avus in avus_by_path.items()}
+
+        expected = {path: [("n", str(i))] for i, path in enumerate(paths)}
+        expected[self.obj_path].insert(0, ("m", "x"))
+        self.assertEqual(
+            as_triples(self.sess.metadata.get_many(DataObject, paths + [other_path])),
+            dict(expected, **{other_path: []}),
+        )
+        self.assertEqual(as_triples(self.sess.metadata.get_many(Collection, [sub_path])), {sub_path: [("c", "1")]})
+
+        self.assertEqual(
+            as_triples(self.sess.metadata.get_for_collection_children(self.coll_path)),
+            {self.obj_path: expected[self.obj_path], sub_path: [("c", "1")]},
+        )
+        # A sibling whose name begins with that of the collection must not be listed.
+        sibling = helpers.make_collection(self.sess, self.coll_path + "Z", ["s"])
+        try:
+            self.sess.metadata.set(DataObject, sibling.path + "/s", iRODSMeta("n", "sibling"))
+            self.assertEqual(
+                as_triples(self.sess.metadata.get_for_collection_children(self.coll_path, recursive=True)),
+                dict(expected, **{sub_path: [("c", "1")]}),
+            )
+        finally:
+            sibling.remove(recurse=True, force=True)
+
     def test_replica_truncate_json_error__issue_606(self):
         path = self.coll_path + "/atomic_meta_issue_606"
         obj = self.sess.data_objects.create(path)
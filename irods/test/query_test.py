@@ -29,13 +29,22 @@ from irods.exception import (
 from irods import MAX_SQL_ROWS
 import irods.client_configuration as config
 from irods.column import Like, NotLike, Between, In
+from irods.columnar import to_arrow as query_to_arrow, to_numpy as query_to_numpy, to_pandas as query_to_pandas
 import irods.keywords as kw
 from irods.meta import iRODSMeta
 from irods.query import SpecificQuery
+from irods.query_cache import QueryCache
 from irods.rule import Rule
 import irods.test.helpers as helpers
 from irods.test.helpers import irods_shared_reg_resc_vault
 
+try:
+    import numpy
+    import pandas
+    import pyarrow
+except ImportError:
+    numpy = pandas = pyarrow = None
+
 IRODS_STATEMENT_TABLE_SIZE = 50
 
 
@@ -482,6 +491,55 @@ class TestQuery(unittest.TestCase):
         # assertions
         self.assertIn("demoResc", resources)
 
+    def test_result_set_column_access(self):
+        results = (
+            self.sess
+            .query(DataObject.name, DataObject.size, DataObject.modify_time)
+            .filter(Collection.name == self.coll_path)
+            .order_by(DataObject.name)
+            .all()
+        )
+        names = results.column(DataObject.name)
+        self.assertEqual(names, sorted([self.obj_name, self.case_sensitive_obj_name1, self.case_sensitive_obj_name2]))
+        self.assertEqual(results.column(1), [0, 0, 0])
+        self.assertTrue(all(isinstance(t, datetime) for t in results.column(DataObject.modify_time)))
+        self.assertEqual(results.columns, [DataObject.name, DataObject.size, DataObject.modify_time])
+
+        # Rows, as dicts or tuples, agree with the columns.
+        self.assertEqual([row[DataObject.name] for row in results], names)
+        self.assertEqual([t[0] for t in results.tuples()], names)
+        self.assertEqual(results[-1][DataObject.name], names[-1])
+        self.assertEqual([row[DataObject.name] for row in results[1:]], names[1:])
+        with self.assertRaises(KeyError):
+            results.column(Collection.name)
+
+    @unittest.skipIf(pyarrow is None, "numpy, pandas and pyarrow are not all installed")
+    def test_query_export_to_numpy_pandas_and_arrow(self):
+        query = (
+            self.sess
+            .query(DataObject.name, DataObject.size, DataObject.modify_time, Resource.name)
+            .filter(Collection.name == self.coll_path)
+            .order_by(DataObject.name)
+        )
+        names = [row[DataObject.name] for row in query]
+
+        arrays = query.to_numpy()
+        self.assertEqual(list(arrays[DataObject.name]), names)
+        self.assertEqual(arrays[DataObject.size].dtype, numpy.int64)
+        self.assertEqual(arrays[DataObject.modify_time].dtype, numpy.dtype("datetime64[s]"))
+
+        table = query.to_arrow(dictionary_encode=True)
+        self.assertEqual(table.column_names, ["DATA_NAME", "DATA_SIZE", "D_MODIFY_TIME", "R_RESC_NAME"])
+        self.assertEqual(table.column("DATA_NAME").to_pylist(), names)
+        self.assertEqual(table.schema.field("DATA_SIZE").type, pyarrow.int64())
+        self.assertEqual(table.schema.field("D_MODIFY_TIME").type, pyarrow.timestamp("s", tz="UTC"))
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field("R_RESC_NAME").type))
+
+        frame = query.to_pandas(dictionary_encode=True)
+        self.assertEqual(list(frame["DATA_NAME"]), names)
+        self.assertEqual(frame["DATA_SIZE"].sum(), 0)
+        self.assertEqual(str(frame["R_RESC_NAME"].dtype), "category")
+
     def test_query_first(self):
         # with no result
         results = self.sess.query(User.name).filter(User.name == "boo").first()
@@ -906,6 +964,81 @@ class TestQuery(unittest.TestCase):
                     if iters == batch_size - 1:
                         break  # leave iteration unfinished
 
+    def test_paging_with_prefetch(self):
+        with self.Issue_166_context(self.sess, num_objects=self.More_than_one_batch) as buildQuery:
+            expected = [row[DataObject.name] for row in buildQuery().get_results()]
+            for prefetch in (1, 3):
+                rows = buildQuery().get_results(prefetch=prefetch)
+                self.assertEqual([row[DataObject.name] for row in rows], expected)
+
+            # Abandoning prefetched iterations early must close each server-side statement, lest the statement
+            # table be exhausted.
+            for dummy_iter in self.Iterate_to_exhaust_statement_table:
+                for dummy_batch in buildQuery().get_batches(prefetch=2):
+                    break
+            self.assertEqual(len(list(buildQuery())), len(expected))
+
+    def test_parallel_iter(self):
+        with self.Issue_166_context(self.sess, num_objects=self.More_than_one_batch) as buildQuery:
+            expected = sorted(row[DataObject.name] for row in buildQuery())
+            for ordered in (False, True):
+                rows = list(buildQuery().parallel_iter(partitions=4, ordered=ordered))
+                self.assertEqual(sorted(row[DataObject.name] for row in rows), expected)
+
+            # The partitions, taken in order, cover ascending ranges of the key.
+            coll_path = "/{0.zone}/home/{0.username}/test_collection_issue_166".format(self.sess)
+            id_query = self.sess.query(DataObject.id).filter(Collection.name == coll_path).order_by(DataObject.id)
+            ids = [row[DataObject.id] for row in id_query.parallel_iter(partitions=3, ordered=True)]
+            self.assertEqual(len(ids), len(expected))
+            self.assertEqual(ids, sorted(ids))
+
+            # Abandoning the iteration early closes the server-side statements of all partitions.
+            for dummy_iter in self.Iterate_to_exhaust_statement_table:
+                for dummy_row in buildQuery().parallel_iter(partitions=3, prefetch=1):
+                    break
+            self.assertEqual(len(list(buildQuery())), len(expected))
+
+    def test_query_cache(self):
+        with self.Issue_166_context(self.sess, num_objects=3) as buildQuery:
+            self.sess.query_cache = cache = QueryCache(ttl=60, model_ttls={Resource: 0.5})
+            try:
+                names = sorted(row[DataObject.name] for row in buildQuery().all())
+                self.assertEqual(sorted(row[DataObject.name] for row in buildQuery().all()), names)
+                self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+                # A query may opt out of the cache.
+                buildQuery().cache_ttl(0).all()
+                self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+                # Changing the catalog through the session's managers invalidates affected results.
+                coll_path = "/{0.zone}/home/{0.username}/test_collection_issue_166".format(self.sess)
+                self.sess.data_objects.unlink("{}/{}".format(coll_path, names[0]), force=True)
+                self.assertEqual(sorted(row[DataObject.name] for row in buildQuery().all()), names[1:])
+                self.assertEqual(cache.misses, 2)
+
+                # Sizes written through an open data object are seen once it is closed.
+                size_query = self.sess.query(DataObject.size).filter(
+                    Collection.name == coll_path, DataObject.name == names[1]
+                )
+                with self.sess.data_objects.open("{}/{}".format(coll_path, names[1]), "w") as f:
+                    self.assertEqual(int(size_query.one()[DataObject.size]), 0)
+                    f.write(b"query_cache_test")
+                self.assertEqual(int(size_query.one()[DataObject.size]), len(b"query_cache_test"))
+
+                meta_query = self.sess.query(CollectionMeta.name).filter(Collection.name == coll_path)
+                self.assertEqual(len(meta_query.all()), 0)
+                self.sess.metadata.set(Collection, coll_path, iRODSMeta("query_cache_test", "1"))
+                self.assertEqual([row[CollectionMeta.name] for row in meta_query.all()], ["query_cache_test"])
+
+                # Results expire after the TTL of the models involved.
+                misses = cache.misses
+                self.sess.query(Resource.name).all()
+                time.sleep(0.6)
+                self.sess.query(Resource.name).all()
+                self.assertEqual(cache.misses, misses + 2)
+            finally:
+                self.sess.query_cache = None
+
     def test_rules_query__267(self):
         unique = "Testing prc #267: queryable rule objects"
         with NamedTemporaryFile(mode="w") as rfile:
@@ -1121,6 +1254,70 @@ class TestSpecificQuery(unittest.TestCase):
             next(res)
 
 
+class TestColumnarExport(unittest.TestCase):
+    """Export of batches of results to columnar arrays, without a server."""
+
+    class Batch:
+        def __init__(self, columns, values):
+            self.columns = columns
+            self.values = values
+
+        def column(self, index, raw=False):
+            return self.values[index]
+
+    def batches(self):
+        columns = [Resource.name, DataObject.size, DataObject.modify_time]
+        return [
+            self.Batch(columns, [["demoResc", None], ["5", None], ["1700000000", None]]),
+            self.Batch(columns, [["demoResc"], ["7"], ["1700000001"]]),
+        ]
+
+    @unittest.skipIf(pyarrow is None, "numpy, pandas and pyarrow are not all installed")
+    def test_missing_values_in_integer_and_datetime_columns(self):
+        arrays = query_to_numpy(self.batches())
+        self.assertEqual(list(numpy.ma.getmaskarray(arrays[DataObject.size])), [False, True, False])
+        self.assertEqual(arrays[DataObject.size].compressed().tolist(), [5, 7])
+        self.assertTrue(numpy.isnat(arrays[DataObject.modify_time][1]))
+
+        df = query_to_pandas(self.batches())
+        self.assertEqual(str(df["DATA_SIZE"].dtype), "Int64")
+        self.assertEqual(df["DATA_SIZE"].isna().tolist(), [False, True, False])
+        self.assertEqual(df["D_MODIFY_TIME"].isna().tolist(), [False, True, False])
+
+        table = query_to_arrow(self.batches())
+        self.assertEqual(table.column("DATA_SIZE").to_pylist(), [5, None, 7])
+        self.assertEqual(table.column("D_MODIFY_TIME").null_count, 1)
+        self.assertEqual(table.column("R_RESC_NAME").to_pylist(), ["demoResc", None, "demoResc"])
+
+
+class TestResultSet(unittest.TestCase):
+    """Rows of a batch of results, without a server."""
+
+    def result_set(self):
+        from types import SimpleNamespace
+        from irods.results import ResultSet
+
+        columns = [Resource.name, DataObject.size]
+        values = [["demoResc", "otherResc"], ["5", "7"]]
+        return ResultSet(
+            SimpleNamespace(
+                rowCnt=2,
+                attriCnt=2,
+                SqlResult_PI=[SimpleNamespace(attriInx=c.icat_id, value=v) for c, v in zip(columns, values)],
+                continueInx=0,
+            )
+        )
+
+    def test_rows_are_built_once(self):
+        results = self.result_set()
+        self.assertIs(results[0], results[0])
+        results[1]["note"] = "kept"
+        self.assertEqual([row.get("note") for row in results], [None, "kept"])
+        self.assertIs(results[-1], results.rows[1])
+        self.assertEqual([row[DataObject.size] for row in results.rows], [5, 7])
+        self.assertIs(results.rows, results.rows)
+
+
 if __name__ == "__main__":
     # let the tests find the parent irods lib
     sys.path.insert(0, os.path.abspath("../.."))
@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import irods.test.helpers as helpers
+from irods.sync import sync_down, sync_up
+
+
+class TestSync(unittest.TestCase):
+    def setUp(self):
+        self.sess = helpers.make_session()
+        self.coll_path = "/{0.zone}/home/{0.username}/test_sync_{1}".format(
+            self.sess, helpers.unique_name(helpers.my_function_name(), time.time())
+        )
+        self.local_dir = tempfile.mkdtemp()
+        self.other_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.local_dir, "sub"))
+        for name, content in (("a.txt", b"aaa"), (os.path.join("sub", "b.txt"), b"bbbbbb")):
+            with open(os.path.join(self.local_dir, name), "wb") as f:
+                f.write(content)
+
+    def tearDown(self):
+        if self.sess.collections.exists(self.coll_path):
+            self.sess.collections.remove(self.coll_path, recurse=True, force=True)
+        shutil.rmtree(self.local_dir)
+        shutil.rmtree(self.other_dir)
+        self.sess.cleanup()
+
+    def test_sync_up_transfers_only_changes(self):
+        plan = sync_up(self.sess, self.local_dir, self.coll_path, dry_run=True)
+        self.assertEqual(sorted(a.operation for a in plan), ["mkdir", "mkdir", "upload", "upload"])
+        self.assertFalse(self.sess.collections.exists(self.coll_path))
+
+        sync_up(self.sess, self.local_dir, self.coll_path)
+        self.assertEqual(self.sess.data_objects.get(self.coll_path + "/sub/b.txt").size, 6)
+        self.assertEqual(sync_up(self.sess, self.local_dir, self.coll_path, dry_run=True), [])
+
+        with open(os.path.join(self.local_dir, "a.txt"), "ab") as f:
+            f.write(b"more")
+        plan = sync_up(self.sess, self.local_dir, self.coll_path)
+        self.assertEqual([(a.destination, a.reason) for a in plan], [(self.coll_path + "/a.txt", "size differs")])
+        with self.sess.data_objects.open(self.coll_path + "/a.txt", "r") as f:
+            self.assertEqual(f.read(), b"aaamore")
+
+    def test_sync_down_transfers_only_changes(self):
+        sync_up(self.sess, self.local_dir, self.coll_path)
+        destination = os.path.join(self.other_dir, "mirror")
+
+        plan = sync_down(self.sess, self.coll_path, destination)
+        self.assertEqual(len(plan.transfers), 2)
+        with open(os.path.join(destination, "sub", "b.txt"), "rb") as f:
+            self.assertEqual(f.read(), b"bbbbbb")
+
+        for compare in ("size", "mtime", "checksum"):
+            self.assertEqual(sync_down(self.sess, self.coll_path, destination, dry_run=True, compare=compare), [])
+
+
+if __name__ == "__main__":
+    # let the tests find the parent irods lib
+    sys.path.insert(0, os.path.abspath("../.."))
+    unittest.main()
@@ -0,0 +1,86 @@
+#! /usr/bin/env python
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import irods.test.helpers as helpers
+from irods.manager.data_object_manager import MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE
+from irods.manager.transfer_manager import INTERACTIVE
+
+
+class TestTransferManager(unittest.TestCase):
+    def setUp(self):
+        self.sess = helpers.make_session()
+        self.coll_path = "/{0.zone}/home/{0.username}/test_transfers_{1}".format(
+            self.sess, helpers.unique_name(helpers.my_function_name(), time.time())
+        )
+        self.sess.collections.create(self.coll_path)
+        self.local_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.sess.transfers.shutdown()
+        self.sess.collections.remove(self.coll_path, recurse=True, force=True)
+        shutil.rmtree(self.local_dir)
+        self.sess.cleanup()
+
+    def test_scheduled_puts_and_gets_share_the_stream_budget(self):
+        self.sess.transfers.configure(max_streams=4)
+        sizes = [1024 * n for n in range(1, 9)] + [MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 1]
+        contents = {}
+        for i, size in enumerate(sizes):
+            name = "file_{}".format(i)
+            contents[name] = os.urandom(size)
+            with open(os.path.join(self.local_dir, name), "wb") as f:
+                f.write(contents[name])
+
+        handles = [
+            self.sess.transfers.put(os.path.join(self.local_dir, name), self.coll_path + "/" + name)
+            for name in contents
+        ]
+        for handle in handles:
+            self.assertTrue(handle.wait_until_transfer_done(timeout=120))
+            self.assertTrue(handle.result())
+            self.assertEqual(handle.progress[0], handle.progress[1])
+            self.assertLessEqual(handle.streams, 4)
+
+        download_dir = os.path.join(self.local_dir, "downloads")
+        os.mkdir(download_dir)
+        done = []
+        handles = [
+            self.sess.transfers.get(self.coll_path + "/" + name, download_dir, callback=done.append)
+            for name in contents
+        ]
+        handles.append(
+            self.sess.transfers.get(
+                self.coll_path + "/file_0", os.path.join(download_dir, "urgent"), priority=INTERACTIVE
+            )
+        )
+        self.assertTrue(self.sess.transfers.join(timeout=120))
+        self.assertEqual(self.sess.transfers.streams_in_use, 0)
+        self.assertEqual(sorted(done, key=id), sorted(handles[:-1], key=id))
+        for name, content in list(contents.items()) + [("urgent", contents["file_0"])]:
+            with open(os.path.join(download_dir, name), "rb") as f:
+                self.assertEqual(f.read(), content)
+
+    def test_raising_the_stream_budget_during_a_transfer(self):
+        self.sess.transfers.configure(max_streams=2)
+        local_path = os.path.join(self.local_dir, "large_file")
+        with open(local_path, "wb") as f:
+            f.write(os.urandom(4 * MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE))
+        handle = self.sess.transfers.put(local_path, self.coll_path + "/large_file", num_threads=2)
+        while handle.streams == 0 and not handle.done():
+            time.sleep(0.01)
+        # The running transfer keeps using the pool being replaced.
+        self.sess.transfers.configure(max_streams=8)
+        self.assertTrue(handle.result(timeout=120))
+        self.assertEqual(self.sess.data_objects.get(self.coll_path + "/large_file").size, os.path.getsize(local_path))
+
+
+if __name__ == "__main__":
+    # let the tests find the parent irods lib
+    sys.path.insert(0, os.path.abspath("../.."))
+    unittest.main()
@@ -0,0 +1,67 @@
+#! /usr/bin/env python
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import irods.exception as ex
+import irods.keywords as kw
+import irods.test.helpers as helpers
+import irods.transfer
+from irods.manager.data_object_manager import MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE
+
+
+class TestCopyBetweenSessions(unittest.TestCase):
+    def setUp(self):
+        self.src_sess = helpers.make_session()
+        self.dst_sess = helpers.make_session()
+        self.coll_path = "/{0.zone}/home/{0.username}/test_copy_{1}".format(
+            self.src_sess, helpers.unique_name(helpers.my_function_name(), time.time())
+        )
+        self.src_sess.collections.create(self.coll_path)
+
+    def tearDown(self):
+        self.src_sess.collections.remove(self.coll_path, recurse=True, force=True)
+        self.src_sess.cleanup()
+        self.dst_sess.cleanup()
+
+    def _copy_and_compare(self, size, **options):
+        content = os.urandom(size)
+        src_path = self.coll_path + "/source"
+        dst_path = self.coll_path + "/destination"
+        with self.src_sess.data_objects.open(src_path, "w") as f:
+            f.write(content)
+        self.src_sess.data_objects.chksum(src_path)
+
+        progress = []
+        copied = irods.transfer.copy(
+            self.src_sess, src_path, self.dst_sess, dst_path, updatables=progress.append, **options
+        )
+        self.assertEqual(copied.path, dst_path)
+        self.assertEqual(copied.size, size)
+        self.assertEqual(sum(progress), size)
+        self.assertEqual(copied.checksum, self.src_sess.data_objects.get(src_path).checksum)
+        with self.dst_sess.data_objects.open(dst_path, "r") as f:
+            self.assertEqual(f.read(), content)
+
+        with self.assertRaises(ex.OVERWRITE_WITHOUT_FORCE_FLAG):
+            irods.transfer.copy(self.src_sess, src_path, self.dst_sess, dst_path)
+        irods.transfer.copy(self.src_sess, src_path, self.dst_sess, dst_path, **{kw.FORCE_FLAG_KW: ""})
+
+    def test_copy_small_data_object(self):
+        self._copy_and_compare(1024 * 1024 + 7)
+
+    def test_copy_large_data_object_in_parallel_with_checkpoint(self):
+        checkpoint_file = os.path.join(tempfile.gettempdir(), "copy_checkpoint_{}".format(os.getpid()))
+        self._copy_and_compare(
+            MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 3 * 1024**2 + 5, num_threads=3, checkpoint_file=checkpoint_file
+        )
+        self.assertFalse(os.path.exists(checkpoint_file))
+
+
+if __name__ == "__main__":
+    # let the tests find the parent irods lib
+    sys.path.insert(0, os.path.abspath("../.."))
+    unittest.main()
@@ -0,0 +1,343 @@
+"""
+Copying data objects between sessions, e.g. between federated zones or independent servers.
+
+The bytes of the source data object are piped through the client straight into the destination,
+over several connections to each server at once, with no staging on local disk:
+
+    >>> import irods.transfer
+    >>> irods.transfer.copy(
+    ...     src_session,
+    ...     "/zoneA/home/alice/big.dat",
+    ...     dst_session,
+    ...     "/zoneB/home/alice/big.dat",
+    ...     checkpoint_file="/tmp/big.dat.copy",
+    ... )
+
+Memory use is bounded by one chunk buffer per stream, plus the data held back while hashing (see
+irods.checksum.MAXIMUM_PENDING_BYTES).  If a checkpoint file is named, an interrupted copy may be
+resumed by repeating the call with the same arguments.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import irods.exception as ex
+import irods.keywords as kw
+from irods.checksum import (
+    DEFAULT_ALGORITHM,
+    ChecksumCalculator,
+    algorithm_of,
+    resolve_algorithms,
+    verify_against_replicas,
+)
+from irods.data_object import irods_basename
+from irods.manager.data_object_manager import (
+    DEFAULT_NUMBER_OF_THREADS,
+    MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE,
+    do_progress_updates,
+)
+from irods.parallel import COPY_BUF_SIZE, MINIMUM_SERVER_VERSION, RECOMMENDED_NUM_THREADS_PER_TRANSFER
+
+logger = logging.getLogger(__name__)
+
+COPY_CHUNK_SIZE = COPY_BUF_SIZE
+
+# Minimum interval, in seconds, between updates of the checkpoint file.
+CHECKPOINT_INTERVAL = 1.0
+
+
+class CopyAborted(RuntimeError):
+    pass
+
+
+def _close_all(handles, path):
+    """Close handles after a failed copy, logging rather than raising errors."""
+    for handle in handles:
+        try:
+            handle.close()
+        except Exception as e:
+            logger.warning("Error closing handle during copy of %r: %r", path, e)
+
+
+def _source_identity(data_object):
+    """Attributes of the source that must be unchanged for an interrupted copy to be resumed."""
+    return {
+        "path": data_object.path,
+        "size": data_object.size,
+        "modify_time": str(data_object.modify_time),
+        "checksum": data_object.checksum or "",
+    }
+
+
+class _Checkpoint:
+    """The progress of a copy, persisted as JSON so that the copy may be resumed after an interruption.
+
+    `completed' is the number of bytes, counted from the start of the data object, known to have been
+    written to the destination.
+    """
+
+    def __init__(self, filename, source, destination, chunk_size):
+        self.filename = filename
+        self.state = {"source": source, "destination": destination, "chunk_size": chunk_size, "completed": 0}
+        self._saved = 0.0
+
+    def load(self):
+        """Return the number of bytes already copied, if the checkpoint file records this same copy, or else 0."""
+        if not (self.filename and os.path.exists(self.filename)):
+            return 0
+        try:
+            with open(self.filename) as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable checkpoint file %r: %r", self.filename, e)
+            return 0
+        if any(saved.get(k) != self.state[k] for k in ("source", "destination", "chunk_size")):
+            logger.info("Checkpoint file %r is for a different copy; starting from the beginning.", self.filename)
+            return 0
+        self.state["completed"] = int(saved.get("completed", 0))
+        return self.state["completed"]
+
+    def update(self, completed, force=False):
+        self.state["completed"] = completed
+        now = time.monotonic()
+        if self.filename and (force or now - self._saved >= CHECKPOINT_INTERVAL):
+            self._saved = now
+            directory = os.path.dirname(os.path.abspath(self.filename))
+            fd, temp_name = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.state, f)
+            os.replace(temp_name, self.filename)
+
+    def remove(self):
+        if self.filename and os.path.exists(self.filename):
+            os.unlink(self.filename)
+
+
+class _ChunkScheduler:
+    """Hands out the chunks of the copy to the transfer threads in ascending order, and keeps track of
+    how much of the data object, from the start, has been completely written."""
+
+    def __init__(self, start, size, chunk_size, checksum_calculator, checkpoint):
+        self.size = size
+        self.chunk_size = chunk_size
+        self.checksum_calculator = checksum_calculator
+        self.checkpoint = checkpoint
+        self.condition = threading.Condition()
+        self.next_offset = start
+        self.completed = start
+        self.finished = set()
+        self.error = None
+
+    def take(self):
+        """Return the (offset, length) of the next chunk, or None if there is no more work."""
+        with self.condition:
+            if self.error or self.next_offset >= self.size:
+                return None
+            offset = self.next_offset
+            length = min(self.chunk_size, self.size - offset)
+            self.next_offset += length
+            calculator = self.checksum_calculator
+            if calculator:
+                # Do not run so far ahead of the hashing position that this chunk could not be held in memory.
+                while not self.error and offset + length - calculator.position > calculator.max_pending:
+                    self.condition.wait(0.1)
+            return None if self.error else (offset, length)
+
+    def hashed(self):
+        with self.condition:
+            self.condition.notify_all()
+
+    def done(self, offset, length):
+        with self.condition:
+            self.finished.add(offset)
+            while self.completed in self.finished:
+                self.finished.remove(self.completed)
+                self.completed = min(self.size, self.completed + self.chunk_size)
+            self.checkpoint.update(self.completed)
+
+    def fail(self, error):
+        with self.condition:
+            if self.error is None:
+                self.error = error
+            self.condition.notify_all()
+
+
+def _copy_chunks(source, destination, scheduler, updatables):
+    """Copy chunks, as handed out by the scheduler, from one raw data object handle to the other."""
+    buffer = memoryview(bytearray(scheduler.chunk_size))
+    (source_position, destination_position) = (None, None)
+    try:
+        while True:
+            chunk = scheduler.take()
+            if chunk is None:
+                return
+            (offset, length) = chunk
+            if source_position != offset:
+                source.seek(offset)
+            view = buffer[:length]
+            count = 0
+            while count < length:
+                n = source.readinto(view[count:])
+                if not n:
+                    raise CopyAborted(
+                        "Source data object ended at offset {}, short of its recorded size.".format(offset + count)
+                    )
+                count += n
+            source_position = offset + length
+            if scheduler.checksum_calculator:
+                scheduler.checksum_calculator.update(view, offset)
+                scheduler.hashed()
+            if destination_position != offset:
+                destination.seek(offset)
+            destination.write(view)
+            destination_position = offset + length
+            scheduler.done(offset, length)
+            do_progress_updates(updatables, length)
+    except BaseException as e:
+        # Stop the other threads; the error is raised again in the thread running copy().
+        scheduler.fail(e)
+
+
+def copy(
+    src_session,
+    src_path,
+    dst_session,
+    dst_path,
+    num_threads=DEFAULT_NUMBER_OF_THREADS,
+    checksum=True,
+    checkpoint_file=None,
+    chunk_size=COPY_CHUNK_SIZE,
+    updatables=(),
+    **options,
+):
+    """Copy a data object from one session (e.g. in one zone) to a data object in another.
+
+    Args:
+        src_session, src_path: the session through which to read, and the logical path of, the source.
+        dst_session, dst_path: the session through which to write, and the logical path of, the destination.
+            If dst_path names a collection, the data object is copied into it under its own name.
+        num_threads: the number of streams (each with a connection to both servers) over which to copy.  If
+            zero, a reasonable number is chosen; the copy is done over one stream if the data object is small.
+        checksum: if True (or the name of an algorithm), the bytes are hashed in flight.  The result is compared
+            with the checksum of the source in its catalog, if it has one, and registered with the destination.
+            A resumed copy is verified instead by having the destination server checksum the new replica.
+        checkpoint_file: a local file in which to record the progress of the copy.  If the copy is interrupted,
+            repeating it (with the same arguments) resumes it from the point recorded.  The file is removed once
+            the copy is complete.
+        chunk_size: the number of bytes read and written at a time by each stream.
+        updatables: progress bar objects, or callables, to be updated with the number of bytes copied (as for
+            session.data_objects.put).
+        **options: iRODS keywords for the creation of the destination, e.g. DEST_RESC_NAME_KW, or
+            FORCE_FLAG_KW to allow an existing data object to be overwritten.
+
+    Returns:
+        an iRODSDataObject representing the destination.
+
+    Raises:
+        OVERWRITE_WITHOUT_FORCE_FLAG: if the destination exists (and the copy is not being resumed) and
+            FORCE_FLAG_KW was not given.
+        USER_CHKSUM_MISMATCH: if a checksum was requested and does not match that of the source.
+    """
+    source = src_session.data_objects.get(src_path)
+    size = source.size
+    if dst_session.collections.exists(dst_path):
+        dst_path = dst_path.rstrip("/") + "/" + irods_basename(source.path)
+
+    checkpoint = _Checkpoint(checkpoint_file, _source_identity(source), dst_path, chunk_size)
+    start = checkpoint.load() if dst_session.data_objects.exists(dst_path) else 0
+    if start == 0 and kw.FORCE_FLAG_KW not in options and dst_session.data_objects.exists(dst_path):
+        raise ex.OVERWRITE_WITHOUT_FORCE_FLAG
+    options.pop(kw.FORCE_FLAG_KW, None)
+
+    checksum_calculator = None
+    if checksum and start == 0:
+        algorithms = resolve_algorithms(
+            checksum if checksum is not True else (algorithm_of(source.checksum) or DEFAULT_ALGORITHM)
+        )
+        checksum_calculator = ChecksumCalculator(algorithms)
+
+    if num_threads < 1:
+        num_threads = RECOMMENDED_NUM_THREADS_PER_TRANSFER
+    if (
+        size - start <= MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE
+        or dst_session.server_version < MINIMUM_SERVER_VERSION
+        or src_session.server_version < MINIMUM_SERVER_VERSION
+    ):
+        num_threads = 1
+    num_threads = max(1, min(num_threads, -(-(size - start) // chunk_size)))
+
+    # Open the destination; a resumed copy must not truncate what has been written so far.
+    open_options = dict(options)
+    if num_threads > 1:
+        open_options.update({kw.NUM_THREADS_KW: str(num_threads), kw.DATA_SIZE_KW: str(size)})
+    returned_values = {}
+    destinations = [
+        dst_session.data_objects.open(
+            dst_path, "r+" if start else "w", finalize_on_close=True, returned_values=returned_values, **open_options
+        )
+    ]
+    sources = []
+    threads = []
+    scheduler = _ChunkScheduler(start, size, chunk_size, checksum_calculator, checkpoint)
+    try:
+        if num_threads > 1:
+            # Further connections write to the same replica, identified by its token and resource hierarchy.
+            (replica_token, resc_hier) = destinations[0].raw.replica_access_info()
+            directed_session = returned_values.get("session", dst_session)
+            for _ in range(num_threads - 1):
+                destinations.append(
+                    directed_session.data_objects.open(
+                        dst_path,
+                        "a",
+                        create=False,
+                        finalize_on_close=False,
+                        allow_redirect=False,
+                        **{
+                            kw.NUM_THREADS_KW: str(num_threads),
+                            kw.DATA_SIZE_KW: str(size),
+                            kw.RESC_HIER_STR_KW: resc_hier,
+                            kw.REPLICA_TOKEN_KW: replica_token,
+                        },
+                    )
+                )
+        sources = [src_session.data_objects.open(source.path, "r") for _ in range(num_threads)]
+
+        threads = [
+            threading.Thread(target=_copy_chunks, args=(s.raw, d.raw, scheduler, updatables), daemon=True)
+            for s, d in zip(sources, destinations)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if scheduler.error:
+            raise scheduler.error
+
+        if checksum_calculator:
+            verify_against_replicas(checksum_calculator.finish(size), source.replicas, source.path)
+            raw_options = destinations[0].raw.options
+            raw_options.update(checksum_calculator.close_options(raw_options))
+
+        # The initial destination handle is closed last, finalizing the replica.
+        for handle in sources + destinations[1:] + destinations[:1]:
+            handle.close()
+    except BaseException:
+        scheduler.fail(CopyAborted("Copy of {!r} was interrupted.".format(source.path)))
+        for thread in threads:
+            thread.join()
+        checkpoint.update(scheduler.completed, force=True)
+        # Finalize the replica even though the copy failed, so that it is not left locked.
+        _close_all([h for h in sources + destinations[1:] + destinations[:1] if not h.closed], source.path)
+        raise
+
+    if checksum and start:
+        # Resumed: part of the data was never hashed by this process, so have the server checksum the replica.
+        dst_checksum = dst_session.data_objects.chksum(dst_path)
+        verify_against_replicas({algorithm_of(dst_checksum): dst_checksum}, source.replicas, source.path)
+
+    checkpoint.remove()
+    return dst_session.data_objects.get(dst_path)
@@ -0,0 +1,294 @@
+"""
+Telemetry for parallel data transfers.
+
+A TransferReport is filled in as a parallel PUT or GET proceeds, with one StreamStats per transfer
+thread.  Besides the number of bytes moved, each stream records where its time went:
+
+    local    reading from (PUT) or writing to (GET) the local file
+    send     sending requests, including the data payload of a PUT, to the server
+    reply    awaiting and receiving the server's replies, including the data payload of a GET
+    hash     computing checksums in flight, if requested
+
+as well as the latency of each chunk copied and the overhead of opening and closing its replica.
+A report may be passed to session.data_objects.get or put (or to parallel_get and parallel_put):
+
+    >>> from irods.transfer_report import TransferReport
+    >>> report = TransferReport()
+    >>> session.data_objects.put(local_path, logical_path, report=report)
+    >>> print(report)
+
+and the report for a NONBLOCKING transfer may be consulted while it is in progress, as the
+`report' attribute of the AsyncNotify object returned.
+"""
+
+import math
+import threading
+import time
+
+# A chunk whose network round trip takes longer than this many seconds is counted as a stall.
+DEFAULT_STALL_SECONDS = 1.0
+
+DEFAULT_PERCENTILES = (50, 90, 99, 100)
+
+
+def _percentiles(values, percentiles):
+    """Return a dict mapping each requested percentile onto its (nearest-rank) value."""
+    ordered = sorted(values)
+    if not ordered:
+        return {p: None for p in percentiles}
+    return {p: ordered[max(0, math.ceil(p / 100.0 * len(ordered)) - 1)] for p in percentiles}
+
+
+def _timeline(chunks, interval):
+    """Bin (end_time, byte_count) pairs into a list of (interval_start, bytes_per_second) pairs."""
+    bins = {}
+    for end_time, byte_count in chunks:
+        index = int(end_time // interval)
+        bins[index] = bins.get(index, 0) + byte_count
+    if not bins:
+        return []
+    return [(index * interval, bins.get(index, 0) / interval) for index in range(max(bins) + 1)]
+
+
+class ChunkStats:
+    """The timing of one chunk copied by a transfer stream.  Times are in seconds; `end' is
+    measured from the start of the transfer."""
+
+    __slots__ = ("offset", "size", "end", "local", "network", "hash")
+
+    def __init__(self, offset, size, end, local, network, hash_):
+        self.offset = offset
+        self.size = size
+        self.end = end
+        self.local = local
+        self.network = network
+        self.hash = hash_
+
+    def __repr__(self):
+        return "<{}.{} offset={} size={} network={:.6f}s local={:.6f}s>".format(
+            self.__class__.__module__, self.__class__.__name__, self.offset, self.size, self.network, self.local
+        )
+
+
+class StreamStats:
+    """Metrics for one thread (and connection) of a parallel transfer.
+
+    The counters are updated only by the thread doing the transfer, and may be read at any time.
+    """
+
+    def __init__(self, report, index, offset, length):
+        self.report = report
+        self.index = index
+        self.offset = offset
+        self.length = length
+        self.bytes = 0
+        self.chunks = []
+        self.local_seconds = 0.0
+        self.send_seconds = 0.0
+        self.reply_seconds = 0.0
+        self.hash_seconds = 0.0
+        self.open_seconds = 0.0
+        self.close_seconds = 0.0
+        self.barrier_seconds = 0.0
+        self.started = None
+        self.finished = None
+
+    # Called by irods.connection.Connection for each message sent and reply received, while the
+    # stream is attached to the connection (i.e. as the connection's `transfer_stats').
+
+    def add_send(self, seconds):
+        self.send_seconds += seconds
+
+    def add_reply(self, seconds):
+        self.reply_seconds += seconds
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    def add_chunk(self, offset, size, local, network, hash_=0.0):
+        self.chunks.append(ChunkStats(offset, size, time.perf_counter() - self.report.started, local, network, hash_))
+        self.bytes += size
+        self.local_seconds += local
+        self.hash_seconds += hash_
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self):
+        """Average bytes per second over the life of the stream."""
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+    def throughput_timeline(self, interval=1.0):
+        """Bytes per second transferred by this stream in each interval since the start of the transfer."""
+        return _timeline([(c.end, c.size) for c in self.chunks], interval)
+
+    def latency_percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        return _percentiles([c.network for c in self.chunks], percentiles)
+
+    def stalls(self, threshold=DEFAULT_STALL_SECONDS):
+        return [c for c in self.chunks if c.network > threshold]
+
+
+class TransferReport:
+    """Aggregate metrics for a parallel transfer, and the StreamStats of each of its threads.
+
+    The attributes `open_seconds', `replica_info_seconds' and `finalize_seconds' record the time spent in
+    opening the data object (when done by the transfer itself), in retrieving the replica token and
+    hierarchy, and in the finalizing close of the data object, respectively.
+    """
+
+    def __init__(self):
+        self.operation = None
+        self.path = None
+        self.total_bytes = None
+        self.streams = []
+        self.open_seconds = 0.0
+        self.replica_info_seconds = 0.0
+        self.finalize_seconds = 0.0
+        self.started = None
+        self.finished = None
+        self.succeeded = None
+        self._lock = threading.Lock()
+
+    def start(self, operation, path, total_bytes):
+        self.operation = operation
+        self.path = path
+        self.total_bytes = total_bytes
+        if self.started is None:
+            self.started = time.perf_counter()
+
+    def new_stream(self, offset, length):
+        with self._lock:
+            stream = StreamStats(self, len(self.streams), offset, length)
+            self.streams.append(stream)
+        return stream
+
+    def finish(self, succeeded):
+        if self.finished is None:
+            self.finished = time.perf_counter()
+            self.succeeded = succeeded
+
+    @property
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def bytes_transferred(self):
+        return sum(s.bytes for s in self.streams)
+
+    @property
+    def throughput(self):
+        """Average bytes per second, across all streams, over the whole transfer."""
+        elapsed = self.elapsed
+        return self.bytes_transferred / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def chunks(self):
+        return [c for s in list(self.streams) for c in list(s.chunks)]
+
+    def throughput_timeline(self, interval=1.0):
+        """Aggregate bytes per second in each interval since the start of the transfer."""
+        return _timeline([(c.end, c.size) for c in self.chunks], interval)
+
+    def latency_percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        """Percentiles of the per-chunk network latency (send and reply), in seconds."""
+        return _percentiles([c.network for c in self.chunks], percentiles)
+
+    def stalls(self, threshold=DEFAULT_STALL_SECONDS):
+        """The chunks, from all streams, whose network round trip exceeded the threshold (in seconds)."""
+        return [c for c in self.chunks if c.network > threshold]
+
+    def time_breakdown(self):
+        """Seconds spent in each activity, summed over all streams, plus the transfer-wide overheads."""
+        streams = list(self.streams)
+        total = lambda name: sum(getattr(s, name) for s in streams)
+        return {
+            "local": total("local_seconds"),
+            "send": total("send_seconds"),
+            "reply": total("reply_seconds"),
+            "hash": total("hash_seconds"),
+            "open": self.open_seconds + total("open_seconds"),
+            "replica_info": self.replica_info_seconds,
+            "close": total("close_seconds"),
+            "barrier": total("barrier_seconds"),
+            "finalize": self.finalize_seconds,
+        }
+
+    def as_dict(self):
+        """A summary of the report in terms of plain Python types, e.g. for serializing to JSON."""
+        return {
+            "operation": self.operation,
+            "path": self.path,
+            "total_bytes": self.total_bytes,
+            "bytes_transferred": self.bytes_transferred,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "succeeded": self.succeeded,
+            "seconds": self.time_breakdown(),
+            "latency_percentiles": self.latency_percentiles(),
+            "streams": [
+                {
+                    "index": s.index,
+                    "offset": s.offset,
+                    "length": s.length,
+                    "bytes": s.bytes,
+                    "elapsed": s.elapsed,
+                    "throughput": s.throughput,
+                    "local_seconds": s.local_seconds,
+                    "send_seconds": s.send_seconds,
+                    "reply_seconds": s.reply_seconds,
+                    "hash_seconds": s.hash_seconds,
+                    "open_seconds": s.open_seconds,
+                    "close_seconds": s.close_seconds,
+                    "barrier_seconds": s.barrier_seconds,
+                    "stalls": len(s.stalls()),
+                }
+                for s in list(self.streams)
+            ],
+        }
+
+    def __str__(self):
+        lines = [
+            "{} {}: {} of {} bytes in {:.3f}s ({:.1f} MB/s){}".format(
+                (self.operation or "transfer").upper(),
+                self.path,
+                self.bytes_transferred,
+                self.total_bytes,
+                self.elapsed,
+                self.throughput / 1e6,
+                "" if self.done else " - in progress",
+            ),
+            "  seconds: " + ", ".join("{}={:.3f}".format(k, v) for k, v in self.time_breakdown().items()),
+            "  chunk latency: "
+            + ", ".join(
+                "p{}={}".format(p, "-" if v is None else "{:.4f}s".format(v))
+                for p, v in self.latency_percentiles().items()
+            ),
+        ]
+        for s in list(self.streams):
+            lines.append(
+                "  stream {}: {} bytes, {:.1f} MB/s, local={:.3f}s send={:.3f}s reply={:.3f}s, {} stalls".format(
+                    s.index,
+                    s.bytes,
+                    s.throughput / 1e6,
+                    s.local_seconds,
+                    s.send_seconds,
+                    s.reply_seconds,
+                    len(s.stalls()),
+                )
+            )
+        return "\n".join(lines)